@@ -3,6 +3,7 @@ import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import linprog
+from parser_aman import parse_dan_turunkan
 
 # Judul aplikasi
 st.title("📈 Aplikasi Analisis Laba Industri - PT Makmur Jaya")
@@ -95,9 +96,7 @@ elif tab == "Turunan Parsial":
     fungsi_str = st.text_input("Masukkan fungsi f(x, y):", "10*x + 8*y - 0.1*x**2 - 0.05*y**2")
 
     try:
-        f = sp.sympify(fungsi_str)
-        fx = sp.diff(f, x)
-        fy = sp.diff(f, y)
+        f, (fx, fy) = parse_dan_turunkan(fungsi_str, ("x", "y"))
 
         st.latex(f"f(x, y) = {sp.latex(f)}")
         st.latex(f"\\frac{{\\partial f}}{{\\partial x}} = {sp.latex(fx)}")
@@ -133,6 +132,7 @@ elif tab == "Turunan Parsial":
         ax.set_ylabel('y')
         ax.set_zlabel('z')
         st.pyplot(fig)
+        plt.close(fig)
 
     except Exception as e:
         st.error(f"Terjadi kesalahan: {e}")
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 from scipy.optimize import linprog
+import diagnosis_lp
 
 st.title("📈 Optimasi Produksi Bendera dan Brosur")
 
@@ -66,3 +67,4 @@ if res.success:
 
 else:
     st.error("Optimasi gagal. Silakan periksa input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, [x_bounds, y_bounds], ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["Bendera (x)", "Brosur (y)"])
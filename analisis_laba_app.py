@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
+import sympy as sp
 import matplotlib.pyplot as plt
+import peta_kontur
+import titik_kritis
 
 # Judul aplikasi
 st.title("Analisis Laba Menggunakan Turunan Parsial")
@@ -30,6 +33,20 @@ st.write(f"**Laba f({x}, {y}) = {hasil_laba:.2f}**")
 st.write(f"Turunan parsial terhadap x (∂f/∂x) = {df_dx:.2f}")
 st.write(f"Turunan parsial terhadap y (∂f/∂y) = {df_dy:.2f}")
 
+# Titik kritis (gradien = 0) dicari numerik dengan Newton multi-start
+@st.cache_resource
+def kompilasi_laba():
+    sx, sy = sp.symbols("x y")
+    return titik_kritis.dari_sympy(laba(sx, sy), sx, sy)
+
+st.subheader("🎯 Titik Kritis Fungsi Laba")
+titik = titik_kritis.cari_titik_kritis(*kompilasi_laba(), batas=((0, 50), (0, 50)))
+if titik:
+    st.dataframe([{"x": t["x"], "y": t["y"], "f(x, y)": t["f"], "Jenis": titik_kritis.JENIS[t["jenis"]]} for t in titik])
+else:
+    st.info("Tidak ditemukan titik kritis di sekitar domain.")
+di_domain = [t for t in titik if 0 <= t["x"] <= 50 and 0 <= t["y"] <= 50]
+
 # Visualisasi grafik 3D
 st.subheader("Visualisasi Permukaan Laba")
 fig = plt.figure(figsize=(8, 5))
@@ -47,5 +64,28 @@ ax.set_xlabel("Harga per Unit (x)")
 ax.set_ylabel("Jumlah Terjual (y)")
 ax.set_zlabel("Laba f(x, y)")
 ax.view_init(elev=30, azim=135)
+for t in di_domain:
+    ax.scatter(t["x"], t["y"], t["f"], color="red", s=40)
 
 st.pyplot(fig)
+plt.close(fig)
+
+# Heatmap resolusi tinggi dengan penanda titik kritis dan arah gradien
+st.subheader("Kontur Laba dan Titik Kritis")
+resolusi = st.select_slider("Resolusi grid kontur", options=[250, 500, 1000, 2000, 4000], value=1000)
+batas = ((0, 50), (0, 50))
+xs, ys, Z_tinggi = peta_kontur.evaluasi_grid(laba, batas, resolusi, st.session_state)
+fig2, ax2 = plt.subplots(figsize=(6, 5))
+kontur = peta_kontur.gambar_heatmap(ax2, xs, ys, Z_tinggi)
+fig2.colorbar(kontur, ax=ax2, label="Laba f(x, y)")
+peta_kontur.panah_gradien(ax2, x, y, df_dx, df_dy, batas)
+for t in di_domain:
+    ax2.plot(t["x"], t["y"], "r*", markersize=12)
+    ax2.annotate(titik_kritis.JENIS[t["jenis"]], (t["x"], t["y"]), textcoords="offset points", xytext=(5, 5), color="red")
+ax2.set_xlabel("Harga per Unit (x)")
+ax2.set_ylabel("Jumlah Terjual (y)")
+st.pyplot(fig2)
+plt.close(fig2)
+
+if st.checkbox("Siapkan file ekspor resolusi penuh"):
+    st.download_button("⬇️ Unduh grid laba (.npy)", peta_kontur.ekspor_npy(Z_tinggi), file_name="grid_laba.npy")
@@ -3,6 +3,7 @@ import streamlit as st
 import numpy as np
 from scipy.optimize import linprog
 import matplotlib.pyplot as plt
+import diagnosis_lp
 
 # Judul aplikasi
 st.title("Aplikasi Optimasi Produksi Banner dan Brosur")
@@ -56,6 +57,7 @@ if res.success:
     ax.bar(["Banner", "Brosur"], [x_opt, y_opt], color=['blue', 'green'])
     ax.set_ylabel("Jumlah Produksi (unit)")
     st.pyplot(fig)
+    plt.close(fig)
 
     # Visualisasi Pemanfaatan Sumber Daya
     st.subheader("📈 Pemanfaatan Sumber Daya")
@@ -69,6 +71,8 @@ if res.success:
     ax2.barh(sumber_daya, [mesin, bahan, tenaga], color='grey', alpha=0.3, label="Kapasitas")
     ax2.legend()
     st.pyplot(fig2)
+    plt.close(fig2)
 
 else:
     st.error("Optimasi gagal dilakukan. Silakan cek kembali input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, [x_bounds, y_bounds], ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["Banner (x)", "Brosur (y)"])
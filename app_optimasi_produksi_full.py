@@ -1,8 +1,16 @@
 
+import hashlib
+import io
 import streamlit as st
 import numpy as np
-from scipy.optimize import linprog
 import matplotlib.pyplot as plt
+import berkas_model
+import diagnosis_lp
+import distribusi
+import grafik
+import model_inti
+import pekerjaan
+import penyimpanan_skenario
 
 # Judul aplikasi
 st.title("📦 Optimasi Produksi Banner dan Brosur")
@@ -37,7 +45,7 @@ tenaga = st.sidebar.number_input("Total Kapasitas Tenaga Kerja (jam)", value=200
 
 # === Model Matematika ===
 # Fungsi Objektif: Maksimalkan Z = profit_banner * x + profit_brosur * y
-c = [-profit_banner, -profit_brosur]  # pakai negatif karena linprog adalah minimisasi
+# (model_inti.lp_produksi menegasikan profit karena linprog adalah minimisasi)
 
 # Kendala:
 # A_ub * [x, y] <= b_ub
@@ -49,19 +57,21 @@ A = [
 
 b = [mesin, bahan, tenaga]
 
-# Batasan x dan y ≥ 0
-bounds = [(0, None), (0, None)]
+# Batasan x dan y ≥ 0 ada di model_inti.lp_produksi
 
 # === Solusi Optimasi ===
-res = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method='highs')
+# Skenario yang pernah dihitung (di sesi atau proses mana pun) dijawab dari penyimpanan skenario
+masukan = {"profit": [profit_banner, profit_brosur], "A": A, "b": b}
+hasil, dari_simpanan = penyimpanan_skenario.bawaan().atau_hitung(
+    "lp_produksi", masukan, lambda: model_inti.lp_produksi(**masukan))
 
 st.header("📈 Hasil Optimasi Produksi")
 
-if res.success:
-    x_opt, y_opt = res.x
-    keuntungan = -res.fun
+if hasil["sukses"]:
+    x_opt, y_opt = hasil["x"]
+    keuntungan = hasil["keuntungan"]
 
-    st.success("Optimasi berhasil ditemukan!")
+    st.success("Optimasi berhasil ditemukan!" + (" (dari riwayat skenario)" if dari_simpanan else ""))
     st.write(f"📌 Produksi optimal Banner (x): **{x_opt:.2f} unit**")
     st.write(f"📌 Produksi optimal Brosur (y): **{y_opt:.2f} unit**")
     st.write(f"💰 Total Keuntungan Maksimum: **Rp {keuntungan:,.0f}**")
@@ -69,9 +79,9 @@ if res.success:
     # === Visualisasi: Produksi ===
     st.subheader("📊 Visualisasi Jumlah Produksi Optimal")
     fig1, ax1 = plt.subplots()
-    ax1.bar(["Banner", "Brosur"], [x_opt, y_opt], color=["skyblue", "lightgreen"])
-    ax1.set_ylabel("Jumlah Produksi (unit)")
+    grafik.gambar_produksi(ax1, ["Banner", "Brosur"], [x_opt, y_opt])
     st.pyplot(fig1)
+    plt.close(fig1)
 
     # === Visualisasi: Penggunaan Sumber Daya ===
     st.subheader("⚙️ Pemanfaatan Sumber Daya")
@@ -84,10 +94,177 @@ if res.success:
     label = ["Waktu Mesin", "Bahan Baku", "Tenaga Kerja"]
 
     fig2, ax2 = plt.subplots()
-    ax2.barh(label, total, color="gray", alpha=0.3, label="Kapasitas")
-    ax2.barh(label, digunakan, color="orange", label="Terpakai")
-    ax2.legend()
+    grafik.gambar_utilisasi(ax2, label, digunakan, total)
     st.pyplot(fig2)
+    plt.close(fig2)
 
 else:
     st.error("Gagal menyelesaikan optimasi. Silakan cek kembali input parameter.")
+    diagnosis_lp.tampilkan([-profit_banner, -profit_brosur], A, b, (0, None), ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["Banner (x)", "Brosur (y)"])
+
+# === Sensitivitas: sapuan kapasitas satu sumber daya ===
+st.header("📉 Sensitivitas Keuntungan terhadap Kapasitas")
+nama_sumber = ["Waktu Mesin", "Bahan Baku", "Tenaga Kerja"]
+col1, col2, col3 = st.columns(3)
+indeks_sumber = col1.selectbox("Sumber daya", range(len(nama_sumber)), format_func=lambda i: nama_sumber[i])
+persen = col2.slider("Rentang kapasitas (% dari saat ini)", 10, 300, (50, 200))
+jumlah_titik = col3.select_slider("Jumlah titik", options=[50, 200, 1000, 5000, 20000], value=200)
+kapasitas = np.linspace(b[indeks_sumber] * persen[0] / 100, b[indeks_sumber] * persen[1] / 100, jumlah_titik)
+
+def sapuan_lp(pek, masukan, indeks, kapasitas):
+    return kapasitas, model_inti.sapuan_kapasitas(**masukan, indeks=indeks, kapasitas=kapasitas, kemajuan=pek.lapor)
+
+# Sapuan berjalan di pekerjaan latar; perubahan masukan membatalkan sapuan yang sudah usang
+kunci_sapuan = (tuple(masukan["profit"]), tuple(map(tuple, A)), tuple(b), indeks_sumber, persen, jumlah_titik)
+hasil_sapuan, segar = pekerjaan.tampilkan("sapuan_lp", kunci_sapuan, sapuan_lp, masukan, indeks_sumber, kapasitas,
+                                          label="Menghitung sapuan LP")
+if hasil_sapuan is not None:
+    kap, untung = hasil_sapuan
+    if not segar:
+        st.caption("Menampilkan sapuan sebelumnya sampai sapuan baru selesai dihitung.")
+    # Kemiringan kurva keuntungan = harga bayangan sumber daya
+    harga_bayangan = np.gradient(untung, kap) if len(kap) > 1 else np.zeros_like(untung)
+
+    fig3, (ax3, ax4) = plt.subplots(2, 1, sharex=True, figsize=(7, 6))
+    ax3.plot(kap, untung, color="tab:blue")
+    ax3.axvline(b[indeks_sumber], color="red", linestyle="--", label="Kapasitas saat ini")
+    ax3.set_ylabel("Keuntungan maksimum (Rp)")
+    ax3.legend()
+    ax4.plot(kap, harga_bayangan, color="tab:orange")
+    ax4.set_ylabel("Harga bayangan (Rp/unit)")
+    ax4.set_xlabel(f"Kapasitas {nama_sumber[indeks_sumber]}")
+    st.pyplot(fig3)
+    plt.close(fig3)
+
+# === Distribusi hasil produksi ke outlet cabang ===
+st.header("🚚 Distribusi ke Outlet Cabang")
+
+@st.cache_data(max_entries=4)
+def jaringan_contoh(jumlah_pabrik, jumlah_outlet):
+    return distribusi.jaringan_contoh(jumlah_pabrik, jumlah_outlet)
+
+@st.cache_data(max_entries=4)
+def jaringan_csv(data_rute, data_permintaan):
+    nama_pabrik, nama_outlet, asal, tujuan, biaya_rute, kapasitas_rute = distribusi.baca_rute(io.BytesIO(data_rute))
+    permintaan = distribusi.baca_permintaan(io.BytesIO(data_permintaan), nama_outlet, ["banner", "brosur"])
+    return nama_pabrik, nama_outlet, asal, tujuan, biaya_rute, kapasitas_rute, permintaan
+
+def hitung_distribusi(pek, pasokan, permintaan, asal, tujuan, biaya_rute, kapasitas_rute, penalti):
+    pek.lapor(0.0)
+    return distribusi.selesaikan(pasokan, permintaan, asal, tujuan, biaya_rute, kapasitas_rute, penalti)
+
+if not hasil["sukses"]:
+    st.info("Distribusi dihitung setelah optimasi produksi berhasil.")
+else:
+    jaringan = None
+    sumber_jaringan = st.radio("Data jaringan distribusi", ["Jaringan contoh", "Unggah CSV"], horizontal=True)
+    if sumber_jaringan == "Jaringan contoh":
+        col1, col2, col3 = st.columns(3)
+        jumlah_pabrik = int(col1.number_input("Jumlah pabrik", min_value=1, max_value=50, value=3))
+        jumlah_outlet = col2.select_slider("Jumlah outlet", options=[10, 50, 200, 1000, 2000, 5000], value=200)
+        rasio = col3.slider("Total permintaan (% dari produksi)", 50, 150, 90)
+        asal, tujuan, biaya_rute, bobot = jaringan_contoh(jumlah_pabrik, jumlah_outlet)
+        # Permintaan outlet: produksi optimal dibagi menurut bobot acak setiap outlet
+        permintaan = np.outer([x_opt, y_opt], bobot) * rasio / 100
+        nama_pabrik = [f"Pabrik {i + 1}" for i in range(jumlah_pabrik)]
+        nama_outlet = [f"Outlet {j + 1}" for j in range(jumlah_outlet)]
+        jaringan = (asal, tujuan, biaya_rute, None, permintaan)
+        kunci_jaringan = (jumlah_pabrik, jumlah_outlet, rasio)
+    else:
+        col1, col2 = st.columns(2)
+        rute_csv = col1.file_uploader("Tabel rute (pabrik, outlet, biaya[, kapasitas])", type="csv")
+        permintaan_csv = col2.file_uploader("Permintaan outlet (outlet, banner, brosur)", type="csv")
+        if rute_csv is not None and permintaan_csv is not None:
+            try:
+                nama_pabrik, nama_outlet, asal, tujuan, biaya_rute, kapasitas_rute, permintaan = jaringan_csv(
+                    rute_csv.getvalue(), permintaan_csv.getvalue())
+            except ValueError as e:
+                st.error(f"CSV tidak valid: {e}")
+            else:
+                jaringan = (asal, tujuan, biaya_rute, kapasitas_rute, permintaan)
+                kunci_jaringan = (hashlib.sha1(rute_csv.getvalue()).hexdigest(),
+                                  hashlib.sha1(permintaan_csv.getvalue()).hexdigest())
+
+    if jaringan is not None:
+        asal, tujuan, biaya_rute, kapasitas_rute, permintaan = jaringan
+        tabel_porsi = st.data_editor({"Pabrik": nama_pabrik, "Porsi produksi (%)": [100 / len(nama_pabrik)] * len(nama_pabrik)},
+                                     disabled=["Pabrik"], key=f"porsi_pabrik_{len(nama_pabrik)}")
+        porsi = np.maximum(np.nan_to_num(np.asarray(tabel_porsi["Porsi produksi (%)"], dtype=float)), 0)
+        porsi = porsi / porsi.sum() if porsi.sum() > 0 else np.full(len(porsi), 1 / len(porsi))
+        pasokan = np.outer([x_opt, y_opt], porsi)
+        penalti = st.number_input("Biaya per unit permintaan tak terpenuhi (Rp)",
+                                  value=float(10 * max(1.0, biaya_rute.max(initial=0.0))), step=1000.0)
+
+        kunci_distribusi = (kunci_jaringan, x_opt, y_opt, tuple(porsi), penalti)
+        hasil_distribusi, segar = pekerjaan.tampilkan(
+            "distribusi", kunci_distribusi, hitung_distribusi, pasokan, permintaan, asal, tujuan, biaya_rute,
+            kapasitas_rute, penalti, label="Menyelesaikan LP distribusi")
+        if hasil_distribusi is not None:
+            if not segar:
+                st.caption("Menampilkan distribusi sebelumnya sampai perhitungan baru selesai.")
+            if not hasil_distribusi["sukses"]:
+                st.error(f"LP distribusi gagal: {hasil_distribusi['pesan']}")
+            else:
+                kurang = hasil_distribusi["kurang"].sum(axis=1)
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Biaya kirim", f"Rp {hasil_distribusi['biaya_kirim']:,.0f}")
+                col2.metric("Tak terpenuhi (Banner / Brosur)", f"{kurang[0]:,.1f} / {kurang[1]:,.1f}")
+                col3.metric("Biaya penalti", f"Rp {hasil_distribusi['biaya_penalti']:,.0f}")
+                st.caption(f"{len(asal):,} rute, {len(nama_outlet):,} outlet, {len(nama_pabrik):,} pabrik.")
+
+                terkirim = hasil_distribusi["terkirim_per_pabrik"]
+                posisi = np.arange(len(nama_pabrik))
+                fig4, ax5 = plt.subplots(figsize=(7, 3.5))
+                ax5.bar(posisi - 0.2, terkirim[0], width=0.4, color="skyblue", label="Banner terkirim")
+                ax5.bar(posisi + 0.2, terkirim[1], width=0.4, color="lightgreen", label="Brosur terkirim")
+                ax5.scatter(posisi - 0.2, pasokan[0], marker="_", s=300, color="navy", label="Pasokan")
+                ax5.scatter(posisi + 0.2, pasokan[1], marker="_", s=300, color="navy")
+                ax5.set_xticks(posisi if len(posisi) <= 20 else posisi[::max(1, len(posisi) // 10)])
+                ax5.set_xlabel("Pabrik")
+                ax5.set_ylabel("Unit")
+                ax5.legend()
+                st.pyplot(fig4)
+                plt.close(fig4)
+
+                # Aliran terbesar saja agar tabel tetap ringan untuk ribuan outlet
+                aliran = hasil_distribusi["aliran"]
+                baris_tabel = []
+                for p, nama_produk in enumerate(["Banner", "Brosur"]):
+                    for k in np.argsort(-aliran[p])[:50]:
+                        if aliran[p, k] > 1e-9:
+                            baris_tabel.append({"Produk": nama_produk, "Dari": nama_pabrik[asal[k]],
+                                                "Ke": nama_outlet[tujuan[k]], "Unit": aliran[p, k],
+                                                "Biaya (Rp)": aliran[p, k] * biaya_rute[k]})
+                st.dataframe(sorted(baris_tabel, key=lambda r: -r["Unit"])[:100])
+
+# === Ekspor / impor model ke format solver standar ===
+with st.expander("💾 Ekspor / Impor Model (MPS / LP)"):
+    bulat = st.checkbox("Jumlah produksi harus bilangan bulat (MILP)")
+    model_lp = berkas_model.ModelLP.dari_produksi(
+        masukan["profit"], A, b, ["banner", "brosur"], ["waktu_mesin", "bahan_baku", "tenaga_kerja"], bulat=bulat)
+    col1, col2 = st.columns(2)
+    col1.download_button("⬇️ Unduh MPS", berkas_model.ke_bytes(model_lp, "mps"), "produksi.mps", "text/plain")
+    col2.download_button("⬇️ Unduh LP", berkas_model.ke_bytes(model_lp, "lp"), "produksi.lp", "text/plain")
+
+    unggahan = st.file_uploader("Impor model (.mps / .lp)", type=["mps", "lp"])
+    if unggahan is not None:
+        try:
+            model_impor = berkas_model.baca(unggahan)
+        except ValueError as e:
+            st.error(f"Berkas model tidak valid: {e}")
+        else:
+            m, n, nnz, n_int = model_impor.ukuran
+            st.write(f"**{model_impor.nama}**: {m:,} kendala, {n:,} variabel ({n_int:,} integer), {nnz:,} nonzero")
+            if st.button("Selesaikan model impor"):
+                hasil_impor = model_impor.selesaikan()
+                if hasil_impor["sukses"]:
+                    st.success(f"Nilai objektif optimal: {hasil_impor['objektif']:,.4g}")
+                    x_impor = hasil_impor["x"]
+                    # Tampilkan variabel bernilai terbesar saja agar tabel tetap ringan untuk model besar
+                    teratas = np.argsort(-np.abs(x_impor))[:50]
+                    st.dataframe([{"Variabel": model_impor.nama_kolom[j], "Nilai": x_impor[j]}
+                                  for j in teratas if x_impor[j] != 0])
+                else:
+                    st.error(hasil_impor["pesan"])
+
+penyimpanan_skenario.tampilkan_riwayat("lp_produksi")
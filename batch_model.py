@@ -0,0 +1,161 @@
+"""Batch CLI: jalankan model_inti atas ribuan skenario dari file JSON-lines/CSV.
+
+Setiap baris masukan berisi kolom "model" (lp_produksi, eoq, antrian_mm1,
+turunan_parsial) dan parameter model, misalnya:
+    {"model": "eoq", "D": 50000, "S": 250000, "H": 1000}
+    {"model": "lp_produksi", "profit": [50000, 80000], "A": [[2, 4], [4, 5]], "b": [1200, 1600]}
+Pada CSV, nilai berupa list ditulis sebagai JSON ("[2, 4]"). Kolom "id"
+(opsional) disalin ke hasil.
+
+Contoh:
+    python batch_model.py skenario.jsonl --keluaran hasil.jsonl --pekerja 8
+    python batch_model.py skenario.csv > hasil.jsonl
+
+Masukan dibaca bertahap per potongan, dikerjakan paralel di ProcessPool, dan
+hasil ditulis (JSON-lines) segera setelah potongannya selesai, sehingga
+memori tetap kecil berapa pun jumlah skenarionya. Urutan keluaran mengikuti
+urutan selesai; kolom "baris" menunjuk nomor baris masukan. Baris yang tidak
+dapat diurai menjadi hasil {"baris": i, "galat": ...} tanpa menghentikan batch.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import model_inti
+
+
+def _nilai_csv(teks):
+    try:
+        return json.loads(teks)
+    except ValueError:
+        return teks
+
+
+class BarisRusak(ValueError):
+    """Baris masukan yang tidak dapat diurai; diteruskan ke pekerja sebagai pengganti skenario."""
+
+
+def _urai_json(baris):
+    try:
+        skenario = json.loads(baris)
+    except ValueError as e:
+        return BarisRusak(f"{type(e).__name__}: {e}")
+    if not isinstance(skenario, dict):
+        return BarisRusak(f"Baris harus berupa objek JSON, bukan {type(skenario).__name__}")
+    return skenario
+
+
+def baca_skenario(path):
+    """Generator (nomor_baris, dict) dari file .jsonl/.json atau .csv; "-" berarti stdin.
+
+    Baris yang gagal diurai menghasilkan (nomor_baris, BarisRusak) alih-alih menghentikan generator.
+    """
+    berkas = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if path.endswith(".csv"):
+            pembaca = csv.DictReader(berkas)
+            for i in itertools.count(1):
+                try:
+                    baris = next(pembaca)
+                except StopIteration:
+                    break
+                except csv.Error as e:
+                    yield i, BarisRusak(f"csv.Error: {e}")
+                    continue
+                yield i, {k: _nilai_csv(v) for k, v in baris.items() if v not in ("", None)}
+        else:
+            for i, baris in enumerate(berkas, start=1):
+                if baris.strip():
+                    yield i, _urai_json(baris.strip())
+    finally:
+        if berkas is not sys.stdin:
+            berkas.close()
+
+
+def kerjakan_potongan(potongan):
+    """Dijalankan di proses pekerja: satu hasil per skenario, galat tidak menghentikan batch."""
+    hasil = []
+    for nomor, skenario in potongan:
+        if isinstance(skenario, BarisRusak):
+            hasil.append({"baris": nomor, "galat": str(skenario)})
+            continue
+        masukan = dict(skenario)
+        model = masukan.pop("model", None)
+        keluaran = {"baris": nomor, "model": model}
+        if "id" in masukan:
+            keluaran["id"] = masukan.pop("id")
+        try:
+            keluaran["hasil"] = model_inti.jalankan(model, masukan)
+        except Exception as e:
+            keluaran["galat"] = f"{type(e).__name__}: {e}"
+        hasil.append(keluaran)
+    return hasil
+
+
+def jalankan_batch(skenario, keluaran, pekerja=None, ukuran_potongan=500, maks_antre=None,
+                   fungsi=kerjakan_potongan):
+    """Kerjakan iterable (nomor, dict) secara paralel; tulis hasil ke `keluaran` begitu tersedia.
+
+    Jumlah potongan yang sedang dikerjakan dibatasi `maks_antre` (bawaan 2x pekerja) agar
+    masukan tidak dibaca seluruhnya ke memori. `fungsi(potongan)` (bawaan `kerjakan_potongan`,
+    harus bisa di-pickle) mengembalikan list dict hasil; dict berkunci "galat" dihitung gagal.
+    Mengembalikan (jumlah, jumlah_galat).
+    """
+    pekerja = pekerja or os.cpu_count() or 1
+    maks_antre = maks_antre or 2 * pekerja
+    potongan = iter(lambda it=iter(skenario): list(itertools.islice(it, ukuran_potongan)), [])
+    jumlah = galat = 0
+    with ProcessPoolExecutor(max_workers=pekerja) as pool:
+        berjalan = set()
+        for bagian in potongan:
+            berjalan.add(pool.submit(fungsi, bagian))
+            if len(berjalan) >= maks_antre:
+                selesai, berjalan = wait(berjalan, return_when=FIRST_COMPLETED)
+                j, g = _tulis(selesai, keluaran)
+                jumlah += j
+                galat += g
+        j, g = _tulis(berjalan, keluaran)
+        jumlah += j
+        galat += g
+    return jumlah, galat
+
+
+def _tulis(futures, keluaran):
+    jumlah = galat = 0
+    for fut in futures:
+        for hasil in fut.result():
+            keluaran.write(json.dumps(hasil, ensure_ascii=False) + "\n")
+            jumlah += 1
+            galat += "galat" in hasil
+    keluaran.flush()
+    return jumlah, galat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan model atas file skenario secara paralel")
+    parser.add_argument("masukan", help="file .jsonl atau .csv ('-' untuk stdin JSON-lines)")
+    parser.add_argument("--keluaran", default="-", help="file hasil JSON-lines (bawaan: stdout)")
+    parser.add_argument("--pekerja", type=int, default=None, help="jumlah proses (bawaan: jumlah core)")
+    parser.add_argument("--ukuran-potongan", type=int, default=500, help="skenario per tugas pekerja")
+    args = parser.parse_args(argv)
+
+    keluaran = sys.stdout if args.keluaran == "-" else open(args.keluaran, "w", encoding="utf-8")
+    mulai = time.perf_counter()
+    try:
+        jumlah, galat = jalankan_batch(baca_skenario(args.masukan), keluaran, args.pekerja, args.ukuran_potongan)
+    finally:
+        if keluaran is not sys.stdout:
+            keluaran.close()
+    durasi = time.perf_counter() - mulai
+    print(f"{jumlah} skenario ({galat} galat) dalam {durasi:.2f} s — {jumlah / max(durasi, 1e-9):,.0f} skenario/s",
+          file=sys.stderr)
+    return 1 if galat else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Benchmark headless untuk jalur komputasi utama aplikasi.
+
+Contoh:
+    python benchmark.py --output hasil.json
+    python benchmark.py --output hasil.json --baseline baseline.json --ambang 25
+
+Setiap kasus dijalankan beberapa kali; waktu (median & minimum) dan
+memori puncak (tracemalloc) dicatat ke JSON. Jika baseline diberikan,
+kasus yang lebih lambat dari ambang (%) dilaporkan dan exit code = 1.
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import sympy as sp
+
+import grafik
+import model_inti
+
+x, y = sp.symbols("x y")
+
+# Ekspresi representatif seperti yang diketik pengguna di turunan_parsial.py
+EKSPRESI = {
+    "polinom": "x**2 + y**2",
+    "laba": "10*x + 8*y - 0.1*x**2 - 0.05*y**2",
+    "transenden": "sin(x)*exp(-y**2) + log(1 + x**2*y**2)",
+    "bersarang": "sqrt(1 + (x*y + sin(x + cos(y)))**2) / (1 + exp(-x*y))",
+}
+
+# Model LP produksi dari aplikasi-aplikasi optimasi (profit, A, b)
+MODEL_LP = {
+    "industri_ban": ([50000, 80000], [[2, 4], [4, 5]], [1200, 1600]),
+    "makmur_jaya": ([10000, 8000], [[2, 4], [4, 2]], [100, 80]),
+    "banner_brosur": ([90000, 20000], [[1, 0.5], [2, 2], [2, 1]], [150, 200, 200]),
+}
+
+# Kasus di bawah memanggil model_inti/grafik, jalur yang sama dengan aplikasi,
+# agar regresi di kode aplikasi ikut terukur
+
+
+def kasus_simbolik(teks):
+    def jalan():
+        # Kosongkan cache sympy agar setiap ulangan mengukur parse & turunan dari awal
+        sp.core.cache.clear_cache()
+        f = sp.sympify(teks)
+        fx = sp.diff(f, x)
+        fy = sp.diff(f, y)
+        f_np = sp.lambdify((x, y), f, "numpy")
+        X, Y = np.meshgrid(np.linspace(-1, 1, 50), np.linspace(-1, 1, 50))
+        f_np(X, Y)
+        fx.evalf(subs={x: 1.0, y: 1.0})
+        fy.evalf(subs={x: 1.0, y: 1.0})
+    return jalan
+
+
+def kasus_lp(profit, A, b):
+    def jalan():
+        assert model_inti.lp_produksi(profit, A, b)["sukses"]
+    return jalan
+
+
+def kasus_eoq():
+    D, S, H = 50000, 250000, 1000
+    EOQ = model_inti.eoq(D, S, H)["EOQ"]
+    Q = np.linspace(EOQ * 0.4, EOQ * 1.6, 300)
+    _, _, TC = model_inti.kurva_eoq(D, S, H, Q)
+    return TC.min()
+
+
+def kasus_antrian():
+    lam = np.linspace(0.1, 9.9, 10000)
+    model_inti.antrian_mm1(4.0, 10.0)
+    v = model_inti.antrian_mm1_vektor(lam, 10.0)
+    return v["W"], v["Wq"]
+
+
+def _simpan_gambar(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+
+
+def kasus_daerah_feasible():
+    _, A, b = MODEL_LP["banner_brosur"]
+    fig, ax = plt.subplots()
+    grafik.gambar_daerah_layak(ax, A, b, 50, 50, label=["Kendala Mesin", "Kendala Bahan Baku", "Kendala Tenaga Kerja"],
+                               titik=400)
+    _simpan_gambar(fig)
+
+
+def kasus_render_kurva_eoq():
+    fig, ax = plt.subplots()
+    grafik.gambar_kurva_eoq(ax, 50000, 250000, 1000)
+    _simpan_gambar(fig)
+
+
+def kasus_permukaan_3d():
+    X, Y = np.meshgrid(np.linspace(-1, 3, 50), np.linspace(-1, 3, 50))
+    Z = X**2 + Y**2
+    Z_tangent = 2 + 2 * (X - 1) + 2 * (Y - 1)
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection="3d")
+    ax.plot_surface(X, Y, Z, alpha=0.7, cmap="viridis")
+    ax.plot_surface(X, Y, Z_tangent, alpha=0.5, color="red")
+    _simpan_gambar(fig)
+
+
+def daftar_kasus():
+    kasus = {}
+    for nama, teks in EKSPRESI.items():
+        kasus[f"simbolik/{nama}"] = kasus_simbolik(teks)
+    for nama, (profit, A, b) in MODEL_LP.items():
+        kasus[f"lp/{nama}"] = kasus_lp(profit, A, b)
+    kasus["eoq/kurva"] = kasus_eoq
+    kasus["antrian/mm1"] = kasus_antrian
+    kasus["render/daerah_feasible"] = kasus_daerah_feasible
+    kasus["render/kurva_eoq"] = kasus_render_kurva_eoq
+    kasus["render/permukaan_3d"] = kasus_permukaan_3d
+    return kasus
+
+
+def ukur_kasus(fungsi, ulang):
+    fungsi()  # pemanasan (import lazy, cache sympy, dll.)
+    waktu = []
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        fungsi()
+        waktu.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fungsi()
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(waktu) * 1000,
+        "min_ms": min(waktu) * 1000,
+        "puncak_kb": puncak / 1024,
+        "ulang": ulang,
+    }
+
+
+def bandingkan(hasil, baseline, ambang):
+    """Kembalikan daftar (nama, baseline_ms, sekarang_ms, %) untuk kasus yang regresi."""
+    regresi = []
+    for nama, data in hasil.items():
+        lama = baseline.get(nama)
+        if lama is None:
+            continue
+        persen = (data["median_ms"] / lama["median_ms"] - 1) * 100
+        if persen > ambang:
+            regresi.append((nama, lama["median_ms"], data["median_ms"], persen))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_output.json", help="file JSON hasil")
+    parser.add_argument("--baseline", help="file JSON baseline untuk dibandingkan")
+    parser.add_argument("--ambang", type=float, default=20.0, help="ambang regresi dalam persen")
+    parser.add_argument("--ulang", type=int, default=10, help="jumlah pengulangan per kasus")
+    parser.add_argument("--filter", default="", help="hanya jalankan kasus yang namanya mengandung teks ini")
+    args = parser.parse_args(argv)
+
+    hasil = {}
+    for nama, fungsi in daftar_kasus().items():
+        if args.filter not in nama:
+            continue
+        hasil[nama] = ukur_kasus(fungsi, args.ulang)
+        data = hasil[nama]
+        print(f"{nama:28s} {data['median_ms']:9.2f} ms  (min {data['min_ms']:.2f})  {data['puncak_kb']:9.1f} KB")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"python": platform.python_version(), "kasus": hasil}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["kasus"]
+        regresi = bandingkan(hasil, baseline, args.ambang)
+        for nama, lama, baru, persen in regresi:
+            print(f"REGRESI {nama}: {lama:.2f} ms -> {baru:.2f} ms (+{persen:.0f}%)")
+        if regresi:
+            return 1
+        print(f"Tidak ada regresi di atas {args.ambang:.0f}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,896 @@
+"""Ekspor dan impor model LP/MILP produksi dalam format MPS dan LP.
+
+Model disimpan sebagai `ModelLP`: objektif c·x + konstanta, matriks kendala
+sparse A dengan batas baris bawah <= A x <= atas, batas variabel dan penanda
+integer. Konstanta objektif ditulis di MPS sebagai RHS baris objektif (N)
+dengan tanda dibalik, sesuai konvensi MPS, dan di LP sebagai suku konstan. Penulis
+MPS/LP menghasilkan berkas yang dapat dibaca solver lain (HiGHS, CBC, GLPK,
+CPLEX, Gurobi).
+
+Pembaca MPS bersifat streaming: berkas dibaca per blok byte, setiap blok
+dipecah menjadi token dengan operasi NumPy pada buffernya (token disimpan
+sebagai array byte lebar tetap, bukan objek Python per token) dan nama baris
+dipetakan ke indeks dengan `searchsorted`. Triplet (baris, kolom, nilai)
+dikumpulkan per blok sebagai array lalu langsung dirakit menjadi matriks CSR,
+sehingga berkas ratusan megabyte dapat dimuat dengan memori sebanding ukuran
+matriksnya. Format LP ditujukan untuk model yang dibaca manusia dan dibaca
+baris demi baris.
+
+    python berkas_model.py model.mps --keluaran model.lp --selesaikan
+    python berkas_model.py --uji          # uji mandiri pulang-pergi, exit 1 bila gagal
+"""
+import argparse
+import io
+import os
+import re
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+
+import numpy as np
+import scipy.sparse as sps
+from scipy.optimize import linprog
+
+UKURAN_BLOK = 8 * 1024 * 1024
+# Baris data yang ditulis per panggilan write()
+BARIS_PER_TULIS = 100000
+# Jumlah suku per baris pada format LP (pembaca umumnya membatasi panjang baris)
+SUKU_PER_BARIS_LP = 8
+
+
+class ModelLP:
+    """Model min/maks c·x + konstanta dengan baris_bawah <= A x <= baris_atas dan batas_bawah <= x <= batas_atas."""
+
+    def __init__(self, c, A, baris_bawah, baris_atas, batas_bawah=None, batas_atas=None, integer=None,
+                 nama_baris=None, nama_kolom=None, maksimasi=False, nama="model", konstanta=0.0):
+        self.c = np.asarray(c, dtype=float)
+        n = len(self.c)
+        self.A = sps.csr_matrix(A, shape=(len(baris_bawah), n))
+        self.baris_bawah = np.asarray(baris_bawah, dtype=float)
+        self.baris_atas = np.asarray(baris_atas, dtype=float)
+        self.batas_bawah = np.zeros(n) if batas_bawah is None else np.asarray(batas_bawah, dtype=float)
+        self.batas_atas = np.full(n, np.inf) if batas_atas is None else np.asarray(batas_atas, dtype=float)
+        self.integer = np.zeros(n, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+        m = self.A.shape[0]
+        self.nama_baris = np.asarray(nama_baris if nama_baris is not None else [f"R{i + 1}" for i in range(m)], dtype=str)
+        self.nama_kolom = np.asarray(nama_kolom if nama_kolom is not None else [f"C{j + 1}" for j in range(n)], dtype=str)
+        self.maksimasi = maksimasi
+        self.nama = nama
+        self.konstanta = float(konstanta)
+
+    @classmethod
+    def dari_produksi(cls, profit, A, b, nama_produk=None, nama_sumber=None, bulat=False, nama="produksi"):
+        """Model produksi aplikasi: maks profit·x dengan A x <= b, x >= 0 (integer bila `bulat`)."""
+        m = len(b)
+        return cls(profit, np.asarray(A, dtype=float), np.full(m, -np.inf), b,
+                   integer=np.full(len(profit), bulat), nama_baris=nama_sumber, nama_kolom=nama_produk,
+                   maksimasi=True, nama=nama)
+
+    @property
+    def ukuran(self):
+        """(jumlah baris, jumlah kolom, jumlah nonzero, jumlah variabel integer)."""
+        return self.A.shape[0], self.A.shape[1], self.A.nnz, int(self.integer.sum())
+
+    def selesaikan(self, **opsi):
+        """Selesaikan dengan HiGHS (linprog, MILP bila ada variabel integer)."""
+        A = self.A.tocsr()
+        sama = self.baris_bawah == self.baris_atas
+        atas = np.isfinite(self.baris_atas) & ~sama
+        bawah = np.isfinite(self.baris_bawah) & ~sama
+        A_ub = sps.vstack([A[atas], -A[bawah]], format="csr")
+        b_ub = np.concatenate([self.baris_atas[atas], -self.baris_bawah[bawah]])
+        res = linprog(-self.c if self.maksimasi else self.c,
+                      A_ub=A_ub if A_ub.shape[0] else None, b_ub=b_ub if A_ub.shape[0] else None,
+                      A_eq=A[sama] if sama.any() else None, b_eq=self.baris_atas[sama] if sama.any() else None,
+                      bounds=np.column_stack([self.batas_bawah, self.batas_atas]),
+                      integrality=self.integer.astype(int) if self.integer.any() else None,
+                      method="highs", options=opsi or None)
+        if res.x is None:
+            return {"sukses": False, "pesan": res.message, "x": None, "objektif": None}
+        return {"sukses": bool(res.success), "pesan": res.message, "x": res.x,
+                "objektif": float(-res.fun if self.maksimasi else res.fun) + self.konstanta}
+
+
+# =========================
+# PENULISAN
+# =========================
+
+def _nama_aman(nama, cadangan=()):
+    """Nama unik tanpa spasi/karakter operator agar valid di MPS maupun LP.
+
+    Nama yang sama setelah disanitasi ("Waktu mesin"/"Waktu-mesin") atau sama dengan
+    nama `cadangan` (tanpa membedakan huruf besar/kecil, mis. baris objektif) diberi
+    akhiran _2, _3, ... sehingga berkas terbaca kembali sebagai model yang sama.
+    """
+    dasar = [re.sub(r"[^A-Za-z0-9_.]", "_", n) or "_" for n in nama]
+    # Nama berawalan angka/titik dibaca sebagai bilangan oleh pembaca LP
+    dasar = [f"_{n}" if n[0].isdigit() or n[0] == "." else n for n in dasar]
+    cadangan = {n.lower() for n in cadangan}
+    bebas = lambda n: n not in terpakai and n.lower() not in cadangan
+    terpakai, semua = set(), set(dasar)
+    akhiran = {}
+    hasil = []
+    for n in dasar:
+        if not bebas(n):
+            k = akhiran.get(n, 2)
+            # Akhiran tidak boleh merebut nama lain yang memang ada di model
+            while not bebas(f"{n}_{k}") or f"{n}_{k}" in semua:
+                k += 1
+            akhiran[n] = k + 1
+            n = f"{n}_{k}"
+        terpakai.add(n)
+        hasil.append(n)
+    return np.array(hasil, dtype=str)
+
+
+def _angka(v):
+    return repr(float(v))
+
+
+@contextmanager
+def _buka_tulis(berkas):
+    if isinstance(berkas, (str, os.PathLike)):
+        with open(berkas, "w", encoding="ascii", newline="\n") as f:
+            yield f
+    else:
+        yield berkas
+
+
+def tulis_mps(model, berkas):
+    """Tulis model ke format MPS (bebas: nama boleh lebih dari 8 karakter)."""
+    baris = _nama_aman(model.nama_baris, cadangan=("OBJ",))
+    kolom = _nama_aman(model.nama_kolom)
+    bawah, atas = model.baris_bawah, model.baris_atas
+    with _buka_tulis(berkas) as f:
+        f.write(f"NAME          {_nama_aman([model.nama])[0]}\n")
+        if model.maksimasi:
+            f.write("OBJSENSE\n    MAX\n")
+        f.write("ROWS\n N  OBJ\n")
+        jenis = np.where(bawah == atas, "E", np.where(np.isfinite(atas), "L", np.where(np.isfinite(bawah), "G", "N")))
+        f.writelines(f" {j}  {nm}\n" for j, nm in zip(jenis.tolist(), baris.tolist()))
+
+        f.write("COLUMNS\n")
+        A = model.A.tocsc()
+        nama_baris_obj = np.concatenate([baris, ["OBJ"]])
+        # Kolom tanpa nonzero tetap dideklarasikan lewat koefisien objektif (boleh 0)
+        perlu_obj = (model.c != 0) | (np.diff(A.indptr) == 0)
+        kol_obj = np.flatnonzero(perlu_obj)
+        kol_nz = np.repeat(np.arange(A.shape[1]), np.diff(A.indptr))
+        semua_kol = np.concatenate([kol_obj, kol_nz])
+        semua_baris = np.concatenate([np.full(len(kol_obj), len(baris)), A.indices])
+        semua_nilai = np.concatenate([model.c[kol_obj], A.data])
+        urut = np.argsort(semua_kol, kind="stable")
+        semua_kol, semua_baris, semua_nilai = semua_kol[urut], semua_baris[urut], semua_nilai[urut]
+
+        # Potong per rangkaian kolom dengan status integer sama (dibungkus MARKER)
+        ganti = np.flatnonzero(np.diff(model.integer[semua_kol].astype(np.int8))) + 1
+        penanda = 0
+        for awal, akhir in zip(np.concatenate([[0], ganti]), np.concatenate([ganti, [len(semua_kol)]])):
+            integer = bool(len(semua_kol)) and model.integer[semua_kol[awal]]
+            if integer:
+                f.write(f"    MARKER{penanda}  'MARKER'  'INTORG'\n")
+            for i in range(awal, akhir, BARIS_PER_TULIS):
+                j = slice(i, min(i + BARIS_PER_TULIS, akhir))
+                f.write("".join(f"    {k}  {r}  {_angka(v)}\n" for k, r, v in zip(
+                    kolom[semua_kol[j]].tolist(), nama_baris_obj[semua_baris[j]].tolist(), semua_nilai[j].tolist())))
+            if integer:
+                f.write(f"    MARKER{penanda}  'MARKER'  'INTEND'\n")
+                penanda += 1
+
+        f.write("RHS\n")
+        if model.konstanta:
+            # Konvensi MPS: RHS baris objektif adalah negatif konstanta objektif
+            f.write(f"    RHS  OBJ  {_angka(-model.konstanta)}\n")
+        rhs = np.where(jenis == "G", bawah, atas)
+        ada = (jenis != "N") & (rhs != 0)
+        f.writelines(f"    RHS  {nm}  {_angka(v)}\n" for nm, v in zip(baris[ada].tolist(), rhs[ada].tolist()))
+
+        rentang = np.isfinite(bawah) & np.isfinite(atas) & (bawah != atas)
+        if rentang.any():
+            f.write("RANGES\n")
+            f.writelines(f"    RNG  {nm}  {_angka(v)}\n"
+                         for nm, v in zip(baris[rentang].tolist(), (atas - bawah)[rentang].tolist()))
+
+        lb, ub = model.batas_bawah, model.batas_atas
+        tulis = []
+        for j in np.flatnonzero((lb != 0) | np.isfinite(ub)):
+            if lb[j] == ub[j]:
+                tulis.append(f" FX BND  {kolom[j]}  {_angka(lb[j])}\n")
+                continue
+            if lb[j] == -np.inf and ub[j] == np.inf:
+                tulis.append(f" FR BND  {kolom[j]}\n")
+                continue
+            if lb[j] == -np.inf:
+                tulis.append(f" MI BND  {kolom[j]}\n")
+            elif lb[j] != 0:
+                tulis.append(f" LO BND  {kolom[j]}  {_angka(lb[j])}\n")
+            if np.isfinite(ub[j]):
+                tulis.append(f" UP BND  {kolom[j]}  {_angka(ub[j])}\n")
+        if tulis:
+            f.write("BOUNDS\n")
+            f.writelines(tulis)
+        f.write("ENDATA\n")
+
+
+def _ekspresi_lp(nama, koef):
+    """Suku-suku ekspresi linear LP, dipecah menjadi beberapa baris."""
+    suku = [f"{'-' if v < 0 else '+'} {_angka(abs(v))} {n}" for n, v in zip(nama, koef)]
+    if not suku:
+        return "0"
+    if suku[0].startswith("+ "):
+        suku[0] = suku[0][2:]
+    return "\n   ".join(" ".join(suku[i:i + SUKU_PER_BARIS_LP]) for i in range(0, len(suku), SUKU_PER_BARIS_LP))
+
+
+def tulis_lp(model, berkas):
+    """Tulis model ke format LP (CPLEX). Baris dengan rentang ditulis sebagai dua kendala _lo/_up."""
+    # Label objektif dan kata kunci batas tidak boleh dipakai sebagai nama
+    baris = _nama_aman(model.nama_baris, cadangan=("obj",))
+    kolom = _nama_aman(model.nama_kolom, cadangan=("inf", "infinity", "free"))
+    A = model.A.tocsr()
+    with _buka_tulis(berkas) as f:
+        f.write(f"\\ Model {model.nama}\n")
+        f.write("Maximize\n" if model.maksimasi else "Minimize\n")
+        ada = np.flatnonzero(model.c)
+        konstanta = f" {'-' if model.konstanta < 0 else '+'} {_angka(abs(model.konstanta))}" if model.konstanta else ""
+        f.write(f" obj: {_ekspresi_lp(kolom[ada].tolist(), model.c[ada].tolist())}{konstanta}\n")
+        f.write("Subject To\n")
+        for i in range(A.shape[0]):
+            bawah, atas = model.baris_bawah[i], model.baris_atas[i]
+            mulai, akhir = A.indptr[i], A.indptr[i + 1]
+            ekspresi = _ekspresi_lp(kolom[A.indices[mulai:akhir]].tolist(), A.data[mulai:akhir].tolist())
+            if bawah == atas:
+                f.write(f" {baris[i]}: {ekspresi} = {_angka(atas)}\n")
+            elif np.isfinite(bawah) and np.isfinite(atas):
+                f.write(f" {baris[i]}_lo: {ekspresi} >= {_angka(bawah)}\n")
+                f.write(f" {baris[i]}_up: {ekspresi} <= {_angka(atas)}\n")
+            elif np.isfinite(atas):
+                f.write(f" {baris[i]}: {ekspresi} <= {_angka(atas)}\n")
+            elif np.isfinite(bawah):
+                f.write(f" {baris[i]}: {ekspresi} >= {_angka(bawah)}\n")
+
+        lb, ub = model.batas_bawah, model.batas_atas
+        tulis = []
+        for j in np.flatnonzero((lb != 0) | np.isfinite(ub)):
+            if lb[j] == ub[j]:
+                tulis.append(f" {kolom[j]} = {_angka(lb[j])}\n")
+            elif lb[j] == -np.inf and ub[j] == np.inf:
+                tulis.append(f" {kolom[j]} free\n")
+            else:
+                kiri = "-inf" if lb[j] == -np.inf else _angka(lb[j])
+                kanan = f" <= {_angka(ub[j])}" if np.isfinite(ub[j]) else ""
+                tulis.append(f" {kiri} <= {kolom[j]}{kanan}\n")
+        if tulis:
+            f.write("Bounds\n")
+            f.writelines(tulis)
+        if model.integer.any():
+            f.write("Generals\n")
+            nama_int = kolom[model.integer].tolist()
+            for i in range(0, len(nama_int), SUKU_PER_BARIS_LP):
+                f.write(" " + " ".join(nama_int[i:i + SUKU_PER_BARIS_LP]) + "\n")
+        f.write("End\n")
+
+
+def ke_bytes(model, format="mps"):
+    """Isi berkas MPS/LP sebagai bytes (untuk tombol unduh)."""
+    keluaran = io.StringIO()
+    (tulis_mps if format == "mps" else tulis_lp)(model, keluaran)
+    return keluaran.getvalue().encode("ascii")
+
+
+# =========================
+# PEMBACAAN MPS (STREAMING)
+# =========================
+
+def _token(data):
+    """Token sebuah potongan teks: (token S-array, indeks token pertama per baris, jumlah token per baris)."""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    spasi = (buf <= 32).view(np.int8)
+    tepi = np.diff(spasi, prepend=np.int8(1), append=np.int8(1))
+    mulai = np.flatnonzero(tepi == -1)
+    if not len(mulai):
+        return np.zeros(0, dtype="S1"), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    panjang = np.flatnonzero(tepi == 1) - mulai
+    lebar = int(panjang.max())
+    matriks = np.empty((len(mulai), lebar), dtype=np.uint8)
+    batas = len(buf) - 1
+    for k in range(lebar):
+        matriks[:, k] = buf[np.minimum(mulai + k, batas)]
+    # Sisa di belakang token (spasi/token berikutnya) diganti NUL: S-array memperlakukannya sebagai padding
+    matriks[np.arange(lebar) >= panjang[:, None]] = 0
+    token = matriks.view(f"S{lebar}").ravel()
+
+    # Token pertama setiap baris: token pertama sesudah setiap newline (dan token pembuka potongan)
+    awal = np.searchsorted(mulai, np.flatnonzero(buf == 10))
+    awal = awal[np.diff(awal, prepend=-1) != 0]
+    awal = np.concatenate([[0], awal[(awal > 0) & (awal < len(mulai))]])
+    jumlah = np.diff(np.append(awal, len(token)))
+    return token, awal, jumlah
+
+
+def _kunci_angka(token):
+    """Token sampai 8 byte sebagai uint64 (urutan bebas, cukup untuk pencocokan); None bila ada yang lebih panjang."""
+    lebar = token.dtype.itemsize
+    if lebar > 8:
+        if np.frombuffer(token.tobytes(), dtype=np.uint8).reshape(-1, lebar)[:, 8:].any():
+            return None
+        token = token.astype("S8")
+    return np.ascontiguousarray(token, dtype="S8").view(np.uint64)
+
+
+class _Pencari:
+    """Pemetaan nama (S-array) ke indeks secara tervektorisasi.
+
+    Nama sampai 8 karakter (umum di MPS) dibandingkan sebagai bilangan uint64,
+    jauh lebih cepat daripada perbandingan string.
+    """
+
+    def __init__(self, nama):
+        self.kunci = _kunci_angka(nama) if len(nama) else None
+        dasar = nama if self.kunci is None else self.kunci
+        self.urut = np.argsort(dasar, kind="stable")
+        self.terurut = dasar[self.urut]
+
+    def indeks(self, token, jenis):
+        if not len(self.urut):
+            if len(token):
+                raise ValueError(f"{jenis} '{token[0].decode()}' tidak dideklarasikan")
+            return np.zeros(0, dtype=np.int64)
+        cari = token if self.kunci is None else _kunci_angka(token)
+        if cari is None:
+            # Ada token lebih dari 8 karakter padahal semua nama terdaftar paling panjang 8
+            panjang = np.char.str_len(token) > 8
+            raise ValueError(f"{jenis} '{token[panjang][0].decode()}' tidak dideklarasikan")
+        terurut = self.terurut
+        pos = np.minimum(np.searchsorted(terurut, cari), len(terurut) - 1)
+        cocok = terurut[pos] == cari
+        if not cocok.all():
+            raise ValueError(f"{jenis} '{token[~cocok][0].decode()}' tidak dideklarasikan")
+        return self.urut[pos]
+
+
+class _PembacaMPS:
+    def __init__(self):
+        self.seksi = None
+        self.nama = "model"
+        self.maksimasi = False
+        self._jenis_baris, self._nama_baris = [], []
+        self._kolom, self._int_kolom = [], []
+        self._kolom_terakhir = None
+        self._integer_aktif = False
+        self._jumlah_kolom = 0
+        self._r, self._k, self._v = [], [], []
+        self._c_k, self._c_v = [], []
+        self._rhs, self._rng, self._bnd = [], [], []
+
+    # --- header seksi ---
+    def header(self, teks):
+        bagian = teks.split()
+        nama = bagian[0].upper()
+        if nama == b"NAME":
+            self.nama = bagian[1].decode() if len(bagian) > 1 else "model"
+        elif nama == b"OBJSENSE" and len(bagian) > 1:
+            self.maksimasi = bagian[1].upper().startswith(b"MAX")
+        elif nama == b"COLUMNS":
+            self._tutup_rows()
+        elif nama in (b"RHS", b"RANGES", b"BOUNDS") and self.seksi == b"COLUMNS":
+            self._tutup_columns()
+        elif nama not in (b"ROWS", b"OBJSENSE", b"RHS", b"RANGES", b"BOUNDS", b"ENDATA"):
+            raise ValueError(f"Seksi MPS '{nama.decode()}' tidak didukung")
+        self.seksi = nama
+
+    def _tutup_rows(self):
+        jenis = np.concatenate(self._jenis_baris) if self._jenis_baris else np.zeros(0, "S1")
+        nama = np.concatenate(self._nama_baris) if self._nama_baris else np.zeros(0, "S1")
+        jenis = np.char.upper(jenis)
+        n_baris = np.flatnonzero(jenis == b"N")
+        if not len(n_baris):
+            raise ValueError("Seksi ROWS tidak memiliki baris objektif (N)")
+        # Baris N pertama adalah objektif (-1); baris N lain diabaikan (-2)
+        kendala = jenis != b"N"
+        self.peta_baris = np.full(len(jenis), -2, dtype=np.int64)
+        self.peta_baris[n_baris[0]] = -1
+        self.peta_baris[kendala] = np.arange(kendala.sum())
+        self.jenis = jenis[kendala]
+        self.nama_baris = nama[kendala]
+        self.cari_baris = _Pencari(nama)
+
+    def _tutup_columns(self):
+        self.nama_kolom = np.concatenate(self._kolom) if self._kolom else np.zeros(0, "S1")
+        self.integer = np.concatenate(self._int_kolom) if self._int_kolom else np.zeros(0, bool)
+        self.cari_kolom = _Pencari(self.nama_kolom)
+
+    # --- data seksi ---
+    def data(self, potongan):
+        if self.seksi in (None, b"NAME", b"ENDATA"):
+            if potongan.strip():
+                raise ValueError("Data MPS di luar seksi")
+            return
+        token, awal, jumlah = _token(potongan)
+        if not len(token):
+            return
+        if self.seksi == b"ROWS":
+            self._jenis_baris.append(token[awal])
+            self._nama_baris.append(token[awal + 1])
+        elif self.seksi == b"OBJSENSE":
+            self.maksimasi = token[0].upper().startswith(b"MAX")
+        elif self.seksi == b"COLUMNS":
+            self._columns(token, awal, jumlah)
+        elif self.seksi in (b"RHS", b"RANGES"):
+            # Nama set (RHS/RNG) opsional: baris berisi 2/4 token tanpanya, 3/5 dengannya
+            geser = awal + jumlah % 2
+            dua = geser[jumlah - jumlah % 2 >= 4]
+            baris = np.concatenate([token[geser], token[dua + 2]])
+            nilai = np.concatenate([token[geser + 1], token[dua + 3]])
+            (self._rhs if self.seksi == b"RHS" else self._rng).append(
+                (self.cari_baris.indeks(baris, "Baris"), nilai.astype(np.float64)))
+        elif self.seksi == b"BOUNDS":
+            jenis = np.char.upper(token[awal])
+            butuh_nilai = ~np.isin(jenis, [b"FR", b"MI", b"PL", b"BV"])
+            dengan_set = jumlah >= 3 + butuh_nilai
+            kolom = token[awal + 1 + dengan_set]
+            indeks_nilai = np.minimum(awal + 2 + dengan_set, len(token) - 1)
+            nilai = np.where(jumlah > 1 + dengan_set + 1, token[indeks_nilai], b"0").astype(np.float64)
+            self._bnd.append((jenis, self.cari_kolom.indeks(kolom, "Kolom"), nilai))
+
+    def _columns(self, token, awal, jumlah):
+        penanda = token[np.minimum(awal + 1, len(token) - 1)] == b"'MARKER'"
+        # Status integer per baris: nilai penanda terakhir sebelumnya (INTORG=1, INTEND=0)
+        status = np.full(len(awal), self._integer_aktif)
+        if penanda.any():
+            posisi = np.flatnonzero(penanda)
+            nilai = token[awal[posisi] + 2] == b"'INTORG'"
+            terakhir = np.searchsorted(posisi, np.arange(len(awal)), side="right") - 1
+            status = np.where(terakhir >= 0, nilai[np.maximum(terakhir, 0)], self._integer_aktif)
+            self._integer_aktif = bool(nilai[-1])
+        data = ~penanda
+        awal, jumlah, status = awal[data], jumlah[data], status[data]
+        if not len(awal):
+            return
+
+        kolom = token[awal]
+        baru = np.empty(len(kolom), dtype=bool)
+        baru[0] = self._kolom_terakhir is None or kolom[0] != self._kolom_terakhir
+        baru[1:] = kolom[1:] != kolom[:-1]
+        self._kolom.append(kolom[baru])
+        self._int_kolom.append(status[baru])
+        indeks_kolom = self._jumlah_kolom - 1 + np.cumsum(baru)
+        self._jumlah_kolom += int(baru.sum())
+        self._kolom_terakhir = kolom[-1]
+
+        dua = jumlah >= 5
+        k = np.concatenate([indeks_kolom, indeks_kolom[dua]])
+        baris = self.peta_baris[self.cari_baris.indeks(
+            np.concatenate([token[awal + 1], token[awal[dua] + 3]]), "Baris")]
+        nilai = np.concatenate([token[awal + 2], token[awal[dua] + 4]]).astype(np.float64)
+        obj = baris == -1
+        self._c_k.append(k[obj])
+        self._c_v.append(nilai[obj])
+        kendala = baris >= 0
+        self._r.append(baris[kendala].astype(np.int32))
+        self._k.append(k[kendala].astype(np.int32))
+        self._v.append(nilai[kendala])
+
+    def _batas(self, n):
+        """Terapkan rekaman BOUNDS sesuai urutan berkas: rekaman terakhir per kolom yang menentukan."""
+        gabung = lambda i, tipe: np.concatenate([b[i] for b in self._bnd]) if self._bnd else np.zeros(0, dtype=tipe)
+        jenis, kolom, nilai = gabung(0, "S2"), gabung(1, np.int64), gabung(2, float)
+        dikenal = [b"FR", b"MI", b"PL", b"LO", b"LI", b"UP", b"UI", b"FX", b"BV"]
+        lainnya = ~np.isin(jenis, dikenal)
+        if lainnya.any():
+            raise ValueError(f"Jenis batas '{jenis[lainnya][0].decode()}' tidak didukung")
+        integer = self.integer.copy()
+        if not len(jenis):
+            return np.zeros(n), np.full(n, np.inf), integer
+        # Urutkan per kolom dengan sort stabil: di dalam satu kolom urutan berkas tetap terjaga
+        urut = np.argsort(kolom, kind="stable")
+        jenis, kolom, nilai = jenis[urut], kolom[urut], nilai[urut]
+        atas = np.isin(jenis, [b"UP", b"UI"])
+
+        # Nilai yang ditulis setiap rekaman ke batas bawah/atas (NaN = tidak mengubah)
+        ke_lb = np.full(len(jenis), np.nan)
+        ke_lb[np.isin(jenis, [b"FR", b"MI"])] = -np.inf
+        pilih = np.isin(jenis, [b"LO", b"LI", b"FX"])
+        ke_lb[pilih] = nilai[pilih]
+        ke_lb[jenis == b"BV"] = 0.0
+        ke_ub = np.full(len(jenis), np.nan)
+        ke_ub[np.isin(jenis, [b"FR", b"PL"])] = np.inf
+        pilih = atas | (jenis == b"FX")
+        ke_ub[pilih] = nilai[pilih]
+        ke_ub[jenis == b"BV"] = 1.0
+
+        # Konvensi MPS: UP negatif saat batas bawah masih 0 membuat batas bawah -inf.
+        # Batas bawah saat itu = penulis batas bawah terakhir sebelumnya di kolom yang sama.
+        posisi = np.arange(len(jenis))
+        sebelum = np.maximum.accumulate(np.where(np.isnan(ke_lb), -1, posisi))
+        sebelum = np.concatenate([[-1], sebelum[:-1]])
+        ada = (sebelum >= 0) & (kolom[np.maximum(sebelum, 0)] == kolom)
+        lb_saat_itu = np.where(ada, ke_lb[np.maximum(sebelum, 0)], 0.0)
+        ke_lb[atas & (nilai < 0) & (lb_saat_itu == 0)] = -np.inf
+
+        def terakhir(awal, tulis):
+            hasil = awal.copy()
+            i = np.flatnonzero(~np.isnan(tulis))
+            akhir = np.ones(len(i), dtype=bool)
+            akhir[:-1] = kolom[i][1:] != kolom[i][:-1]
+            hasil[kolom[i][akhir]] = tulis[i][akhir]
+            return hasil
+
+        integer[kolom[np.isin(jenis, [b"LI", b"UI", b"BV"])]] = True
+        return terakhir(np.zeros(n), ke_lb), terakhir(np.full(n, np.inf), ke_ub), integer
+
+    def model(self):
+        if self.seksi == b"COLUMNS":
+            self._tutup_columns()
+        if not hasattr(self, "nama_kolom"):
+            raise ValueError("Berkas MPS tidak memiliki seksi COLUMNS")
+        m, n = len(self.nama_baris), len(self.nama_kolom)
+        gabung = lambda daftar, tipe: np.concatenate(daftar) if daftar else np.zeros(0, dtype=tipe)
+        A = sps.csr_matrix((gabung(self._v, float), (gabung(self._r, np.int32), gabung(self._k, np.int32))),
+                           shape=(m, n))
+        c = np.zeros(n)
+        np.add.at(c, gabung(self._c_k, np.int64), gabung(self._c_v, float))
+
+        rhs = np.zeros(m)
+        konstanta = 0.0
+        for baris, nilai in self._rhs:
+            ada = self.peta_baris[baris] >= 0
+            rhs[self.peta_baris[baris][ada]] = nilai[ada]
+            obj = self.peta_baris[baris] == -1
+            if obj.any():
+                # RHS pada baris objektif: objektif = c·x − rhs
+                konstanta = -float(nilai[obj][-1])
+        jenis = self.jenis
+        bawah = np.where((jenis == b"G") | (jenis == b"E"), rhs, -np.inf)
+        atas = np.where((jenis == b"L") | (jenis == b"E"), rhs, np.inf)
+        for baris, nilai in self._rng:
+            i = self.peta_baris[baris]
+            ada = i >= 0
+            i, r, j = i[ada], nilai[ada], jenis[i[ada]]
+            bawah[i] = np.where(j == b"L", rhs[i] - np.abs(r), np.where((j == b"E") & (r < 0), rhs[i] + r, bawah[i]))
+            atas[i] = np.where(j == b"G", rhs[i] + np.abs(r), np.where((j == b"E") & (r > 0), rhs[i] + r, atas[i]))
+
+        lb, ub, integer = self._batas(n)
+        return ModelLP(c, A, bawah, atas, lb, ub, integer, self.nama_baris.astype(str), self.nama_kolom.astype(str),
+                       maksimasi=self.maksimasi, nama=self.nama, konstanta=konstanta)
+
+
+# Header seksi dimulai di kolom pertama; diawali "\n" literal agar regex memakai pencarian cepat
+_HEADER = re.compile(rb"\n[^\s*][^\n]*")
+_KOMENTAR = re.compile(rb"^\*.*(?:\n|$)", re.M)
+
+
+@contextmanager
+def _buka_baca(berkas):
+    if isinstance(berkas, (str, os.PathLike)):
+        with open(berkas, "rb") as f:
+            yield f
+    else:
+        yield berkas
+
+
+def baca_mps(berkas, ukuran_blok=UKURAN_BLOK):
+    """Baca berkas MPS (path atau objek biner) secara streaming menjadi ModelLP."""
+    pembaca = _PembacaMPS()
+    sisa = b""
+    with _buka_baca(berkas) as f:
+        while True:
+            blok = f.read(ukuran_blok)
+            data = sisa + blok
+            if blok:
+                potong = data.rfind(b"\n") + 1
+                if not potong:
+                    sisa = data
+                    continue
+                data, sisa = data[:potong], data[potong:]
+            else:
+                sisa = b""
+            if b"*" in data:
+                data = _KOMENTAR.sub(b"", data)
+            data = b"\n" + data
+            posisi = 0
+            for header in _HEADER.finditer(data):
+                pembaca.data(data[posisi:header.start()])
+                pembaca.header(header.group(0)[1:])
+                posisi = header.end()
+            pembaca.data(data[posisi:])
+            if not blok or pembaca.seksi == b"ENDATA":
+                break
+    return pembaca.model()
+
+
+# =========================
+# PEMBACAAN LP
+# =========================
+
+_TOKEN_LP = re.compile(r"""
+    (?P<angka>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<op><=|>=|=<|=>|<|>|=)
+  | (?P<tanda>[+-])
+  | (?P<titik_dua>:)
+  | (?P<nama>[A-Za-z_!"#$%&()/,.;?@'`{}|~][A-Za-z0-9_!"#$%&()/,.;?@'`{}|~\[\]]*)
+""", re.X)
+
+_SEKSI_LP = {
+    "maximize": "obj_maks", "maximise": "obj_maks", "maximum": "obj_maks", "max": "obj_maks",
+    "minimize": "obj_min", "minimise": "obj_min", "minimum": "obj_min", "min": "obj_min",
+    "subject to": "kendala", "such that": "kendala", "st": "kendala", "s.t.": "kendala", "st.": "kendala",
+    "bounds": "batas", "bound": "batas",
+    "generals": "integer", "general": "integer", "gen": "integer", "integers": "integer",
+    "binaries": "biner", "binary": "biner", "bin": "biner",
+    "end": "akhir",
+}
+
+
+def _nilai_lp(tok):
+    jenis, teks = tok
+    if jenis == "angka":
+        return float(teks)
+    if jenis == "nama" and teks.lower() in ("inf", "infinity"):
+        return np.inf
+    return None
+
+
+def baca_lp(berkas):
+    """Baca berkas format LP (path atau objek biner/teks) menjadi ModelLP."""
+    kolom = {}
+    nama_baris, bawah, atas = [], array("d"), array("d")
+    r, k, v = array("i"), array("i"), array("d")
+    c = {}
+    batas = {}
+    integer, biner = set(), set()
+    maksimasi = False
+    konstanta = [0.0]
+
+    def indeks_kolom(nama):
+        if nama not in kolom:
+            kolom[nama] = len(kolom)
+        return kolom[nama]
+
+    def ekspresi(token, mulai, konstanta=None):
+        """Uraikan suku linear mulai dari token[mulai]; kembalikan ({nama: koef}, posisi berikutnya).
+
+        Suku konstan hanya diizinkan bila `konstanta` (list satu elemen, ditambahkan) diberikan.
+        """
+        suku = {}
+        i = mulai
+        while i < len(token):
+            tanda = 1.0
+            while i < len(token) and token[i][0] == "tanda":
+                tanda *= -1.0 if token[i][1] == "-" else 1.0
+                i += 1
+            koef = 1.0
+            if i < len(token) and token[i][0] == "angka":
+                koef = float(token[i][1])
+                i += 1
+            if i < len(token) and token[i][0] == "nama":
+                suku[token[i][1]] = suku.get(token[i][1], 0.0) + tanda * koef
+                i += 1
+            elif konstanta is not None and i > 0 and token[i - 1][0] == "angka":
+                konstanta[0] += tanda * koef
+            elif koef != 1.0 or tanda != 1.0:
+                raise ValueError("Konstanta di ekspresi LP tidak didukung")
+            if i >= len(token) or token[i][0] != "tanda":
+                break
+        return suku, i
+
+    def pernyataan_kendala(token):
+        nama = None
+        if len(token) > 1 and token[1][0] == "titik_dua":
+            nama, token = token[0][1], token[2:]
+        suku, i = ekspresi(token, 0)
+        if i + 1 >= len(token) or token[i][0] != "op":
+            raise ValueError(f"Kendala LP tidak lengkap: {nama or ''}")
+        op = token[i][1]
+        tanda = -1.0 if token[i + 1] == ("tanda", "-") else 1.0
+        rhs = tanda * _nilai_lp(token[i + 1 + (token[i + 1][0] == "tanda")])
+        baris = len(nama_baris)
+        nama_baris.append(nama or f"R{baris + 1}")
+        bawah.append(rhs if op in (">=", "=>", ">", "=") else -np.inf)
+        atas.append(rhs if op in ("<=", "=<", "<", "=") else np.inf)
+        for n, a in suku.items():
+            r.append(baris), k.append(indeks_kolom(n)), v.append(a)
+
+    def pernyataan_batas(token):
+        angka = lambda t: -_nilai_lp(t[1]) if t[0] == ("tanda", "-") else _nilai_lp(t[0] if t[0][0] != "tanda" else t[1])
+        teks = [t[1].lower() for t in token]
+        if len(token) == 2 and teks[1] == "free":
+            batas[token[0][1]] = (-np.inf, np.inf)
+            return
+        # Pisahkan menurut operator: [nilai op] nama [op nilai]
+        bagian, op = [[]], []
+        for t in token:
+            if t[0] == "op":
+                op.append(t[1])
+                bagian.append([])
+            else:
+                bagian[-1].append(t)
+        lb, ub = batas.get(next(t[1] for b in bagian for t in b if t[0] == "nama"
+                                and t[1].lower() not in ("inf", "infinity")), (0.0, np.inf))
+        if len(bagian) == 3:
+            nama = bagian[1][0][1]
+            lb, ub = angka(bagian[0]), angka(bagian[2])
+        elif bagian[0] and bagian[0][0][0] == "nama" and bagian[0][0][1].lower() not in ("inf", "infinity"):
+            nama, nilai = bagian[0][0][1], angka(bagian[1])
+            if op[0] in ("<=", "=<", "<"):
+                ub = nilai
+            elif op[0] in (">=", "=>", ">"):
+                lb = nilai
+            else:
+                lb = ub = nilai
+        else:
+            nama, nilai = bagian[1][0][1], angka(bagian[0])
+            if op[0] in ("<=", "=<", "<"):
+                lb = nilai
+            elif op[0] in (">=", "=>", ">"):
+                ub = nilai
+            else:
+                lb = ub = nilai
+        batas[nama] = (lb, ub)
+
+    seksi = None
+    tertunda = []
+    with _buka_baca(berkas) as f:
+        teks = f if isinstance(f, io.TextIOBase) else io.TextIOWrapper(f, encoding="ascii", errors="replace")
+        for baris_teks in teks:
+            baris_teks = baris_teks.split("\\", 1)[0].strip()
+            if not baris_teks:
+                continue
+            kecil = baris_teks.lower()
+            kunci = next((s for s in (kecil, " ".join(kecil.split()[:2])) if s in _SEKSI_LP), None)
+            if kunci is not None:
+                seksi = _SEKSI_LP[kunci]
+                if seksi in ("obj_maks", "obj_min"):
+                    maksimasi = seksi == "obj_maks"
+                if seksi == "akhir":
+                    break
+                continue
+            token = [(m.lastgroup, m.group()) for m in _TOKEN_LP.finditer(baris_teks)]
+            if seksi in ("obj_maks", "obj_min"):
+                if len(token) > 1 and token[1][0] == "titik_dua":
+                    token = token[2:]
+                suku, _ = ekspresi(token, 0, konstanta)
+                for n, a in suku.items():
+                    c[indeks_kolom(n)] = c.get(indeks_kolom(n), 0.0) + a
+            elif seksi == "kendala":
+                # Kendala boleh terbentang beberapa baris: selesai setelah operator dan ruas kanan
+                tertunda.extend(token)
+                ops = [i for i, t in enumerate(tertunda) if t[0] == "op"]
+                if ops and len(tertunda) > ops[0] + 1 and tertunda[-1][0] != "tanda":
+                    pernyataan_kendala(tertunda)
+                    tertunda = []
+            elif seksi == "batas":
+                pernyataan_batas(token)
+            elif seksi in ("integer", "biner"):
+                nama = [t[1] for t in token if t[0] == "nama"]
+                for n in nama:
+                    indeks_kolom(n)
+                (integer if seksi == "integer" else biner).update(nama)
+
+    n = len(kolom)
+    nama_kolom = list(kolom)
+    lb, ub = np.zeros(n), np.full(n, np.inf)
+    for nama, (l, u) in batas.items():
+        j = indeks_kolom(nama) if nama in kolom else None
+        if j is not None:
+            lb[j], ub[j] = l, u
+    tanda_int = np.zeros(n, dtype=bool)
+    for nama in integer | biner:
+        tanda_int[kolom[nama]] = True
+    for nama in biner:
+        lb[kolom[nama]], ub[kolom[nama]] = 0.0, 1.0
+    vektor_c = np.zeros(n)
+    for j, a in c.items():
+        vektor_c[j] = a
+    A = sps.csr_matrix((np.frombuffer(v, dtype=float), (np.frombuffer(r, dtype=np.int32),
+                                                        np.frombuffer(k, dtype=np.int32))), shape=(len(nama_baris), n))
+    return ModelLP(vektor_c, A, np.frombuffer(bawah, dtype=float), np.frombuffer(atas, dtype=float), lb, ub, tanda_int,
+                   nama_baris, nama_kolom, maksimasi=maksimasi, konstanta=konstanta[0])
+
+
+def baca(berkas, format=None):
+    """Baca MPS atau LP; format ditebak dari ekstensi nama berkas bila tidak diberikan."""
+    if format is None:
+        nama = str(getattr(berkas, "name", berkas)).lower()
+        format = "lp" if nama.endswith(".lp") else "mps"
+    return baca_lp(berkas) if format == "lp" else baca_mps(berkas)
+
+
+# =========================
+# CLI
+# =========================
+
+def _model_acak(m, n, kepadatan, seed=0):
+    rng = np.random.default_rng(seed)
+    A = sps.random(m, n, density=kepadatan, random_state=rng, format="csr")
+    A.data = np.round(rng.uniform(0.1, 5, A.nnz), 3)
+    integer = np.zeros(n, dtype=bool)
+    integer[: n // 10] = True
+    atas = np.round(rng.uniform(100, 1000, m), 2)
+    bawah = np.full(m, -np.inf)
+    bawah[::7] = 1.0
+    ub = np.full(n, np.inf)
+    ub[::5] = 50
+    return ModelLP(np.round(rng.uniform(1, 10, n), 2), A, bawah, atas, batas_atas=ub, integer=integer,
+                   maksimasi=True, nama="acak")
+
+
+def _sama(a, b):
+    return (a.ukuran == b.ukuran and a.maksimasi == b.maksimasi and np.array_equal(a.c, b.c)
+            and a.konstanta == b.konstanta
+            and abs(a.A - b.A).max() == 0 and np.array_equal(a.baris_bawah, b.baris_bawah)
+            and np.array_equal(a.baris_atas, b.baris_atas) and np.array_equal(a.batas_bawah, b.batas_bawah)
+            and np.array_equal(a.batas_atas, b.batas_atas) and np.array_equal(a.integer, b.integer))
+
+
+def uji(direktori):
+    """Uji pulang-pergi MPS/LP dan kecepatan baca MPS; kembalikan exit code."""
+    gagal = False
+    produksi = ModelLP.dari_produksi([90000, 20000], [[1, 0.5], [2, 2], [2, 1]], [180, 400, 220],
+                                     ["banner", "brosur"], ["waktu mesin", "bahan baku", "tenaga kerja"], bulat=True)
+    harapan = produksi.selesaikan()["objektif"]
+    for format in ("mps", "lp"):
+        hasil = baca(io.BytesIO(ke_bytes(produksi, format)), format).selesaikan()["objektif"]
+        status = "OK" if abs(hasil - harapan) < 1e-6 else "GAGAL"
+        gagal |= status == "GAGAL"
+        print(f"produksi {format}: objektif {hasil:,.0f} (harapan {harapan:,.0f}) {status}")
+
+    acak = _model_acak(300, 200, 0.05)
+    for format in ("mps", "lp"):
+        ulang = baca(io.BytesIO(ke_bytes(acak, format)), format)
+        if format == "lp":
+            # Baris berentang menjadi dua kendala; bandingkan nilai optimumnya saja
+            status = "OK" if abs(ulang.selesaikan()["objektif"] - acak.selesaikan()["objektif"]) < 1e-6 else "GAGAL"
+        else:
+            # Blok kecil memaksa batas blok jatuh di tengah seksi
+            kecil = baca_mps(io.BytesIO(ke_bytes(acak, format)), ukuran_blok=4096)
+            status = "OK" if _sama(acak, ulang) and _sama(acak, kecil) else "GAGAL"
+        gagal |= status == "GAGAL"
+        print(f"acak 300x200 {format}: {status}")
+
+    besar = _model_acak(200000, 50000, 1e-4, seed=1)
+    jalur = os.path.join(direktori, "uji_besar.mps")
+    tulis_mps(besar, jalur)
+    ukuran = os.path.getsize(jalur) / 1e6
+    t = time.perf_counter()
+    ulang = baca_mps(jalur)
+    durasi = time.perf_counter() - t
+    status = "OK" if _sama(besar, ulang) else "GAGAL"
+    gagal |= status == "GAGAL"
+    print(f"baca MPS {ukuran:.0f} MB ({besar.A.nnz:,} nonzero): {durasi:.2f} s, {ukuran / durasi:.0f} MB/s {status}")
+    os.remove(jalur)
+    return 1 if gagal else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi dan penyelesaian model MPS/LP")
+    parser.add_argument("masukan", nargs="?", help="berkas .mps atau .lp")
+    parser.add_argument("--keluaran", help="tulis ulang model ke berkas .mps/.lp")
+    parser.add_argument("--selesaikan", action="store_true", help="selesaikan model dengan HiGHS")
+    parser.add_argument("--uji", action="store_true", help="jalankan uji mandiri")
+    args = parser.parse_args(argv)
+
+    if args.uji:
+        import tempfile
+        with tempfile.TemporaryDirectory() as direktori:
+            return uji(direktori)
+    if not args.masukan:
+        parser.error("berkas masukan diperlukan")
+
+    t = time.perf_counter()
+    model = baca(args.masukan)
+    m, n, nnz, n_int = model.ukuran
+    print(f"{model.nama}: {m:,} baris, {n:,} kolom, {nnz:,} nonzero, {n_int:,} integer "
+          f"(dibaca dalam {time.perf_counter() - t:.2f} s)", file=sys.stderr)
+    if args.keluaran:
+        (tulis_lp if args.keluaran.lower().endswith(".lp") else tulis_mps)(model, args.keluaran)
+    if args.selesaikan:
+        hasil = model.selesaikan()
+        print(f"{hasil['pesan']} objektif = {hasil['objektif']}")
+        return 0 if hasil["sukses"] else 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
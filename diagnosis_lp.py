@@ -0,0 +1,210 @@
+"""Diagnosis LP produksi yang gagal: subset kendala tak tereduksi (IIS) dan relaksasi terkecil.
+
+LP tidak layak diperiksa lewat LP elastis
+
+    min Σ s_i   s.t.  A x − s <= b,  s >= 0   (batas variabel ikut sebagai baris, x bebas)
+
+yang selalu layak. Nilai s optimum adalah relaksasi total (L1) terkecil yang
+membuat LP layak; dual-nya (sertifikat Farkas) menunjuk subset kendala yang
+sudah tidak layak. Filter penghapusan lalu menjalankan subset itu ulang tanpa
+satu kendala demi satu kendala. linprog tidak menerima basis awal, jadi setiap
+penyelesaian ulang "di-warm-start" dengan sertifikat sebelumnya: bila subset
+masih tidak layak, semua kandidat di luar dukungan sertifikat baru langsung
+dibuang, sehingga jumlah LP yang diselesaikan mendekati ukuran IIS, bukan
+jumlah kendala.
+
+Batas nonnegatif x >= 0 bukan sesuatu yang bisa dilonggarkan pengguna: batas ini
+kaku dalam LP relaksasi dan hanya diberi label bila termasuk IIS.
+"""
+import numpy as np
+import scipy.sparse as sps
+from scipy.optimize import linprog
+
+TOLERANSI = 1e-9
+
+
+def _normalkan_batas(bounds, n):
+    """Bentuk `bounds` linprog (None, satu pasangan, atau daftar pasangan) sebagai daftar n pasangan."""
+    if bounds is None:
+        bounds = (0, None)
+    if len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)):
+        return [tuple(bounds)] * n
+    return [tuple(bb) for bb in bounds]
+
+
+def _baris_batas(bounds, n):
+    """Batas variabel sebagai baris G x <= h beserta label (indeks variabel, 'bawah'/'atas')."""
+    baris, kolom, nilai, h, label = [], [], [], [], []
+    for j, (bawah, atas) in enumerate(bounds):
+        if bawah is not None and np.isfinite(bawah):
+            baris.append(len(h)), kolom.append(j), nilai.append(-1.0), h.append(-float(bawah))
+            label.append((j, "bawah"))
+        if atas is not None and np.isfinite(atas):
+            baris.append(len(h)), kolom.append(j), nilai.append(1.0), h.append(float(atas))
+            label.append((j, "atas"))
+    G = sps.csr_matrix((nilai, (baris, kolom)), shape=(len(h), n))
+    return G, np.array(h, dtype=float), label
+
+
+def _elastis(M, h, subset, kaku=()):
+    """LP elastis pada baris `subset` (baris `kaku` tanpa pelonggaran); kembalikan (jumlah_s, s, y)
+    dengan y pengali Farkas per baris subset, atau (None, None, None) bila baris kaku saja tidak layak."""
+    k = len(subset)
+    if not k:
+        return 0.0, np.zeros(0), np.zeros(0)
+    n = M.shape[1]
+    kaku = list(kaku)
+    A = sps.vstack([sps.hstack([M[subset], -sps.identity(k, format="csr")]),
+                    sps.hstack([M[kaku], sps.csr_matrix((len(kaku), k))])], format="csr")
+    c = np.concatenate([np.zeros(n), np.ones(k)])
+    res = linprog(c, A_ub=A, b_ub=np.concatenate([h[subset], h[kaku]]),
+                  bounds=[(None, None)] * n + [(0, None)] * k, method="highs")
+    if not res.success:
+        return None, None, None
+    return float(res.fun), res.x[n:], -res.ineqlin.marginals[:k]
+
+
+def _dukungan(y, subset):
+    return [subset[i] for i in np.flatnonzero(y > TOLERANSI)]
+
+
+def iis(M, h):
+    """Indeks baris IIS dari sistem M x <= h yang tidak layak (filter penghapusan + pemangkasan Farkas)."""
+    semua = list(range(M.shape[0]))
+    jumlah, _, y = _elastis(M, h, semua)
+    if jumlah <= TOLERANSI:
+        return []
+    wajib, sisa = [], _dukungan(y, semua)
+    while sisa:
+        i = sisa.pop(0)
+        coba = wajib + sisa
+        jumlah, _, y = _elastis(M, h, coba)
+        if jumlah <= TOLERANSI:
+            # Tanpa baris i sistem layak: i termasuk setiap subset tidak layak yang tersisa
+            wajib.append(i)
+        else:
+            # Masih tidak layak tanpa i: cukup pertahankan kandidat di dukungan sertifikat baru
+            dukungan = set(_dukungan(y, coba))
+            sisa = [k for k in sisa if k in dukungan]
+    return sorted(wajib)
+
+
+def diagnosa(c, A_ub, b_ub, bounds=(0, None), nama_kendala=None, nama_variabel=None):
+    """Diagnosis LP min c·x, A_ub x <= b_ub, bounds.
+
+    Mengembalikan dict dengan `status`:
+    - "layak": LP punya optimum;
+    - "tidak_layak": `iis` (daftar dict nama/jenis/batas; jenis "kendala", "batas" atau
+      "nonnegatif" untuk x >= 0), `relaksasi` (pelonggaran total terkecil per kendala, batas
+      nonnegatif tidak ikut dilonggarkan) dan `relaksasi_tunggal` (pelonggaran bila hanya
+      kendala itu yang diubah di antara baris IIS; tanpa batas nonnegatif);
+    - "tak_terbatas": `variabel` yang dapat tumbuh tanpa batas sambil menaikkan keuntungan.
+    """
+    A = sps.csr_matrix(np.asarray(A_ub, dtype=float) if not sps.issparse(A_ub) else A_ub)
+    b = np.asarray(b_ub, dtype=float)
+    c = np.asarray(c, dtype=float)
+    m, n = A.shape
+    nama_kendala = list(nama_kendala) if nama_kendala is not None else [f"Kendala {i + 1}" for i in range(m)]
+    nama_variabel = list(nama_variabel) if nama_variabel is not None else [f"x{j + 1}" for j in range(n)]
+
+    bounds = _normalkan_batas(bounds, n)
+    res = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method="highs")
+    if res.status == 0:
+        return {"status": "layak"}
+
+    G, h_batas, label_batas = _baris_batas(bounds, n)
+    M = sps.vstack([A, G], format="csr")
+    h = np.concatenate([b, h_batas])
+    nonnegatif = {m + k for k, (_, sisi) in enumerate(label_batas) if sisi == "bawah" and h_batas[k] == 0}
+    elastis = [i for i in range(M.shape[0]) if i not in nonnegatif]
+    jumlah, s, _ = _elastis(M, h, elastis, kaku=sorted(nonnegatif))
+
+    if jumlah <= TOLERANSI:
+        # Layak tetapi gagal: tak terbatas. Batasi variabel dengan kotak besar untuk melihat arah sinarnya.
+        skala = 1e6 * max(1.0, float(np.abs(b).max(initial=0.0)))
+        kotak = [(-skala if bawah is None else bawah, skala if atas is None else atas) for bawah, atas in bounds]
+        res = linprog(c, A_ub=A, b_ub=b, bounds=kotak, method="highs")
+        if not res.success:
+            return {"status": "lain", "pesan": res.message}
+        tumbuh = np.flatnonzero(np.abs(res.x) >= 0.5 * skala)
+        return {"status": "tak_terbatas", "variabel": [nama_variabel[j] for j in tumbuh]}
+
+    def keterangan(i):
+        if i < m:
+            return {"nama": nama_kendala[i], "jenis": "kendala", "batas": float(b[i])}
+        j, sisi = label_batas[i - m]
+        tanda, nilai = (">=", -h[i]) if sisi == "bawah" else ("<=", h[i])
+        jenis = "nonnegatif" if i in nonnegatif else "batas"
+        return {"nama": f"{nama_variabel[j]} {tanda} {nilai + 0:g}", "jenis": jenis, "batas": float(nilai)}
+
+    anggota = iis(M, h)
+    relaksasi_tunggal = {}
+    for i in anggota:
+        if i in nonnegatif:
+            continue
+        # Hanya baris i yang elastis, baris IIS lainnya kaku: LP kecil berukuran IIS
+        jumlah_i, _, _ = _elastis(M, h, [i], kaku=[k for k in anggota if k != i])
+        relaksasi_tunggal[keterangan(i)["nama"]] = jumlah_i
+
+    return {
+        "status": "tidak_layak",
+        "iis": [keterangan(i) for i in anggota],
+        "relaksasi": {keterangan(elastis[k])["nama"]: float(s[k]) for k in np.flatnonzero(s > TOLERANSI)},
+        "relaksasi_tunggal": relaksasi_tunggal,
+    }
+
+
+def tampilkan(c, A_ub, b_ub, bounds=(0, None), nama_kendala=None, nama_variabel=None):
+    """Tampilkan hasil `diagnosa` di aplikasi Streamlit (dipakai di cabang optimasi gagal)."""
+    import streamlit as st
+
+    hasil = diagnosa(c, A_ub, b_ub, bounds, nama_kendala, nama_variabel)
+    if hasil["status"] == "tak_terbatas":
+        st.warning("🔎 Masalah tak terbatas: " + ", ".join(hasil["variabel"])
+                   + " dapat diproduksi tanpa batas. Pastikan setiap produk memakai sumber daya yang terbatas "
+                     "(koefisien pemakaian > 0).")
+    elif hasil["status"] == "tidak_layak":
+        st.warning("🔎 Batasan berikut saling bertentangan (subset minimal; membuang salah satunya membuat "
+                   "masalah layak): " + ", ".join(
+                       k["nama"] + (" (batas nonnegatif)" if k["jenis"] == "nonnegatif" else "") for k in hasil["iis"]))
+        st.dataframe([{"Batasan": k["nama"], "Nilai sekarang": k["batas"],
+                       "Pelonggaran bila hanya ini yang diubah": hasil["relaksasi_tunggal"].get(k["nama"])}
+                      for k in hasil["iis"] if k["jenis"] != "nonnegatif"])
+        st.caption("Pelonggaran total terkecil: " + ", ".join(
+            f"{nama} +{nilai:,.4g}" for nama, nilai in hasil["relaksasi"].items()))
+    elif hasil["status"] == "lain":
+        st.warning(f"🔎 {hasil['pesan']}")
+    return hasil
+
+
+def main():
+    """Uji mandiri: konflik yang disisipkan harus ditemukan sebagai IIS pada model acak besar."""
+    import time
+
+    rng = np.random.default_rng(0)
+    m, n = 3000, 600
+    A = sps.random(m, n, density=0.01, random_state=rng, format="csr")
+    A.data = rng.uniform(0.1, 5, A.nnz)
+    b = rng.uniform(100, 1000, m)
+    # Konflik: x0 + x1 <= 10 dan -(x0 + x1) <= -20 (permintaan minimum)
+    konflik = sps.csr_matrix(np.array([[1.0, 1.0] + [0.0] * (n - 2), [-1.0, -1.0] + [0.0] * (n - 2)]))
+    A = sps.vstack([A, konflik], format="csr")
+    b = np.append(b, [10.0, -20.0])
+    c = -rng.uniform(1, 10, n)
+
+    t = time.perf_counter()
+    hasil = diagnosa(c, A, b)
+    durasi = time.perf_counter() - t
+    nama = sorted(k["nama"] for k in hasil.get("iis", []))
+    harapan = [f"Kendala {m + 1}", f"Kendala {m + 2}"]
+    ok = hasil["status"] == "tidak_layak" and nama == harapan and abs(sum(hasil["relaksasi"].values()) - 10) < 1e-6
+    print(f"IIS {nama}, relaksasi {hasil.get('relaksasi')}, {durasi:.3f} s: {'OK' if ok else 'GAGAL'}")
+
+    tak_terbatas = diagnosa([-1.0, -1.0], [[1.0, 0.0]], [5.0], nama_variabel=["x", "y"])
+    ok2 = tak_terbatas == {"status": "tak_terbatas", "variabel": ["y"]}
+    print(f"Tak terbatas {tak_terbatas}: {'OK' if ok2 else 'GAGAL'}")
+    return 0 if ok and ok2 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
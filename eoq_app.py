@@ -1,6 +1,8 @@
 import streamlit as st
 import matplotlib.pyplot as plt
-import numpy as np
+import model_inti
+import penyimpanan_skenario
+import peramalan
 
 st.title("Aplikasi Studi Kasus Industri")
 
@@ -13,20 +15,57 @@ menu = st.radio("📌 Pilih Studi Kasus:",
 if menu == "Pengadaan Karet (EOQ)":
     st.header("Pengadaan Karet - EOQ")
 
-    # Input
-    D = st.number_input("Permintaan Tahunan (unit)", value=10000)
+    # Input: permintaan tahunan diketik atau diramal dari riwayat penjualan harian
+    sumber = st.radio("Sumber permintaan tahunan", ["Input manual", "Ramalan dari riwayat penjualan"],
+                      horizontal=True)
+    ramalan = peramalan.tampilkan_unggah("ramalan_eoq") if sumber != "Input manual" else None
+    if ramalan is not None:
+        nama_item, tanggal_awal, riwayat, model = ramalan
+        i = st.selectbox("Item", range(len(nama_item)), format_func=lambda i: nama_item[i])
+        D = round(float(model["D"][i]))
+        st.write(f"🔹 Ramalan permintaan {peramalan.HORIZON} hari ke depan "
+                 f"({peramalan.NAMA_METODE[model['metode'][i]]}) = **{D:,} unit**")
+    else:
+        D = st.number_input("Permintaan Tahunan (unit)", value=10000)
     S = st.number_input("Biaya Pemesanan per Order (Rp)", value=50000)
     H = st.number_input("Biaya Penyimpanan per Unit per Tahun (Rp)", value=2000)
 
-    # Perhitungan EOQ
-    EOQ = int(np.sqrt((2 * D * S) / H))
-
+    # Perhitungan EOQ (skenario yang sama diambil dari penyimpanan skenario)
     st.subheader("Hasil Perhitungan:")
-    st.write(f"🔹 EOQ (Jumlah Ekonomis Pemesanan) = **{EOQ} unit**")
+    ada_eoq = min(D, S, H) > 0
+    if ada_eoq:
+        hasil, _ = penyimpanan_skenario.bawaan().atau_hitung("eoq", {"D": D, "S": S, "H": H},
+                                                              lambda: model_inti.eoq(D, S, H))
+        EOQ = int(hasil["EOQ"])
+        st.write(f"🔹 EOQ (Jumlah Ekonomis Pemesanan) = **{EOQ} unit**")
+    elif ramalan is not None and D <= 0:
+        st.warning("Ramalan permintaan item ini 0 unit (item berhenti dijual atau terus menurun); "
+                   "EOQ tidak dihitung karena tidak ada yang perlu dipesan.")
+    else:
+        st.info("Isi D, S, dan H yang positif untuk menghitung EOQ.")
+
+    if ramalan is not None:
+        # Varians ramalan selama lead time menentukan stok pengaman dan titik pesan ulang
+        col1, col2 = st.columns(2)
+        lead_time = col1.number_input("Lead time (hari)", min_value=0, max_value=365, value=7)
+        layanan = col2.slider("Tingkat layanan siklus", 0.80, 0.999, 0.95)
+        rencana = peramalan.rencana_persediaan(model, S, H, lead_time, layanan, indeks=[i])
+        st.write(f"🔹 Stok Pengaman = **{rencana['SS'][0]:,.0f} unit** "
+                 f"(σ permintaan selama lead time {rencana['sigma_L'][0]:,.1f} unit)")
+        st.write(f"🔹 Titik Pesan Ulang = **{rencana['ROP'][0]:,.0f} unit**")
+
+        fig_ramalan, ax_ramalan = plt.subplots(figsize=(8, 3.5))
+        peramalan.gambar_ramalan(ax_ramalan, nama_item, tanggal_awal, riwayat, model, i)
+        st.pyplot(fig_ramalan)
+        plt.close(fig_ramalan)
 
     # Grafik Batang Permintaan vs EOQ
-    fig, ax = plt.subplots()
-    ax.bar(["Permintaan", "EOQ"], [D, EOQ], color=["red", "green"])
-    ax.set_title("EOQ dan Permintaan Tahunan")
-    ax.set_ylabel("Jumlah Unit")
-    st.pyplot(fig)
+    if ada_eoq:
+        fig, ax = plt.subplots()
+        ax.bar(["Permintaan", "EOQ"], [D, EOQ], color=["red", "green"])
+        ax.set_title("EOQ dan Permintaan Tahunan")
+        ax.set_ylabel("Jumlah Unit")
+        st.pyplot(fig)
+        plt.close(fig)
+
+    penyimpanan_skenario.tampilkan_riwayat("eoq")
@@ -1,21 +1,44 @@
-mport streamlit as st
+import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+import peramalan
+import peta_kontur
+import sensitivitas_eoq
+import volume_3d
 
 st.set_page_config(page_title="EOQ Brosur & Banner", layout="centered")
 
 st.title("📦 EOQ Brosur & Banner - CV Kreatif Media")
 st.markdown("Hitung jumlah pemesanan optimal untuk dua produk agar biaya persediaan minimum.")
 
+# Permintaan tahunan bisa diambil dari ramalan riwayat penjualan harian
+ramalan = None
+if st.checkbox("📈 Ambil permintaan tahunan dari ramalan riwayat penjualan"):
+    ramalan = peramalan.tampilkan_unggah("ramalan_brosur_banner")
+if ramalan is not None:
+    nama_item, tanggal_awal, riwayat, model = ramalan
+    col1, col2 = st.columns(2)
+    i_brosur = col1.selectbox("Item brosur", range(len(nama_item)), format_func=lambda i: nama_item[i])
+    i_banner = col2.selectbox("Item banner", range(len(nama_item)), index=min(1, len(nama_item) - 1),
+                              format_func=lambda i: nama_item[i])
+
 # Input Data Brosur
 st.subheader("📘 Input Data - Brosur")
-D1 = st.number_input("Permintaan tahunan brosur (unit)", value=12000)
+if ramalan is not None:
+    D1 = float(model["D"][i_brosur])
+    st.write(f"Permintaan tahunan brosur (ramalan): **{D1:,.0f} unit**")
+else:
+    D1 = st.number_input("Permintaan tahunan brosur (unit)", value=12000)
 S1 = st.number_input("Biaya pemesanan per order (Rp)", value=150000)
 H1 = st.number_input("Biaya penyimpanan per unit per tahun (Rp)", value=500)
 
 # Input Data Banner
 st.subheader("📙 Input Data - Banner")
-D2 = st.number_input("Permintaan tahunan banner (unit)", value=3000)
+if ramalan is not None:
+    D2 = float(model["D"][i_banner])
+    st.write(f"Permintaan tahunan banner (ramalan): **{D2:,.0f} unit**")
+else:
+    D2 = st.number_input("Permintaan tahunan banner (unit)", value=3000)
 S2 = st.number_input("Biaya pemesanan per order (Rp)", value=180000)
 H2 = st.number_input("Biaya penyimpanan per unit per tahun (Rp)", value=2000)
 
@@ -38,6 +61,17 @@ st.write(f"**Total Biaya Persediaan Banner**: Rp {cost2:,.0f}")
 
 st.success(f"📊 Total Biaya Persediaan Tahunan: Rp {total:,.0f}")
 
+if ramalan is not None:
+    st.markdown("## 🛡️ Stok Pengaman & Titik Pesan Ulang")
+    col1, col2 = st.columns(2)
+    lead_time = col1.number_input("Lead time (hari)", min_value=0, max_value=365, value=7)
+    layanan = col2.slider("Tingkat layanan siklus", 0.80, 0.999, 0.95)
+    for nama, i, S, H in (("Brosur", i_brosur, S1, H1), ("Banner", i_banner, S2, H2)):
+        rencana = peramalan.rencana_persediaan(model, S, H, lead_time, layanan, indeks=[i])
+        st.write(f"**{nama}** ({nama_item[i]}, {peramalan.NAMA_METODE[model['metode'][i]]}): "
+                 f"stok pengaman {rencana['SS'][0]:,.0f} unit, titik pesan ulang {rencana['ROP'][0]:,.0f} unit "
+                 f"(σ lead time {rencana['sigma_L'][0]:,.1f} unit)")
+
 # --------------------
 # 📈 Grafik Kurva EOQ
 # --------------------
@@ -65,3 +99,83 @@ ax.legend()
 ax.grid(True)
 
 st.pyplot(fig)
+plt.close(fig)
+
+# --------------------
+# 🧭 Sensitivitas D × S × H
+# --------------------
+st.markdown("## 🧭 Sensitivitas EOQ terhadap D, S, dan H")
+
+
+@st.cache_resource(max_entries=4)
+def tensor_sensitivitas(D, S, H, persen, resolusi):
+    """Tensor EOQ & biaya minimum dihitung sekali per (parameter, rentang, resolusi); ganti irisan hanya mengindeks."""
+    sumbu = tuple(sensitivitas_eoq.grid_sekitar(v, persen / 100, resolusi) for v in (D, S, H))
+    T = sensitivitas_eoq.tensor_eoq(*sumbu)
+    return sumbu, T, [volume_3d.rentang_nilai(T[k]) for k in range(len(sensitivitas_eoq.BESARAN))]
+
+
+produk = st.radio("Produk", ["Brosur", "Banner"], horizontal=True)
+D0, S0, H0, Q0 = (D1, S1, H1, EOQ1) if produk == "Brosur" else (D2, S2, H2, EOQ2)
+col1, col2 = st.columns(2)
+persen = col1.slider("Rentang variasi parameter (±%)", 10, 90, 50, step=10)
+resolusi = col2.select_slider("Resolusi grid per sumbu", [50, 100, 200], value=200)
+
+if min(D0, S0, H0) <= 0:
+    st.info("Isi D, S, dan H yang positif untuk melihat sensitivitas.")
+else:
+    sumbu, tensor, rentang = tensor_sensitivitas(float(D0), float(S0), float(H0), persen, resolusi)
+    satuan = {"D": "D (unit/tahun)", "S": "S (Rp/order)", "H": "H (Rp/unit/tahun)"}
+    pilihan_besaran = {"EOQ (unit/order)": "EOQ", "Biaya total minimum (Rp)": "TC",
+                       f"Kenaikan biaya bila tetap memesan {Q0:.0f} unit (%)": "kenaikan"}
+    col1, col2 = st.columns(2)
+    label_besaran = col1.radio("Tampilkan", list(pilihan_besaran))
+    poros = col2.radio("Iris pada sumbu", list(sensitivitas_eoq.SUMBU), index=2, horizontal=True)
+    besaran = pilihan_besaran[label_besaran]
+    k = sensitivitas_eoq.SUMBU.index(poros)
+    dasar = (D0, S0, H0)
+    indeks = st.select_slider(f"Nilai {poros} irisan", options=range(resolusi),
+                              value=volume_3d.indeks_terdekat(sumbu[k], dasar[k]),
+                              format_func=lambda i: f"{sumbu[k][i]:,.0f}")
+
+    nama_h, nilai_h, nama_v, nilai_v, Z = sensitivitas_eoq.irisan(tensor, sumbu, "TC" if besaran == "TC" else "EOQ",
+                                                                  poros, indeks)
+    eoq_min, eoq_max = rentang[0]
+    if besaran == "kenaikan":
+        Z = 100 * sensitivitas_eoq.kenaikan_biaya(Q0, Z)
+        v_min, v_max = 0.0, 100 * sensitivitas_eoq.kenaikan_terburuk(Q0, eoq_min, eoq_max)
+    else:
+        v_min, v_max = rentang[sensitivitas_eoq.BESARAN.index(besaran)]
+
+    fig_irisan, ax_irisan = plt.subplots(figsize=(8, 6))
+    # Skala warna satu untuk seluruh tensor agar irisan yang berbeda dapat dibandingkan
+    gambar = peta_kontur.gambar_heatmap(ax_irisan, nilai_h, nilai_v, Z, vmin=v_min, vmax=v_max)
+    fig_irisan.colorbar(gambar, ax=ax_irisan, label=label_besaran)
+    h, v = sensitivitas_eoq.SUMBU.index(nama_h), sensitivitas_eoq.SUMBU.index(nama_v)
+    ax_irisan.plot(dasar[h], dasar[v], "r+", markersize=12, label="Parameter saat ini")
+    ax_irisan.set_xlabel(satuan[nama_h])
+    ax_irisan.set_ylabel(satuan[nama_v])
+    ax_irisan.set_title(f"{label_besaran} — {produk}, {poros} = {sumbu[k][indeks]:,.0f}")
+    ax_irisan.legend(loc="upper right")
+    st.pyplot(fig_irisan)
+    plt.close(fig_irisan)
+
+    st.caption(f"Tensor {resolusi}³ × 2 float32 ({tensor.nbytes / 2 ** 20:.0f} MB) dihitung sekali; "
+               f"EOQ di seluruh grid {eoq_min:,.0f}–{eoq_max:,.0f} unit. Bila tetap memesan {Q0:.0f} unit, "
+               f"kenaikan biaya terburuk di grid ini "
+               f"{100 * sensitivitas_eoq.kenaikan_terburuk(Q0, eoq_min, eoq_max):.1f}%.")
+
+    # Kurva kenaikan biaya vs rasio Q/EOQ (berlaku untuk semua D, S, H)
+    rasio = np.linspace(0.3, 2.5, 300)
+    fig_kurva, ax_kurva = plt.subplots(figsize=(8, 3.5))
+    ax_kurva.plot(rasio, 100 * sensitivitas_eoq.kenaikan_biaya(rasio, 1.0), color="purple")
+    for r in (0.8, 1.2, 1.5):
+        naik = 100 * sensitivitas_eoq.kenaikan_biaya(r, 1.0)
+        ax_kurva.plot(r, naik, "o", color="purple")
+        ax_kurva.annotate(f"Q = {r:.1f}×EOQ: +{naik:.1f}%", (r, naik), xytext=(5, 8), textcoords="offset points")
+    ax_kurva.set_xlabel("Q / EOQ")
+    ax_kurva.set_ylabel("Kenaikan biaya total (%)")
+    ax_kurva.set_title("Biaya Tambahan karena Memesan Bukan di EOQ")
+    ax_kurva.grid(True, alpha=0.3)
+    st.pyplot(fig_kurva)
+    plt.close(fig_kurva)
@@ -0,0 +1,93 @@
+"""Fungsi gambar bersama untuk aplikasi Streamlit dan laporan batch.
+
+Setiap fungsi hanya menggambar pada `ax` yang diberikan (tanpa pyplot dan
+tanpa Streamlit), sehingga grafik yang sama dapat ditampilkan di aplikasi
+maupun dirender headless (backend Agg) ke PDF/PNG oleh laporan.py.
+"""
+import numpy as np
+
+import model_inti
+
+
+def gambar_produksi(ax, nama_produk, jumlah, warna=("skyblue", "lightgreen")):
+    """Batang jumlah produksi optimal per produk."""
+    ax.bar(nama_produk, jumlah, color=[warna[i % len(warna)] for i in range(len(jumlah))])
+    ax.set_ylabel("Jumlah Produksi (unit)")
+
+
+def gambar_utilisasi(ax, label, digunakan, kapasitas):
+    """Batang horizontal pemakaian sumber daya di atas kapasitasnya."""
+    ax.barh(label, kapasitas, color="gray", alpha=0.3, label="Kapasitas")
+    ax.barh(label, digunakan, color="orange", label="Terpakai")
+    ax.legend()
+
+
+def label_kendala(A, b, nama_variabel=("x", "y")):
+    """Label 'a·x + b·y ≤ c' untuk setiap baris kendala dua variabel."""
+    def suku(a, v):
+        return v if a == 1 else f"-{v}" if a == -1 else f"{a:g}{v}"
+
+    return [" + ".join(suku(a, v) for a, v in zip(baris, nama_variabel) if a) + f" ≤ {batas:g}"
+            for baris, batas in zip(A, b)]
+
+
+def gambar_daerah_layak(ax, A, b, x_opt, y_opt, label=None, label_x="x", label_y="y", x_maks=None, titik=200):
+    """Garis kendala A·(x, y) <= b, daerah layak (x, y >= 0) dan titik optimal."""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    label = label_kendala(A, b) if label is None else label
+    if x_maks is None:
+        # Sampai perpotongan sumbu x terjauh yang masih membatasi, atau dua kali titik optimal
+        potong = [bi / ax_ for (ax_, ay), bi in zip(A, b) if ax_ > 0 and ay >= 0]
+        x_maks = 1.1 * min(potong) if potong else max(1.0, 2 * x_opt)
+    x_vals = np.linspace(0, x_maks, titik)
+    atas = np.full(titik, np.inf)
+    bawah = np.zeros(titik)
+    for (ax_, ay), bi, nama in zip(A, b, label):
+        if ay > 0:
+            y = (bi - ax_ * x_vals) / ay
+            ax.plot(x_vals, y, label=nama)
+            atas = np.minimum(atas, y)
+        elif ay < 0:
+            y = (bi - ax_ * x_vals) / ay
+            ax.plot(x_vals, y, label=nama)
+            bawah = np.maximum(bawah, y)
+        elif ax_ != 0:
+            ax.axvline(bi / ax_, linestyle=":", color="gray", label=nama)
+            # Kendala x saja: di luar batasnya tidak ada y yang layak
+            keluar = x_vals > bi / ax_ if ax_ > 0 else x_vals < bi / ax_
+            atas = np.where(keluar, -np.inf, atas)
+    if np.isfinite(atas).any():
+        ax.fill_between(x_vals, bawah, np.where(np.isfinite(atas), atas, np.nan), where=atas >= bawah, alpha=0.3)
+    ax.plot(x_opt, y_opt, 'ro', label='Solusi Optimal')
+    ax.set_xlabel(label_x)
+    ax.set_ylabel(label_y)
+    ax.legend()
+
+
+def gambar_kurva_eoq(ax, D, S, H, satuan="unit"):
+    """Kurva biaya pesan, simpan dan total sebagai persen dari biaya minimum (agar tidak tampak datar)."""
+    EOQ = model_inti.eoq(D, S, H)["EOQ"]
+    Q = np.linspace(EOQ * 0.4, EOQ * 1.6, 300)
+    OC_curve, HC_curve, TC_curve = model_inti.kurva_eoq(D, S, H, Q)
+
+    TC_min = TC_curve.min()
+    OC_curve_pct = (OC_curve / TC_min) * 100
+    HC_curve_pct = (HC_curve / TC_min) * 100
+    TC_curve_pct = (TC_curve / TC_min) * 100
+
+    ax.plot(Q, TC_curve_pct, label="Total Cost (%)", color='blue', linewidth=2)
+    ax.plot(Q, OC_curve_pct, label="Ordering Cost (%)", color='green', linestyle='--')
+    ax.plot(Q, HC_curve_pct, label="Holding Cost (%)", color='orange', linestyle='--')
+    ax.axvline(EOQ, color='red', linestyle='--', label=f'EOQ = {EOQ:.0f}')
+    ax.scatter([EOQ], [100], color='red')
+    ax.annotate(f"EOQ = {EOQ:.0f} {satuan}\n100% Biaya Minimum",
+                (EOQ, 100),
+                xytext=(10, -30),
+                textcoords="offset points",
+                arrowprops=dict(arrowstyle="->", color='gray'))
+    ax.set_xlabel("Jumlah Pembelian (Q)")
+    ax.set_ylabel("Biaya (% dari minimum)")
+    ax.set_title("Kurva EOQ (Dalam Persentase agar Tampak Jelas)")
+    ax.grid(True, linestyle='--', alpha=0.6)
+    ax.legend()
@@ -1,12 +1,27 @@
+import csv
+import hashlib
+import io
 import streamlit as st
 import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import linprog  # type: ignore
+import grafik
+import memori
+import model_inti
+import pekerjaan
+import penyimpanan_skenario
+import peramalan
+import profiler
+import titik_kritis
+from parser_aman import parse_dan_turunkan
+from profiler import ukur
 
 st.set_page_config(page_title="Aplikasi Studi Kasus Industri", layout="wide")
 st.title("📊 Aplikasi Analisis Model Matematika untuk Industri Ban")
 
+profiler.mulai()
+memori.mulai()
+
 with st.sidebar:
     tab = st.radio("📌 Pilih Studi Kasus:", [
         "Produksi Ban (Optimasi)", 
@@ -15,6 +30,40 @@ with st.sidebar:
         "Analisis Harga (Turunan Parsial)"
     ])
 
+BARIS_PER_POTONGAN = 50000
+
+
+@st.cache_resource
+def laba_terkompilasi(fungsi):
+    """f dan turunan dari pekerja parser_aman (cache yang sama dengan model_inti.turunan_parsial),
+    plus f/gradien/Hessian terkompilasi; dihitung sekali per teks fungsi."""
+    f, turunan = parse_dan_turunkan(fungsi, ("x", "y"))
+    return f, turunan, titik_kritis.dari_sympy(f, *sp.symbols("x y"), turunan=turunan)
+
+
+def eoq_banyak_item(pek, data):
+    """EOQ untuk setiap baris CSV (kolom item opsional, D, S, H); dibaca & dihitung per potongan."""
+    total_baris = max(data.count(b"\n"), 1)
+    pembaca = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    item, hasil = [], []
+    while True:
+        potongan = [baris for _, baris in zip(range(BARIS_PER_POTONGAN), pembaca)]
+        if not potongan:
+            break
+        item.extend(b.get("item") or str(len(item) + i + 1) for i, b in enumerate(potongan))
+        hasil.append(model_inti.eoq_vektor(*([float(b[k]) for b in potongan] for k in ("D", "S", "H"))))
+        pek.lapor(len(item) / total_baris)
+    if not hasil:
+        raise ValueError("CSV tidak berisi baris data")
+    gabungan = {k: np.concatenate([h[k] for h in hasil]) for k in hasil[0]}
+
+    keluaran = io.StringIO()
+    penulis = csv.writer(keluaran)
+    penulis.writerow(["item", *gabungan])
+    penulis.writerows(zip(item, *(np.round(v, 4) for v in gabungan.values())))
+    return item, gabungan, keluaran.getvalue().encode("utf-8")
+
+
 # 1️⃣ Optimasi Produksi
 if tab == "Produksi Ban (Optimasi)":
     st.header("🚗 Produksi Ban Mobil & Truk - Optimasi Laba")
@@ -24,29 +73,23 @@ if tab == "Produksi Ban (Optimasi)":
     st.latex("4x + 5y \\leq 1600 \\quad \\text{(Bahan Karet)}")
     st.latex("x, y \\geq 0")
 
-    c = [-50000, -80000]
-    A = [[2, 4], [4, 5]]
-    b = [1200, 1600]
+    masukan = {"profit": [50000, 80000], "A": [[2, 4], [4, 5]], "b": [1200, 1600]}
 
-    res = linprog(c, A_ub=A, b_ub=b, bounds=(0, None))
-    if res.success:
-        x_opt, y_opt = res.x
+    with ukur("solve"):
+        hasil, _ = penyimpanan_skenario.bawaan().atau_hitung(
+            "lp_produksi", masukan, lambda: model_inti.lp_produksi(**masukan))
+    if hasil["sukses"]:
+        x_opt, y_opt = hasil["x"]
         st.success(f"Produksi optimal: Ban Mobil = {x_opt:.2f}, Ban Truk = {y_opt:.2f}")
-        st.write(f"Laba Maksimum: Rp {-res.fun:,.0f}")
-
-        x_vals = np.linspace(0, 300, 200)
-        y1 = (1200 - 2 * x_vals) / 4
-        y2 = (1600 - 4 * x_vals) / 5
+        st.write(f"Laba Maksimum: Rp {hasil['keuntungan']:,.0f}")
 
         fig, ax = plt.subplots()
-        ax.plot(x_vals, y1, label="2x + 4y ≤ 1200")
-        ax.plot(x_vals, y2, label="4x + 5y ≤ 1600")
-        ax.fill_between(x_vals, np.minimum(y1, y2), 0, alpha=0.3)
-        ax.plot(x_opt, y_opt, 'ro', label='Solusi Optimal')
-        ax.set_xlabel("Ban Mobil (x)")
-        ax.set_ylabel("Ban Truk (y)")
-        ax.legend()
-        st.pyplot(fig)
+        with ukur("grid"):
+            grafik.gambar_daerah_layak(ax, masukan["A"], masukan["b"], x_opt, y_opt, label_x="Ban Mobil (x)",
+                                       label_y="Ban Truk (y)", x_maks=300)
+        with ukur("render"):
+            st.pyplot(fig)
+        plt.close(fig)
 
 # 2️⃣ EOQ
 elif tab == "Pengadaan Karet (EOQ)":
@@ -63,10 +106,9 @@ elif tab == "Pengadaan Karet (EOQ)":
     S = st.number_input("Biaya Pemesanan per Order (Rp)", value=250000)
     H = st.number_input("Biaya Penyimpanan per Tahun (Rp/kg)", value=1000)
 
-    EOQ = ((2 * D * S) / H) ** 0.5
-    OC = (D / EOQ) * S
-    HC = (EOQ / 2) * H
-    TC = OC + HC
+    hasil, _ = penyimpanan_skenario.bawaan().atau_hitung("eoq", {"D": D, "S": S, "H": H},
+                                                          lambda: model_inti.eoq(D, S, H))
+    EOQ, OC, HC, TC = hasil["EOQ"], hasil["OC"], hasil["HC"], hasil["TC"]
 
     st.subheader("📈 Hasil Perhitungan:")
     st.write(f"EOQ optimal: **{EOQ:.2f} kg**")
@@ -75,33 +117,54 @@ elif tab == "Pengadaan Karet (EOQ)":
     st.write(f"- Total Biaya Tahunan: **Rp {TC:,.0f}**")
 
     # Grafik dalam bentuk persentase agar tidak datar
-    Q = np.linspace(EOQ * 0.4, EOQ * 1.6, 300)
-    OC_curve = (D / Q) * S
-    HC_curve = (Q / 2) * H
-    TC_curve = OC_curve + HC_curve
+    fig, ax = plt.subplots()
+    with ukur("grid"):
+        grafik.gambar_kurva_eoq(ax, D, S, H, satuan="kg")
+    with ukur("render"):
+        st.pyplot(fig)
+    plt.close(fig)
 
-    TC_min = TC_curve.min()
-    OC_curve_pct = (OC_curve / TC_min) * 100
-    HC_curve_pct = (HC_curve / TC_min) * 100
-    TC_curve_pct = (TC_curve / TC_min) * 100
+    penyimpanan_skenario.tampilkan_riwayat("eoq")
 
-    fig, ax = plt.subplots()
-    ax.plot(Q, TC_curve_pct, label="Total Cost (%)", color='blue', linewidth=2)
-    ax.plot(Q, OC_curve_pct, label="Ordering Cost (%)", color='green', linestyle='--')
-    ax.plot(Q, HC_curve_pct, label="Holding Cost (%)", color='orange', linestyle='--')
-    ax.axvline(EOQ, color='red', linestyle='--', label=f'EOQ = {EOQ:.0f}')
-    ax.scatter([EOQ], [100], color='red')
-    ax.annotate(f"EOQ = {EOQ:.0f} kg\n100% Biaya Minimum",
-                (EOQ, 100),
-                xytext=(10, -30),
-                textcoords="offset points",
-                arrowprops=dict(arrowstyle="->", color='gray'))
-    ax.set_xlabel("Jumlah Pembelian (Q)")
-    ax.set_ylabel("Biaya (% dari minimum)")
-    ax.set_title("Kurva EOQ (Dalam Persentase agar Tampak Jelas)")
-    ax.grid(True, linestyle='--', alpha=0.6)
-    ax.legend()
-    st.pyplot(fig)
+    # EOQ seluruh katalog bahan baku dihitung di pekerjaan latar
+    with st.expander("📦 EOQ untuk Banyak Item (CSV)"):
+        st.caption("Kolom CSV: item (opsional), D, S, H — satu baris per item.")
+        berkas = st.file_uploader("Unggah CSV item", type="csv")
+        if berkas is not None:
+            data = berkas.getvalue()
+            hasil_item, segar = pekerjaan.tampilkan("eoq_banyak", hashlib.sha1(data).hexdigest(), eoq_banyak_item,
+                                                    data, label="Menghitung EOQ per item")
+            if hasil_item is not None:
+                item, nilai, csv_hasil = hasil_item
+                if not segar:
+                    st.caption("Menampilkan hasil berkas sebelumnya sampai perhitungan selesai.")
+                st.write(f"{len(item):,} item — total biaya tahunan Rp {nilai['TC'].sum():,.0f}")
+                st.dataframe({"item": item[:1000], **{k: v[:1000] for k, v in nilai.items()}})
+                st.download_button("⬇️ Unduh hasil (.csv)", csv_hasil, file_name="eoq_per_item.csv")
+
+    # Permintaan tahunan diramal dari riwayat penjualan harian lalu langsung dipakai untuk EOQ & stok pengaman
+    with st.expander("📈 EOQ & Stok Pengaman dari Ramalan Riwayat Penjualan"):
+        ramalan = peramalan.tampilkan_unggah("ramalan_karet")
+        if ramalan is not None:
+            nama_item, tanggal_awal, riwayat, model = ramalan
+            col1, col2 = st.columns(2)
+            lead_time = col1.number_input("Lead time (hari)", min_value=0, max_value=365, value=7,
+                                          key="lead_time_karet")
+            layanan = col2.slider("Tingkat layanan siklus", 0.80, 0.999, 0.95, key="layanan_karet")
+            rencana = peramalan.rencana_persediaan(model, S, H, lead_time, layanan)
+            st.write(f"{len(nama_item):,} item × {riwayat.shape[1]} hari riwayat — total biaya tahunan "
+                     f"Rp {rencana['TC'].sum():,.0f} (termasuk biaya simpan stok pengaman)")
+            st.dataframe({"item": nama_item[:1000], "metode": model["metode"][:1000],
+                          **{k: np.round(rencana[k][:1000], 2) for k in ("D", "EOQ", "SS", "ROP", "TC")}})
+            st.download_button("⬇️ Unduh rencana persediaan (.csv)", peramalan.tabel_csv(nama_item, model, rencana),
+                               file_name="rencana_persediaan.csv")
+            i = st.selectbox("Lihat item", range(len(nama_item)), format_func=lambda i: nama_item[i],
+                             key="item_karet")
+            fig2, ax2 = plt.subplots(figsize=(8, 3.5))
+            peramalan.gambar_ramalan(ax2, nama_item, tanggal_awal, riwayat, model, i)
+            with ukur("render"):
+                st.pyplot(fig2)
+            plt.close(fig2)
 
 # 3️⃣ Antrian Bengkel
 elif tab == "Antrian Bengkel":
@@ -114,14 +177,13 @@ elif tab == "Antrian Bengkel":
     lam = st.number_input("Tingkat Kedatangan λ (pelanggan/jam)", value=6.0)
     mu = st.number_input("Tingkat Pelayanan μ (pelanggan/jam)", value=10.0)
 
-    if lam >= mu:
+    hasil, _ = penyimpanan_skenario.bawaan().atau_hitung("antrian_mm1", {"lam": lam, "mu": mu},
+                                                          lambda: model_inti.antrian_mm1(lam, mu))
+
+    if not hasil["stabil"]:
         st.error("Sistem tidak stabil (λ ≥ μ)")
     else:
-        rho = lam / mu
-        L = rho / (1 - rho)
-        Lq = rho**2 / (1 - rho)
-        W = L / lam
-        Wq = Lq / lam
+        rho, L, Lq, W, Wq = (hasil[k] for k in ("rho", "L", "Lq", "W", "Wq"))
 
         st.success("Sistem Stabil")
         st.write(f"Utilisasi (ρ): {rho:.2f}")
@@ -133,18 +195,21 @@ elif tab == "Antrian Bengkel":
         fig, ax = plt.subplots()
         ax.bar(["L", "Lq", "W", "Wq"], [L, Lq, W, Wq], color=['blue', 'orange', 'green', 'red'])
         ax.set_title("Grafik Kinerja Antrian Bengkel")
-        st.pyplot(fig)
+        with ukur("render"):
+            st.pyplot(fig)
+        plt.close(fig)
+
+        penyimpanan_skenario.tampilkan_riwayat("antrian_mm1")
 
 # 4️⃣ Turunan Parsial
 elif tab == "Analisis Harga (Turunan Parsial)":
     st.header("📈 Analisis Harga Ban terhadap Laba - Turunan Parsial")
 
-    x, y = sp.symbols("x y")
     st.latex("f(x, y) = 10000x + 15000y - 0.1x^2 - 0.05y^2")
 
-    f = 10000 * x + 15000 * y - 0.1 * x**2 - 0.05 * y**2
-    fx = sp.diff(f, x)
-    fy = sp.diff(f, y)
+    fungsi_laba = "10000*x + 15000*y - 0.1*x**2 - 0.05*y**2"
+    with ukur("kompilasi"):
+        _, (fx, fy), (f_np, grad_np, hess_np) = laba_terkompilasi(fungsi_laba)
 
     st.latex(f"\\frac{{\\partial f}}{{\\partial x}} = {sp.latex(fx)}")
     st.latex(f"\\frac{{\\partial f}}{{\\partial y}} = {sp.latex(fy)}")
@@ -152,19 +217,28 @@ elif tab == "Analisis Harga (Turunan Parsial)":
     x0 = st.number_input("Harga Ban Mobil (x)", value=20.0)
     y0 = st.number_input("Harga Ban Truk (y)", value=30.0)
 
-    f_val = f.subs({x: x0, y: y0})
-    fx_val = fx.subs({x: x0, y: y0})
-    fy_val = fy.subs({x: x0, y: y0})
+    nilai = model_inti.turunan_parsial(fungsi_laba, x0, y0)
+    f_val, fx_val, fy_val = nilai["f"], nilai["fx"], nilai["fy"]
 
     st.write(f"Laba f({x0}, {y0}) = Rp {float(f_val):,.0f}")
     st.write(f"∂f/∂x = Rp {float(fx_val):,.0f}  |  ∂f/∂y = Rp {float(fy_val):,.0f}")
 
-    X_vals = np.linspace(x0 - 5, x0 + 5, 50)
-    Y_vals = np.linspace(y0 - 5, y0 + 5, 50)
-    X, Y = np.meshgrid(X_vals, Y_vals)
-    f_np = sp.lambdify((x, y), f, "numpy")
-    Z = f_np(X, Y)
-    Z_tangent = float(f_val) + float(fx_val) * (X - x0) + float(fy_val) * (Y - y0)
+    # Harga yang memaksimalkan laba: titik kritis dari gradien = 0
+    with ukur("solve"):
+        titik = titik_kritis.cari_titik_kritis(f_np, grad_np, hess_np, batas=((x0 - 5, x0 + 5), (y0 - 5, y0 + 5)))
+    st.subheader("🎯 Titik Kritis Laba")
+    if titik:
+        st.dataframe([{"Harga Ban Mobil (x)": t["x"], "Harga Ban Truk (y)": t["y"], "Laba": t["f"],
+                       "Jenis": titik_kritis.JENIS[t["jenis"]]} for t in titik])
+    else:
+        st.info("Tidak ditemukan titik kritis.")
+    with ukur("grid"):
+        X_vals = np.linspace(x0 - 5, x0 + 5, 50)
+        Y_vals = np.linspace(y0 - 5, y0 + 5, 50)
+        X, Y = np.meshgrid(X_vals, Y_vals)
+        Z = f_np(X, Y)
+        Z_tangent = float(f_val) + float(fx_val) * (X - x0) + float(fy_val) * (Y - y0)
+    di_grafik = [t for t in titik if abs(t["x"] - x0) <= 5 and abs(t["y"] - y0) <= 5]
 
     fig = plt.figure(figsize=(10, 6))
     ax = fig.add_subplot(111, projection="3d")
@@ -174,4 +248,25 @@ elif tab == "Analisis Harga (Turunan Parsial)":
     ax.set_xlabel("Harga Ban Mobil (x)")
     ax.set_ylabel("Harga Ban Truk (y)")
     ax.set_zlabel("Laba")
-    st.pyplot(fig)
+    for t in di_grafik:
+        ax.scatter(t["x"], t["y"], t["f"], color="black", s=40)
+    with ukur("render"):
+        st.pyplot(fig)
+    plt.close(fig)
+
+    fig2, ax2 = plt.subplots(figsize=(8, 5))
+    kontur = ax2.contourf(X, Y, Z, levels=30, cmap="viridis")
+    fig2.colorbar(kontur, ax=ax2, label="Laba")
+    ax2.plot(x0, y0, "wo", label="Harga saat ini")
+    for t in di_grafik:
+        ax2.plot(t["x"], t["y"], "r*", markersize=12, label=titik_kritis.JENIS[t["jenis"]])
+    ax2.set_title("Kontur Laba")
+    ax2.set_xlabel("Harga Ban Mobil (x)")
+    ax2.set_ylabel("Harga Ban Truk (y)")
+    ax2.legend()
+    with ukur("render"):
+        st.pyplot(fig2)
+    plt.close(fig2)
+
+memori.selesai()
+profiler.selesai()
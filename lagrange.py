@@ -0,0 +1,249 @@
+"""Optimasi f(x, y) dengan kendala memakai pengali Lagrange (kondisi KKT).
+
+Lagrangian dibangun simbolik satu kali lalu sistem KKT dan Jacobiannya
+dikompilasi. Setiap kombinasi kendala aktif diselesaikan dengan Newton
+tervektorisasi dari banyak titik awal; solusi yang layak dengan pengali
+bertanda benar menjadi kandidat.
+
+Kondisi KKT hanya syarat orde satu, jadi setiap kandidat diklasifikasi
+dengan Hessian tereduksi Lagrangian (diproyeksikan ke ruang nol gradien
+kendala aktif): "lokal", "pelana" atau "tidak_pasti". Lalu objektif
+ditelusuri sepanjang sinar layak dari titik terpilih; bila terus membaik
+tanpa melambat, masalahnya dilaporkan "tak_terbatas". Hasil terbaik hanya
+optimum lokal di antara kandidat yang ditemukan, bukan jaminan global.
+
+Kendala ditulis sebagai (h, jenis) yang berarti h(x, y) <= 0 atau h(x, y) = 0.
+
+Contoh:
+    kkt = bangun_kkt(x*y, (x, y), [(x + 2*y - 10, "<=")])
+    hasil = selesaikan(kkt, batas=((0, 10), (0, 10)))
+"""
+from itertools import combinations
+
+import numpy as np
+import sympy as sp
+
+
+def bangun_kkt(f, variabel, kendala, maksimasi=True):
+    """Bangun dan kompilasi sistem KKT. `kendala` berisi (h, "<=") atau (h, "=")."""
+    arah = 1 if maksimasi else -1
+    m = len(kendala)
+    lam = sp.symbols(f"lambda0:{m}") if m else ()
+    aktif = sp.symbols(f"a0:{m}") if m else ()
+
+    # L = arah*f - sum(lambda_i * h_i); untuk maksimasi dengan h <= 0 berlaku lambda >= 0
+    L = arah * f - sum(l * h for l, (h, _) in zip(lam, kendala))
+    persamaan = [sp.diff(L, v) for v in variabel]
+    # Kendala aktif: h_i = 0; kendala nonaktif: lambda_i = 0 (dipilih lewat parameter a_i)
+    persamaan += [a * h + (1 - a) * l for a, l, (h, _) in zip(aktif, lam, kendala)]
+
+    tak_diketahui = list(variabel) + list(lam)
+    jacobian = sp.Matrix(persamaan).jacobian(tak_diketahui)
+    argumen = tak_diketahui + list(aktif)
+    gradien_h = sp.Matrix([h for h, _ in kendala]).jacobian(variabel) if m else sp.zeros(0, len(variabel))
+    return {
+        "variabel": tuple(variabel),
+        "jenis": [j for _, j in kendala],
+        "F": sp.lambdify(argumen, persamaan, "numpy", cse=True),
+        "J": sp.lambdify(argumen, jacobian.tolist(), "numpy", cse=True),
+        "h": sp.lambdify(list(variabel), [h for h, _ in kendala], "numpy", cse=True),
+        # Hessian Lagrangian terhadap variabel dan gradien kendala, untuk uji orde dua
+        "HL": sp.lambdify(tak_diketahui, sp.hessian(L, variabel).tolist(), "numpy", cse=True),
+        "Jh": sp.lambdify(list(variabel), gradien_h.tolist(), "numpy", cse=True),
+        "f": sp.lambdify(list(variabel), f, "numpy"),
+        "arah": arah,
+    }
+
+
+def _larik(nilai, bentuk):
+    return np.broadcast_to(np.asarray(nilai, dtype=float), bentuk)
+
+
+def _newton(kkt, v, a, iterasi=50, tol=1e-10):
+    """Newton tervektorisasi untuk banyak titik awal sekaligus. v: (k, d)."""
+    k, d = v.shape
+    with np.errstate(all="ignore"):
+        for _ in range(iterasi):
+            arg = list(v.T) + list(a)
+            F = np.column_stack([_larik(r, (k,)) for r in kkt["F"](*arg)])
+            J = np.stack([np.column_stack([_larik(e, (k,)) for e in baris]) for baris in kkt["J"](*arg)], axis=1)
+            # Titik yang sudah divergen (NaN/inf) tidak dikirim ke LAPACK
+            hingga = np.isfinite(F).all(axis=1) & np.isfinite(J).all(axis=(1, 2))
+            if not hingga.any():
+                break
+            dv = np.full_like(v, np.nan)
+            try:
+                dv[hingga] = np.linalg.solve(J[hingga], -F[hingga][..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                # Ada Jacobian singular: selesaikan per titik dengan kuadrat terkecil
+                dv[hingga] = np.stack([np.linalg.lstsq(Ji, -Fi, rcond=None)[0] for Ji, Fi in zip(J[hingga], F[hingga])])
+            v = v + dv
+            if np.max(np.abs(dv), initial=0.0, where=np.isfinite(dv)) < tol:
+                break
+        arg = list(v.T) + list(a)
+        sisa = np.column_stack([_larik(r, (k,)) for r in kkt["F"](*arg)])
+    return v, np.abs(sisa).max(axis=1)
+
+
+def _lengkung(H, G):
+    """Nilai eigen H pada ruang nol baris-baris G (kosong bila ruang nolnya nol)."""
+    n = H.shape[0]
+    if len(G):
+        _, sv, Vt = np.linalg.svd(G)
+        Z = Vt[int(np.sum(sv > 1e-9 * max(1.0, sv.max()))):].T
+    else:
+        Z = np.eye(n)
+    return np.linalg.eigvalsh(Z.T @ H @ Z) if Z.shape[1] else np.zeros(0)
+
+
+def klasifikasi(kkt, titik, pengali, aktif, tol=1e-7):
+    """Jenis titik KKT dari Hessian tereduksi Lagrangian: "lokal", "pelana" atau "tidak_pasti".
+
+    Lagrangian dibangun untuk memaksimalkan arah·f, jadi optimum lokal strict bila Hessian
+    negatif definit pada ruang nol gradien kendala aktif kuat (persamaan dan pertidaksamaan
+    dengan λ > 0). Kelengkungan positif pada ruang nol semua kendala aktif berarti ada arah
+    layak yang memperbaiki objektif (pelana). Selain itu (degenerate) "tidak_pasti".
+    """
+    n = len(titik)
+    m = len(kkt["jenis"])
+    H = np.array(kkt["HL"](*titik, *pengali), dtype=float).reshape(n, n)
+    G = np.array(kkt["Jh"](*titik), dtype=float).reshape(m, n)
+    kuat = [i for i in aktif if kkt["jenis"][i] == "=" or pengali[i] > tol]
+    skala = tol * (1 + np.abs(H).max())
+    semua = _lengkung(H, G[list(aktif)])
+    if semua.size and semua.max() > skala:
+        return "pelana"
+    lengkung_kuat = _lengkung(H, G[kuat])
+    if not lengkung_kuat.size or lengkung_kuat.max() < -skala:
+        return "lokal"
+    return "tidak_pasti"
+
+
+def _arah_sinar(n, jumlah=72, seed=0):
+    """Arah satuan merata: lingkaran untuk 2 variabel, acak ditambah ±sumbu untuk lainnya."""
+    if n == 2:
+        sudut = np.linspace(0, 2 * np.pi, jumlah, endpoint=False)
+        return np.column_stack([np.cos(sudut), np.sin(sudut)])
+    arah = np.vstack([np.random.default_rng(seed).normal(size=(jumlah, n)), np.eye(n), -np.eye(n)])
+    return arah / np.linalg.norm(arah, axis=1, keepdims=True)
+
+
+def sinar_tak_terbatas(kkt, basis, skala, tol=1e-7, langkah=7):
+    """Telusuri objektif sepanjang sinar layak x + t·d dengan t = skala·10^k dari titik-titik `basis`.
+
+    Sinar dianggap tak terbatas bila tiga titik terjauhnya layak dan objektif (arah·f) terus
+    naik tanpa melambat (kenaikan terakhir ≥ separuh kenaikan sebelumnya). Kendala persamaan
+    membatasi arah ke ruang nol gradiennya. Mengembalikan None atau dict (titik, arah, objektif)
+    untuk titik sinar dengan objektif terbaik.
+    """
+    n = len(kkt["variabel"])
+    jenis = kkt["jenis"]
+    m = len(jenis)
+    sama = [i for i, j in enumerate(jenis) if j == "="]
+    t = skala * 10.0 ** np.arange(langkah)
+    terbaik = None
+    with np.errstate(all="ignore"):
+        for x0 in np.atleast_2d(basis):
+            arah = _arah_sinar(n)
+            if sama:
+                G = np.array(kkt["Jh"](*x0), dtype=float).reshape(m, n)[sama]
+                arah = arah - np.linalg.lstsq(G.T, arah.T, rcond=None)[0].T @ G
+                panjang = np.linalg.norm(arah, axis=1)
+                arah = arah[panjang > 1e-9] / panjang[panjang > 1e-9, None]
+                if not len(arah):
+                    continue
+            P = x0 + t[:, None, None] * arah[None]                      # (langkah, arah, n)
+            x = list(np.moveaxis(P, -1, 0))
+            nilai = kkt["arah"] * _larik(kkt["f"](*x), P.shape[:2])
+            layak = np.isfinite(nilai)
+            batas_h = tol * (1 + np.abs(P).max(axis=-1))
+            for i, r in enumerate(kkt["h"](*x) if m else []):
+                r = _larik(r, P.shape[:2])
+                layak &= (np.abs(r) if jenis[i] == "=" else r) <= batas_h
+            a, b, c = nilai[-3], nilai[-2], nilai[-1]
+            naik = layak[-3:].all(axis=0) & (b > a) & (c - b >= 0.5 * (b - a))
+            if naik.any():
+                j = int(np.argmax(np.where(naik, c, -np.inf)))
+                if terbaik is None or c[j] > kkt["arah"] * terbaik["objektif"]:
+                    terbaik = {"titik": P[-1, j].tolist(), "arah": arah[j].tolist(),
+                               "objektif": float(kkt["arah"] * c[j])}
+    return terbaik
+
+
+def selesaikan(kkt, batas, n_awal=36, tol=1e-7):
+    """Cari optimum lokal terkendala dan periksa apakah masalahnya tak terbatas.
+
+    Mengembalikan None bila tidak ada titik KKT layak maupun sinar tak terbatas, atau dict:
+    `titik`, `pengali`, `objektif`, `aktif` (titik terpilih, None bila tidak ada), `jenis`
+    (klasifikasi titik itu), `status` ("lokal", "pelana", "tidak_pasti" atau "tak_terbatas"),
+    `sinar` (hasil `sinar_tak_terbatas` atau None) dan `kandidat` (semua titik KKT unik).
+    """
+    n = len(kkt["variabel"])
+    jenis = kkt["jenis"]
+    m = len(jenis)
+    sisi = max(2, int(round(n_awal ** (1 / n))))
+    grid = np.meshgrid(*[np.linspace(lo, hi, sisi) for lo, hi in batas])
+    awal = np.column_stack([g.ravel() for g in grid] + [np.zeros(sisi**n)] * m)
+
+    wajib = [i for i, j in enumerate(jenis) if j == "="]
+    opsional = [i for i, j in enumerate(jenis) if j != "="]
+    skala = 1 + max(max(abs(lo), abs(hi)) for lo, hi in batas)
+    kandidat = {}
+
+    for k in range(0, max(0, n - len(wajib)) + 1):
+        for pilihan in combinations(opsional, k):
+            set_aktif = set(wajib) | set(pilihan)
+            a = [1.0 if i in set_aktif else 0.0 for i in range(m)]
+            v, sisa = _newton(kkt, awal.copy(), a)
+            ok = np.isfinite(sisa) & (sisa < tol * (1 + np.abs(v).max(axis=1)))
+            if not ok.any():
+                continue
+            # Newton yang lari jauh ke daerah datar (gradien ≈ 0 di tak hingga) bukan titik KKT
+            ok &= np.abs(v[:, :n]).max(axis=1) <= 100 * skala
+            if not ok.any():
+                continue
+            v = v[ok]
+            x = list(v[:, :n].T)
+            h = np.column_stack([_larik(r, (len(v),)) for r in kkt["h"](*x)]) if m else np.zeros((len(v), 0))
+            lam = v[:, n:]
+            layak = np.ones(len(v), dtype=bool)
+            for i in opsional:
+                layak &= h[:, i] <= 1e-7 * (1 + np.abs(v).max(axis=1))
+                layak &= lam[:, i] >= -1e-9
+            nilai = _larik(kkt["f"](*x), (len(v),))
+            for titik, pengali, f_nilai in zip(v[layak, :n], lam[layak], nilai[layak]):
+                kunci = tuple(np.round(titik, 6)) + (tuple(sorted(set_aktif)),)
+                if kunci not in kandidat:
+                    kandidat[kunci] = {
+                        "titik": titik.tolist(),
+                        "pengali": pengali.tolist(),
+                        "objektif": float(f_nilai),
+                        "aktif": sorted(set_aktif),
+                        "jenis": klasifikasi(kkt, titik, pengali, sorted(set_aktif), tol),
+                    }
+
+    kandidat = sorted(kandidat.values(), key=lambda c: -kkt["arah"] * c["objektif"])
+    # Utamakan optimum lokal; titik pelana hanya dilaporkan bila tidak ada yang lain
+    urutan = {"lokal": 0, "tidak_pasti": 1, "pelana": 2}
+    terpilih = min(kandidat, key=lambda c: urutan[c["jenis"]]) if kandidat else None
+
+    if terpilih is not None:
+        basis = np.array([terpilih["titik"]])
+    else:
+        # Tanpa titik KKT: telusuri dari titik awal yang layak
+        x = list(awal[:, :n].T)
+        layak = np.ones(len(awal), dtype=bool)
+        for i, r in enumerate(kkt["h"](*x) if m else []):
+            r = _larik(r, (len(awal),))
+            layak &= (np.abs(r) if jenis[i] == "=" else r) <= tol
+        basis = awal[layak, :n]
+    sinar = sinar_tak_terbatas(kkt, basis, skala, tol) if len(basis) else None
+
+    if terpilih is None and sinar is None:
+        return None
+    hasil = dict(terpilih) if terpilih else {"titik": None, "pengali": None, "objektif": None, "aktif": [],
+                                             "jenis": None}
+    hasil["status"] = "tak_terbatas" if sinar is not None else terpilih["jenis"]
+    hasil["sinar"] = sinar
+    hasil["kandidat"] = kandidat
+    return hasil
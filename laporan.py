@@ -0,0 +1,245 @@
+"""Laporan PDF/PNG per pabrik/skenario, dirender paralel tanpa Streamlit.
+
+Setiap baris masukan (JSON-lines/CSV, format sama dengan batch_model.py)
+menjadi satu halaman: ringkasan optimum produksi, grafik daerah layak,
+pemanfaatan sumber daya dan kurva EOQ. Grafiknya memakai fungsi yang sama
+dengan aplikasi (grafik.py) dan dirender headless dengan backend Agg.
+
+    {"id": "Pabrik Bekasi", "profit": [90000, 20000], "A": [[1, 0.5], [2, 2], [2, 1]],
+     "b": [150, 200, 200], "nama_produk": ["Banner", "Brosur"],
+     "nama_sumber": ["Waktu Mesin", "Bahan Baku", "Tenaga Kerja"], "D": 12000, "S": 150000, "H": 500}
+
+Kolom D, S, H (opsional) mengisi kurva EOQ. Contoh:
+    python laporan.py skenario.jsonl --direktori laporan/ --format pdf --pekerja 8
+    python laporan.py --uji
+
+Skenario dibagi per potongan ke ProcessPool lewat batch_model.jalankan_batch.
+Setiap proses pekerja memakai ulang satu Figure (dikosongkan dengan clf()
+sebelum halaman berikutnya), sehingga memori tetap datar berapa pun jumlah
+laporannya. Manifest JSON-lines (berkas, status per skenario) ditulis ke
+--keluaran dan laju halaman/detik dilaporkan di stderr.
+"""
+import argparse
+import functools
+import os
+import re
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+import batch_model  # noqa: E402
+import grafik  # noqa: E402
+import model_inti  # noqa: E402
+
+UKURAN_HALAMAN = (11.69, 8.27)  # A4 lanskap (inci)
+FORMAT = ("pdf", "png")
+
+_halaman = None
+
+
+def _ambil_halaman():
+    """Figure milik proses ini, dipakai ulang untuk setiap laporan."""
+    global _halaman
+    if _halaman is None:
+        _halaman = Figure(figsize=UKURAN_HALAMAN)
+    _halaman.clf()
+    return _halaman
+
+
+def nama_berkas(skenario, nomor, format="pdf"):
+    """Nama berkas aman dari kolom id, diakhiri nomor baris.
+
+    Nomor baris membuat nama tetap unik walau dua id hanya berbeda di karakter yang
+    disanitasi ("A/B" dan "A B") atau id-nya kembar, sehingga pekerja paralel tidak
+    saling menimpa berkas.
+    """
+    dasar = re.sub(r"[^\w.-]+", "_", str(skenario.get("id", ""))).strip("._")
+    return f"{dasar or 'laporan'}_{nomor:06d}.{format}"
+
+
+def gambar_halaman(fig, skenario, hasil):
+    """Isi satu halaman laporan untuk skenario dan hasil `model_inti.lp_produksi`."""
+    A = np.asarray(skenario["A"], dtype=float)
+    b = np.asarray(skenario["b"], dtype=float)
+    m, n = A.shape
+    nama_produk = skenario.get("nama_produk") or [f"Produk {j + 1}" for j in range(n)]
+    nama_sumber = skenario.get("nama_sumber") or [f"Sumber daya {i + 1}" for i in range(m)]
+    ada_eoq = all(k in skenario for k in ("D", "S", "H"))
+
+    fig.suptitle(f"Laporan Produksi — {skenario.get('id', 'Skenario')}", fontsize=14, fontweight="bold")
+    kisi = fig.add_gridspec(2, 2, hspace=0.35, wspace=0.3)
+    ax_ringkas = fig.add_subplot(kisi[0, 0])
+    ax_ringkas.axis("off")
+    baris = []
+    if hasil["sukses"]:
+        x = np.asarray(hasil["x"])
+        pakai = A @ x
+        baris.append(f"Keuntungan maksimum: Rp {hasil['keuntungan']:,.0f}")
+        baris += [f"• {nama}: {nilai:,.2f} unit" for nama, nilai in zip(nama_produk, x)]
+        baris.append("")
+        baris += [f"• {nama}: {p:,.1f} / {k:,.1f} ({100 * p / k if k else 0:.0f}%)"
+                  for nama, p, k in zip(nama_sumber, pakai, b)]
+    else:
+        baris.append("Optimasi gagal: tidak layak atau tak terbatas.\nPeriksa parameter skenario ini.")
+    if ada_eoq:
+        eoq = model_inti.eoq(skenario["D"], skenario["S"], skenario["H"])
+        baris += ["", f"EOQ: {eoq['EOQ']:,.0f} unit/order", f"Biaya persediaan: Rp {eoq['TC']:,.0f}/tahun"]
+    ax_ringkas.text(0, 1, "\n".join(baris), va="top", fontsize=10, family="monospace")
+    ax_ringkas.set_title("Ringkasan", loc="left")
+
+    ax_layak = fig.add_subplot(kisi[0, 1])
+    if hasil["sukses"] and n == 2:
+        grafik.gambar_daerah_layak(ax_layak, A, b, *hasil["x"], label_x=nama_produk[0], label_y=nama_produk[1])
+        ax_layak.set_title("Daerah Layak & Solusi Optimal")
+    elif hasil["sukses"]:
+        grafik.gambar_produksi(ax_layak, nama_produk, hasil["x"])
+        ax_layak.set_title("Produksi Optimal")
+    else:
+        ax_layak.axis("off")
+
+    ax_util = fig.add_subplot(kisi[1, 0])
+    if hasil["sukses"]:
+        grafik.gambar_utilisasi(ax_util, nama_sumber, A @ np.asarray(hasil["x"]), b)
+        ax_util.set_title("Pemanfaatan Sumber Daya")
+    else:
+        ax_util.axis("off")
+
+    ax_eoq = fig.add_subplot(kisi[1, 1])
+    if ada_eoq:
+        grafik.gambar_kurva_eoq(ax_eoq, skenario["D"], skenario["S"], skenario["H"])
+        ax_eoq.set_title("Kurva EOQ")
+    else:
+        ax_eoq.axis("off")
+        ax_eoq.text(0.5, 0.5, "Data EOQ (D, S, H) tidak diisi", ha="center", va="center", color="gray")
+
+
+def buat_laporan(skenario, direktori, nomor, format="pdf", dpi=100):
+    """Render satu laporan ke `direktori`; kembalikan ringkasan untuk manifest."""
+    hasil = model_inti.lp_produksi(skenario["profit"], skenario["A"], skenario["b"])
+    fig = _ambil_halaman()
+    gambar_halaman(fig, skenario, hasil)
+    path = os.path.join(direktori, nama_berkas(skenario, nomor, format))
+    fig.savefig(path, format=format, dpi=dpi)
+    return {"berkas": path, "sukses": hasil["sukses"], "keuntungan": hasil["keuntungan"]}
+
+
+def kerjakan_potongan(potongan, direktori, format="pdf", dpi=100):
+    """Dijalankan di proses pekerja: satu laporan per skenario, galat tidak menghentikan batch."""
+    hasil = []
+    for nomor, skenario in potongan:
+        keluaran = {"baris": nomor}
+        if isinstance(skenario, batch_model.BarisRusak):
+            keluaran["galat"] = str(skenario)
+            hasil.append(keluaran)
+            continue
+        if "id" in skenario:
+            keluaran["id"] = skenario["id"]
+        try:
+            keluaran.update(buat_laporan(skenario, direktori, nomor, format, dpi))
+        except Exception as e:
+            keluaran["galat"] = f"{type(e).__name__}: {e}"
+        hasil.append(keluaran)
+    return hasil
+
+
+def jalankan(skenario, direktori, keluaran, format="pdf", dpi=100, pekerja=None, ukuran_potongan=20):
+    """Render semua skenario secara paralel; kembalikan (jumlah, jumlah_galat)."""
+    os.makedirs(direktori, exist_ok=True)
+    fungsi = functools.partial(kerjakan_potongan, direktori=direktori, format=format, dpi=dpi)
+    return batch_model.jalankan_batch(skenario, keluaran, pekerja, ukuran_potongan, fungsi=fungsi)
+
+
+def skenario_contoh(jumlah, seed=0):
+    """Generator (nomor, skenario) acak yang layak, untuk uji dan contoh."""
+    rng = np.random.default_rng(seed)
+    for i in range(1, jumlah + 1):
+        A = np.round(rng.uniform(0.5, 4, (3, 2)), 1)
+        yield i, {
+            "id": f"Pabrik {i:03d}",
+            "profit": [int(v) for v in rng.integers(20, 100, 2) * 1000],
+            "A": A.tolist(),
+            "b": [int(v) for v in rng.integers(100, 400, 3)],
+            "nama_produk": ["Banner", "Brosur"],
+            "nama_sumber": ["Waktu Mesin", "Bahan Baku", "Tenaga Kerja"],
+            "D": int(rng.integers(2000, 20000)),
+            "S": int(rng.integers(50, 200)) * 1000,
+            "H": int(rng.integers(200, 2000)),
+        }
+
+
+def uji(jumlah=50, pekerja=None):
+    """Uji mandiri: satu berkas valid per skenario, memori datar saat Figure dipakai ulang, laju halaman."""
+    import gc
+    import io
+    import json
+    import resource
+    import tempfile
+
+    gagal = False
+    with tempfile.TemporaryDirectory() as direktori:
+        for format, tanda in (("pdf", b"%PDF"), ("png", b"\x89PNG")):
+            manifest = io.StringIO()
+            mulai = time.perf_counter()
+            total, galat = jalankan(skenario_contoh(jumlah), direktori, manifest, format, pekerja=pekerja)
+            durasi = time.perf_counter() - mulai
+            catatan = [json.loads(baris) for baris in manifest.getvalue().splitlines()]
+            ok = total == jumlah and not galat and len({c["berkas"] for c in catatan}) == total and all(
+                open(c["berkas"], "rb").read(4) == tanda for c in catatan)
+            gagal |= not ok
+            print(f"{format}: {total} laporan dalam {durasi:.2f} s — {total / durasi:.1f} halaman/s "
+                  f"{'OK' if ok else 'GAGAL'}")
+
+        # Memori: setelah pemanasan, puncak RSS proses tidak boleh naik seiring jumlah halaman
+        contoh = list(skenario_contoh(60, seed=1))
+        puncak = []
+        for i, (nomor, skenario) in enumerate(contoh, start=1):
+            buat_laporan(skenario, direktori, nomor, "png")
+            if i in (20, 60):
+                gc.collect()
+                puncak.append(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+        ok = puncak[1] - puncak[0] < 5
+        gagal |= not ok
+        print(f"puncak RSS setelah 20 dan 60 halaman: {puncak[0]:.1f} → {puncak[1]:.1f} MB "
+              f"{'OK' if ok else 'GAGAL'}")
+    return 1 if gagal else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render laporan PDF/PNG per skenario secara paralel")
+    parser.add_argument("masukan", nargs="?", help="file .jsonl atau .csv ('-' untuk stdin JSON-lines)")
+    parser.add_argument("--direktori", default="laporan", help="folder keluaran laporan (bawaan: laporan)")
+    parser.add_argument("--format", choices=FORMAT, default="pdf")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--keluaran", default="-", help="manifest JSON-lines (bawaan: stdout)")
+    parser.add_argument("--pekerja", type=int, default=None, help="jumlah proses (bawaan: jumlah core)")
+    parser.add_argument("--ukuran-potongan", type=int, default=20, help="laporan per tugas pekerja")
+    parser.add_argument("--uji", action="store_true", help="jalankan uji mandiri")
+    parser.add_argument("--jumlah", type=int, default=50, help="jumlah skenario contoh untuk --uji")
+    args = parser.parse_args(argv)
+    if args.uji:
+        return uji(args.jumlah, args.pekerja)
+    if args.masukan is None:
+        parser.error("masukan wajib diisi (atau gunakan --uji)")
+
+    keluaran = sys.stdout if args.keluaran == "-" else open(args.keluaran, "w", encoding="utf-8")
+    mulai = time.perf_counter()
+    try:
+        jumlah, galat = jalankan(batch_model.baca_skenario(args.masukan), args.direktori, keluaran, args.format,
+                                 args.dpi, args.pekerja, args.ukuran_potongan)
+    finally:
+        if keluaran is not sys.stdout:
+            keluaran.close()
+    durasi = time.perf_counter() - mulai
+    print(f"{jumlah} laporan ({galat} galat) dalam {durasi:.2f} s — {jumlah / max(durasi, 1e-9):,.1f} halaman/s",
+          file=sys.stderr)
+    return 1 if galat else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""Layanan HTTP/JSON lokal untuk model_inti (LP produksi, EOQ, antrian, turunan).
+
+Endpoint (POST, body JSON):
+    /lp_produksi       {"profit": [..], "A": [[..]], "b": [..]}
+    /eoq               {"D": .., "S": .., "H": ..}
+    /antrian_mm1       {"lam": .., "mu": ..}
+    /turunan_parsial   {"fungsi": "x**2 + y**2", "x0": .., "y0": ..}
+Body boleh satu objek, list objek, atau {"batch": [..]}; jawabannya
+{"hasil": objek} atau {"hasil": [..]} dengan urutan yang sama.
+
+GET /statistik memberi latensi per endpoint (p50/p95/p99) dan rata-rata ukuran
+batch; GET /kesehatan untuk pemeriksaan hidup.
+
+Permintaan kecil yang datang bersamaan ke endpoint yang sama digabung oleh
+satu thread pengumpul per endpoint menjadi satu panggilan tervektorisasi:
+EOQ/antrian/turunan memakai array NumPy, LP digabung menjadi satu LP
+blok-diagonal. Fungsi sympy terkompilasi di-cache di model_inti.
+
+Contoh:
+    python layanan_model.py --port 8765
+    curl -s localhost:8765/eoq -d '{"D": 50000, "S": 250000, "H": 1000}'
+    python layanan_model.py --uji        # uji mandiri di localhost, exit 1 bila gagal
+"""
+import argparse
+import json
+import math
+import queue
+import sys
+import threading
+import time
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import model_inti
+from profiler import Histogram
+
+JENDELA_MS = 1.0
+MAKS_BATCH = 256
+SAMPEL_LATENSI = 4096
+
+
+def _batch_lp(daftar):
+    return model_inti.lp_produksi_banyak(daftar)
+
+
+def _batch_eoq(daftar):
+    v = model_inti.eoq_vektor(*([d[k] for d in daftar] for k in ("D", "S", "H")))
+    return [{k: float(v[k][i]) for k in v} for i in range(len(daftar))]
+
+
+def _batch_antrian(daftar):
+    v = model_inti.antrian_mm1_vektor([d["lam"] for d in daftar], [d["mu"] for d in daftar])
+    hasil = []
+    for i in range(len(daftar)):
+        if v["stabil"][i]:
+            hasil.append({"stabil": True, **{k: float(v[k][i]) for k in ("rho", "L", "Lq", "W", "Wq")}})
+        else:
+            hasil.append({"stabil": False})
+    return hasil
+
+
+def _batch_turunan(daftar):
+    # Satu panggilan tervektorisasi per teks fungsi
+    hasil = [None] * len(daftar)
+    kelompok = {}
+    for i, d in enumerate(daftar):
+        kelompok.setdefault(d["fungsi"], []).append(i)
+    for fungsi, indeks in kelompok.items():
+        v = model_inti.turunan_parsial_vektor(fungsi, [daftar[i]["x0"] for i in indeks],
+                                              [daftar[i]["y0"] for i in indeks])
+        for j, i in enumerate(indeks):
+            hasil[i] = {k: float(v[k][j]) for k in ("f", "fx", "fy")}
+    return hasil
+
+
+FUNGSI_BATCH = {
+    "lp_produksi": _batch_lp,
+    "eoq": _batch_eoq,
+    "antrian_mm1": _batch_antrian,
+    "turunan_parsial": _batch_turunan,
+}
+
+
+def _hingga(nilai):
+    """True bila semua angka di dalam hasil (dict/list bersarang) berhingga."""
+    if isinstance(nilai, dict):
+        return all(_hingga(v) for v in nilai.values())
+    if isinstance(nilai, list):
+        return all(_hingga(v) for v in nilai)
+    return not isinstance(nilai, float) or math.isfinite(nilai)
+
+
+def _satu(model, masukan):
+    """Jalur per item: hasil model_inti, atau galat untuk masukan tidak valid/hasil tak berhingga."""
+    try:
+        with np.errstate(all="ignore"):
+            hasil = model_inti.jalankan(model, masukan)
+    except Exception as e:
+        return {"galat": f"{type(e).__name__}: {e}"}
+    if not _hingga(hasil):
+        return {"galat": "ValueError: hasil tidak terdefinisi (NaN/tak hingga) untuk masukan ini"}
+    return hasil
+
+
+def _aman(model, daftar):
+    """Jalur tervektorisasi; item yang salah dihitung ulang per item agar galat hanya di item itu.
+
+    Baris tervektorisasi yang tidak berhingga (mis. H = 0 atau λ = 0) juga lewat jalur per
+    item, sehingga kedua jalur memberi galat yang sama dan JSON tidak pernah berisi NaN/Infinity.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            hasil = FUNGSI_BATCH[model](daftar)
+    except Exception:
+        return [_satu(model, d) for d in daftar]
+    return [h if _hingga(h) else _satu(model, d) for h, d in zip(hasil, daftar)]
+
+
+class _Permintaan:
+    __slots__ = ("masukan", "hasil", "selesai")
+
+    def __init__(self, masukan):
+        self.masukan = masukan
+        self.hasil = None
+        self.selesai = threading.Event()
+
+
+class Pengumpul:
+    """Gabungkan permintaan bersamaan untuk satu model menjadi batch tervektorisasi."""
+
+    def __init__(self, model, jendela_ms=JENDELA_MS, maks_batch=MAKS_BATCH, statistik=None):
+        self.model = model
+        self.jendela = jendela_ms / 1000
+        self.maks_batch = maks_batch
+        self.statistik = statistik
+        self._antre = queue.SimpleQueue()
+        threading.Thread(target=self._loop, daemon=True, name=f"pengumpul-{model}").start()
+
+    def kirim(self, masukan):
+        permintaan = _Permintaan(masukan)
+        self._antre.put(permintaan)
+        permintaan.selesai.wait()
+        return permintaan.hasil
+
+    def _loop(self):
+        while True:
+            kelompok = [self._antre.get()]
+            n = len(kelompok[0].masukan)
+            batas = time.monotonic() + self.jendela
+            while n < self.maks_batch:
+                sisa = batas - time.monotonic()
+                try:
+                    p = self._antre.get(timeout=sisa) if sisa > 0 else self._antre.get_nowait()
+                except queue.Empty:
+                    break
+                kelompok.append(p)
+                n += len(p.masukan)
+
+            semua = [d for p in kelompok for d in p.masukan]
+            hasil = []
+            for i in range(0, len(semua), self.maks_batch):
+                hasil.extend(_aman(self.model, semua[i:i + self.maks_batch]))
+            if self.statistik is not None:
+                self.statistik.catat_batch(self.model, len(semua))
+
+            awal = 0
+            for p in kelompok:
+                p.hasil = hasil[awal:awal + len(p.masukan)]
+                awal += len(p.masukan)
+                p.selesai.set()
+
+
+class Statistik:
+    """Latensi per endpoint: histogram profiler + sampel terbaru untuk persentil."""
+
+    def __init__(self):
+        self._kunci = threading.Lock()
+        self._histogram = {}
+        self._sampel = {}
+        self._batch = {}
+
+    def catat(self, endpoint, ms):
+        with self._kunci:
+            self._histogram.setdefault(endpoint, Histogram()).tambah(ms)
+            self._sampel.setdefault(endpoint, deque(maxlen=SAMPEL_LATENSI)).append(ms)
+
+    def catat_batch(self, model, ukuran):
+        with self._kunci:
+            jumlah, total = self._batch.get(model, (0, 0))
+            self._batch[model] = (jumlah + 1, total + ukuran)
+
+    def ringkasan(self):
+        with self._kunci:
+            hasil = {}
+            for endpoint, h in self._histogram.items():
+                sampel = sorted(self._sampel[endpoint])
+                jumlah_batch, total_item = self._batch.get(endpoint, (0, 0))
+                hasil[endpoint] = {
+                    "permintaan": h.jumlah,
+                    "rata_ms": round(h.rata_ms, 3),
+                    "p50_ms": round(_persentil(sampel, 50), 3),
+                    "p95_ms": round(_persentil(sampel, 95), 3),
+                    "p99_ms": round(_persentil(sampel, 99), 3),
+                    "maks_ms": round(h.maks_ms, 3),
+                    "batch": jumlah_batch,
+                    "rata_item_per_batch": round(total_item / jumlah_batch, 2) if jumlah_batch else 0.0,
+                }
+            return hasil
+
+
+def _persentil(terurut, p):
+    if not terurut:
+        return 0.0
+    return terurut[min(len(terurut) - 1, math.ceil(p / 100 * len(terurut)) - 1)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "LayananModel/1.0"
+
+    def _kirim_json(self, status, data):
+        try:
+            body = json.dumps(data, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        except ValueError:
+            # Cadangan: jangan pernah mengirim token NaN/Infinity yang bukan JSON standar
+            status, body = 500, json.dumps({"galat": "Hasil berisi NaN/tak hingga"}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/statistik":
+            self._kirim_json(200, self.server.statistik.ringkasan())
+        elif self.path == "/kesehatan":
+            self._kirim_json(200, {"status": "ok", "model": list(FUNGSI_BATCH)})
+        else:
+            self._kirim_json(404, {"galat": f"Endpoint {self.path} tidak dikenal"})
+
+    def do_POST(self):
+        mulai = time.perf_counter()
+        model = self.path.strip("/")
+        if model not in FUNGSI_BATCH:
+            self._kirim_json(404, {"galat": f"Model '{model}' tidak dikenal; pilih salah satu dari {', '.join(FUNGSI_BATCH)}"})
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+        except ValueError as e:
+            self._kirim_json(400, {"galat": f"JSON tidak valid: {e}"})
+            return
+
+        tunggal = isinstance(body, dict) and "batch" not in body
+        masukan = [body] if tunggal else body["batch"] if isinstance(body, dict) else body
+        if not isinstance(masukan, list) or not all(isinstance(d, dict) for d in masukan):
+            self._kirim_json(400, {"galat": "Body harus objek, list objek, atau {\"batch\": [...]}"})
+            return
+
+        hasil = self.server.pengumpul[model].kirim(masukan) if masukan else []
+        self._kirim_json(200, {"hasil": hasil[0] if tunggal else hasil})
+        self.server.statistik.catat(model, (time.perf_counter() - mulai) * 1000)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Antrean listen bawaan (5) terlalu kecil untuk banyak klien bersamaan
+    request_queue_size = 128
+
+
+def buat_server(host="127.0.0.1", port=8765, jendela_ms=JENDELA_MS, maks_batch=MAKS_BATCH, verbose=False):
+    server = _Server((host, port), _Handler)
+    server.verbose = verbose
+    server.statistik = Statistik()
+    server.pengumpul = {m: Pengumpul(m, jendela_ms, maks_batch, server.statistik) for m in FUNGSI_BATCH}
+    return server
+
+
+def _post(url, data):
+    permintaan = urllib.request.Request(url, json.dumps(data).encode(), {"Content-Type": "application/json"})
+    with urllib.request.urlopen(permintaan, timeout=30) as r:
+        return json.loads(r.read())["hasil"]
+
+
+def uji_mandiri(jumlah=400, paralel=32):
+    """Jalankan server di port acak localhost, kirim permintaan bersamaan, bandingkan dengan model_inti."""
+    server = buat_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    kasus = []
+    for i in range(jumlah):
+        jenis = i % 4
+        if jenis == 0:
+            kasus.append(("eoq", {"D": 1000 + i, "S": 50000, "H": 2000}))
+        elif jenis == 1:
+            kasus.append(("lp_produksi", {"profit": [50000 + i, 80000], "A": [[2, 4], [4, 5]], "b": [1200, 1600 + i]}))
+        elif jenis == 2:
+            kasus.append(("antrian_mm1", {"lam": 1 + i % 12, "mu": 10.0}))
+        else:
+            kasus.append(("turunan_parsial", {"fungsi": "sin(x)*y + x**2", "x0": i / 100, "y0": 1.0}))
+
+    gagal = 0
+    try:
+        with ThreadPoolExecutor(paralel) as pool:
+            jawaban = list(pool.map(lambda k: _post(f"{url}/{k[0]}", k[1]), kasus))
+        for (model, masukan), hasil in zip(kasus, jawaban):
+            harapan = model_inti.jalankan(model, masukan)
+            if not _sama(hasil, harapan):
+                gagal += 1
+                print(f"GAGAL {model} {masukan}: {hasil} != {harapan}")
+
+        batch = [m for k, m in kasus if k == "eoq"]
+        if not _sama(_post(f"{url}/eoq", {"batch": batch}), [_post(f"{url}/eoq", m) for m in batch]):
+            gagal += 1
+            print("GAGAL batch eoq tidak sama dengan permintaan tunggal")
+
+        with urllib.request.urlopen(f"{url}/statistik") as r:
+            statistik = json.loads(r.read())
+    finally:
+        server.shutdown()
+
+    for endpoint, s in statistik.items():
+        print(f"{endpoint:16s} n={s['permintaan']:4d}  p50={s['p50_ms']:7.2f} ms  p95={s['p95_ms']:7.2f} ms  "
+              f"p99={s['p99_ms']:7.2f} ms  item/batch={s['rata_item_per_batch']:.1f}")
+    print("OK" if not gagal else f"{gagal} GAGAL")
+    return 1 if gagal else 0
+
+
+def _sama(a, b, tol=1e-6):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_sama(a[k], b[k], tol) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_sama(u, v, tol) for u, v in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return math.isclose(a, b, rel_tol=tol, abs_tol=tol)
+    return a == b
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP/JSON lokal untuk model_inti")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jendela-ms", type=float, default=JENDELA_MS, help="waktu tunggu pengumpulan batch")
+    parser.add_argument("--maks-batch", type=int, default=MAKS_BATCH)
+    parser.add_argument("--verbose", action="store_true", help="log setiap permintaan")
+    parser.add_argument("--uji", action="store_true", help="uji mandiri di localhost lalu keluar")
+    args = parser.parse_args(argv)
+
+    if args.uji:
+        return uji_mandiri()
+    server = buat_server(args.host, args.port, args.jendela_ms, args.maks_batch, args.verbose)
+    print(f"Layanan model di http://{args.host}:{server.server_address[1]} (Ctrl+C untuk berhenti)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Medan vektor gradien dan turunan berarah di atas grid kasar.
+
+Grid kasar diambil dari grid utama dengan langkah (stride) sehingga jumlah
+panah tidak melebihi batas, berapa pun resolusi grid utama. Kedua turunan
+parsial dihitung dalam satu pemanggilan tervektorisasi.
+"""
+import numpy as np
+
+MAKS_PANAH = 400
+
+
+def grid_kasar(xs, ys, maks_panah=MAKS_PANAH):
+    """Ambil sub-grid dari sumbu grid utama dengan jumlah titik <= maks_panah."""
+    langkah = max(1, int(np.ceil(np.sqrt(len(xs) * len(ys) / maks_panah))))
+    return xs[::langkah], ys[::langkah]
+
+
+def hitung_medan(grad_np, xs, ys):
+    """Evaluasi [∂f/∂x, ∂f/∂y] sekali di seluruh grid; kembalikan (X, Y, gx, gy)."""
+    X, Y = np.meshgrid(xs, ys)
+    with np.errstate(all="ignore"):
+        gx, gy = grad_np(X, Y)
+    gx = np.broadcast_to(np.asarray(gx, dtype=float), X.shape)
+    gy = np.broadcast_to(np.asarray(gy, dtype=float), X.shape)
+    return X, Y, gx, gy
+
+
+def turunan_berarah(gx, gy, sudut_derajat):
+    """D_u f = ∇f · u dengan u = (cos θ, sin θ)."""
+    theta = np.deg2rad(sudut_derajat)
+    return gx * np.cos(theta) + gy * np.sin(theta)
+
+
+def gambar_medan(ax, X, Y, gx, gy, gaya="panah"):
+    """Gambar medan gradien sebagai panah (dinormalisasi, warna = besar) atau streamline."""
+    besar = np.hypot(gx, gy)
+    if gaya == "streamline":
+        ax.streamplot(X[0], Y[:, 0], gx, gy, color="white", linewidth=0.7, density=1.2, arrowsize=0.8)
+        return
+    with np.errstate(all="ignore"):
+        ux = np.where(besar > 0, gx / besar, 0.0)
+        uy = np.where(besar > 0, gy / besar, 0.0)
+    ax.quiver(X, Y, ux, uy, besar, cmap="autumn", pivot="mid", angles="xy", scale_units="xy",
+              scale=1.5 / (X[0, 1] - X[0, 0]) if X.shape[1] > 1 else None, width=0.003)
+
+
+def gambar_turunan_berarah(ax, X, Y, du, x0, y0, sudut_derajat, batas):
+    """Garis kontur D_u f di grid kasar dan panah vektor arah u di (x0, y0)."""
+    kontur = ax.contour(X, Y, du, levels=10, cmap="coolwarm", linewidths=1.0)
+    ax.clabel(kontur, fontsize=7, fmt="%.2g")
+    theta = np.deg2rad(sudut_derajat)
+    panjang = 0.15 * min(batas[0][1] - batas[0][0], batas[1][1] - batas[1][0])
+    ax.annotate("", xy=(x0 + np.cos(theta) * panjang, y0 + np.sin(theta) * panjang), xytext=(x0, y0),
+                arrowprops=dict(arrowstyle="->", color="cyan", linewidth=2))
@@ -0,0 +1,242 @@
+"""Mode akuntansi memori per rerun berbasis tracemalloc.
+
+Aktifkan dengan MEMORI_AKTIF=1 atau centang "Mode Memori" di sidebar.
+Setiap rerun diambil snapshot alokasi di awal dan akhir script; selisihnya
+diatribusikan ke baris kode dan modul penyebabnya. Bila total pertumbuhan
+sebuah sesi melebihi MEMORI_BUDGET_MB (default 50 MB) ditampilkan peringatan.
+
+Catatan: tracemalloc bersifat global per proses, jadi bila beberapa sesi
+rerun bersamaan, atribusi satu sesi bisa ikut memuat alokasi sesi lain.
+Pelacakan hanya menyala selama ada sesi yang mengaktifkan mode ini: setiap
+sesi dicatat saat menyalakannya dan dilepas saat mematikannya (atau saat
+sesinya sudah tidak aktif), dan tracemalloc dihentikan bila tidak ada lagi.
+
+Pemeriksaan kebocoran (exit code 1 bila melewati ambang):
+    python memori.py --rerun 1000 --ambang-mb 20
+    python memori.py turunan_parsial.py --rerun 200
+Pertumbuhan diukur setelah pemanasan (cache yang sekali terisi tidak dihitung
+bocor). Uji per aplikasi ditandai lambat: `python -m pytest tests/test_memori.py --lambat`.
+"""
+import argparse
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+
+BUDGET_MB = float(os.environ.get("MEMORI_BUDGET_MB", "50"))
+_aktif_global = os.environ.get("MEMORI_AKTIF", "0") == "1"
+_lokal = threading.local()
+# Sesi yang sedang menyalakan mode memori; tracemalloc berjalan selama himpunan ini tidak kosong
+_sesi_nyala = set()
+_kunci = threading.Lock()
+_dimulai_di_sini = False
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+# Aplikasi yang diperiksa oleh `python memori.py` (file kosong dilewati)
+APLIKASI = [
+    "turunan_parsial.py",
+    "industri_ban_app.py",
+    "Analisis_laba_industri_app.py",
+    "analisis_laba_app.py",
+    "app_optimasi_produksi.py",
+    "app_optimasi_produksi_full.py",
+    "eoq_app.py",
+    "eoq_brosur_benner_app.py",
+    "optimasi_banner_brosur.py",
+    "optimasi_banner_brosur_input.py",
+    "optimasi_bendera_brosur_app.py",
+    "optimasi_bendera_brosur_app_grafik.py",
+    "optimasi_benner_brosur_app.py",
+    "optimasi_benner_brosur_fixx.py",
+    "optimasi_benner_brosur_revisi.py",
+    "analisis_bener_brosur_app.py",
+]
+
+
+def selisih_per_baris(awal, akhir, batas=10):
+    """Pertumbuhan alokasi (byte) per baris kode, terbesar lebih dulu."""
+    statistik = akhir.compare_to(awal, "lineno")
+    hasil = []
+    for s in statistik:
+        if s.size_diff <= 0:
+            continue
+        frame = s.traceback[0]
+        hasil.append((f"{frame.filename}:{frame.lineno}", s.size_diff, s.count_diff))
+        if len(hasil) >= batas:
+            break
+    return hasil
+
+
+def selisih_per_modul(awal, akhir):
+    """Pertumbuhan alokasi (byte) dijumlahkan per file modul."""
+    per_modul = defaultdict(int)
+    for s in akhir.compare_to(awal, "filename"):
+        per_modul[s.traceback[0].filename] += s.size_diff
+    return sorted(((m, b) for m, b in per_modul.items() if b > 0), key=lambda t: -t[1])
+
+
+def _kunci_sesi(session_state):
+    """Identitas sesi Streamlit (session_id) atau, di luar Streamlit, objek state-nya."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except ImportError:
+        ctx = None
+    return ctx.session_id if ctx is not None else id(session_state)
+
+
+def _buang_sesi_mati():
+    """Lepas sesi yang ditutup tanpa sempat mematikan mode memori."""
+    try:
+        from streamlit.runtime import Runtime
+        runtime = Runtime.instance()
+    except (ImportError, RuntimeError):
+        return
+    _sesi_nyala.difference_update([k for k in _sesi_nyala if isinstance(k, str) and not runtime.is_active_session(k)])
+
+
+def atur_pelacakan(kunci, nyala):
+    """Catat/lepas satu sesi; mulai tracemalloc untuk sesi pertama dan hentikan setelah sesi terakhir."""
+    global _dimulai_di_sini
+    with _kunci:
+        if nyala:
+            _sesi_nyala.add(kunci)
+        else:
+            _sesi_nyala.discard(kunci)
+        _buang_sesi_mati()
+        if _sesi_nyala and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _dimulai_di_sini = True
+        elif not _sesi_nyala and _dimulai_di_sini:
+            # Jangan hentikan pelacakan yang dinyalakan pihak lain (PYTHONTRACEMALLOC, periksa_kebocoran)
+            tracemalloc.stop()
+            _dimulai_di_sini = False
+
+
+def mulai(session_state=None, sidebar=True, nyala=None):
+    """Dipanggil di awal script: ambil snapshot bila mode memori aktif untuk sesi ini."""
+    if nyala is None:
+        nyala = _aktif_global
+    if sidebar:
+        import streamlit as st
+        nyala = st.sidebar.checkbox("🧠 Mode Memori", value=nyala)
+        if session_state is None:
+            session_state = st.session_state
+
+    _lokal.awal = None
+    atur_pelacakan(_kunci_sesi(session_state), nyala)
+    if not nyala:
+        return
+    _lokal.state = session_state
+    _lokal.awal = tracemalloc.take_snapshot()
+
+
+def selesai(tampilkan=True):
+    """Dipanggil di akhir script: hitung pertumbuhan rerun ini dan cek budget sesi."""
+    awal = getattr(_lokal, "awal", None)
+    if awal is None or not tracemalloc.is_tracing():
+        return None
+    akhir = tracemalloc.take_snapshot()
+    _lokal.awal = None
+
+    baris = selisih_per_baris(awal, akhir)
+    modul = selisih_per_modul(awal, akhir)
+    tumbuh = sum(b for _, b in modul)
+
+    state = _lokal.state
+    total_sesi = tumbuh
+    if state is not None:
+        total_sesi = state.get("_memori_total", 0) + tumbuh
+        state["_memori_total"] = total_sesi
+
+    if tampilkan:
+        import streamlit as st
+        with st.sidebar.expander("🧠 Memori", expanded=True):
+            st.write(f"Pertumbuhan rerun ini: {tumbuh / 2**20:.2f} MB")
+            st.write(f"Total sesi: {total_sesi / 2**20:.2f} MB (budget {BUDGET_MB:.0f} MB)")
+            st.dataframe([{"baris": b, "KB": round(n / 1024, 1), "blok": c} for b, n, c in baris])
+            st.dataframe([{"modul": m, "KB": round(n / 1024, 1)} for m, n in modul[:10]])
+        if total_sesi > BUDGET_MB * 2**20:
+            st.warning(f"⚠️ Memori sesi ini tumbuh {total_sesi / 2**20:.1f} MB, melebihi budget {BUDGET_MB:.0f} MB.")
+    return tumbuh, baris, modul
+
+
+def _terlacak():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def periksa_kebocoran(file_app, rerun=1000, pemanasan=3, maks_pemanasan=60, jendela=5, toleransi=256 * 1024,
+                      timeout=60.0, jendela_ukur=4):
+    """Jalankan aplikasi berulang kali lewat AppTest dan kembalikan
+    (pertumbuhan_byte, baris_teratas) setelah fase pemanasan.
+
+    Pemanasan (cache, import, font matplotlib) diteruskan per `jendela` rerun sampai
+    satu jendela tumbuh kurang dari `toleransi` byte, paling lama `maks_pemanasan`
+    rerun. `rerun` rerun berikutnya dibagi `jendela_ukur` jendela; laju median
+    antarjendela diproyeksikan ke `rerun` rerun, sehingga lonjakan sekali (cache yang
+    baru penuh, siklus gc yang terlambat) tidak terhitung sedangkan kebocoran yang
+    tumbuh di setiap jendela tetap terlihat. Baris teratas diambil dari jendela median.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(FOLDER, file_app), default_timeout=timeout)
+    for _ in range(pemanasan):
+        at.run()
+    if at.exception:
+        raise RuntimeError(f"{file_app}: {at.exception[0].message}")
+
+    tracemalloc.start()
+    try:
+        sebelum = _terlacak()
+        for _ in range(0, maks_pemanasan, jendela):
+            for _ in range(jendela):
+                at.run()
+            sekarang = _terlacak()
+            if sekarang - sebelum < toleransi:
+                break
+            sebelum = sekarang
+
+        batas = sorted({rerun * k // jendela_ukur for k in range(jendela_ukur + 1)})
+        laju = []
+        awal = tracemalloc.take_snapshot()
+        for dari, sampai in zip(batas, batas[1:]):
+            for _ in range(sampai - dari):
+                at.run()
+            gc.collect()
+            akhir = tracemalloc.take_snapshot()
+            tumbuh = sum(b for _, b in selisih_per_modul(awal, akhir))
+            laju.append((tumbuh / (sampai - dari), selisih_per_baris(awal, akhir, batas=5)))
+            awal = akhir
+    finally:
+        tracemalloc.stop()
+
+    per_rerun, baris = sorted(laju, key=lambda t: t[0])[len(laju) // 2]
+    return per_rerun * rerun, baris
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Periksa kebocoran memori aplikasi lewat rerun berulang.")
+    parser.add_argument("aplikasi", nargs="*", default=APLIKASI)
+    parser.add_argument("--rerun", type=int, default=1000)
+    parser.add_argument("--ambang-mb", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    gagal = False
+    for file_app in args.aplikasi:
+        if os.path.getsize(os.path.join(FOLDER, file_app)) == 0:
+            continue
+        tumbuh, baris = periksa_kebocoran(file_app, args.rerun)
+        status = "OK" if tumbuh <= args.ambang_mb * 2**20 else "BOCOR"
+        gagal |= status == "BOCOR"
+        print(f"{status:5s} {file_app:40s} +{tumbuh / 2**20:.2f} MB per {args.rerun} rerun setelah pemanasan")
+        if status == "BOCOR":
+            for lokasi, b, _ in baris:
+                print(f"      {lokasi}  +{b / 1024:.1f} KB")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Inti komputasi model yang dipakai aplikasi Streamlit dan batch CLI.
+
+Setiap model menerima parameter bernama yang sama dengan kunci masukan di
+penyimpanan skenario dan mengembalikan dict berisi tipe JSON biasa, sehingga
+hasilnya bisa disimpan, dikirim antar-proses, atau ditulis sebagai JSON-lines.
+"""
+from functools import lru_cache
+
+import numpy as np
+import scipy.sparse as sps
+import sympy as sp
+from scipy.optimize import linprog
+
+from parser_aman import parse_dan_turunkan
+
+
+def lp_produksi(profit, A, b):
+    """Maksimasi profit·x dengan A x <= b, x >= 0 (linprog/HiGHS)."""
+    c = [-p for p in profit]
+    res = linprog(c, A_ub=A, b_ub=b, bounds=[(0, None)] * len(c), method="highs")
+    if not res.success:
+        return {"sukses": False, "x": None, "keuntungan": None}
+    return {"sukses": True, "x": [float(v) for v in res.x], "keuntungan": float(-res.fun)}
+
+
+def lp_produksi_banyak(daftar):
+    """Selesaikan banyak LP produksi independen dalam satu panggilan HiGHS.
+
+    LP-LP digabung menjadi satu LP blok-diagonal (sparse); karena saling lepas,
+    optimum gabungan sama dengan optimum masing-masing. Bila LP gabungan gagal
+    (ada satu yang tidak layak/tak terbatas), setiap LP diselesaikan sendiri.
+    """
+    if len(daftar) == 1:
+        return [lp_produksi(**daftar[0])]
+    c = np.concatenate([-np.asarray(d["profit"], dtype=float) for d in daftar])
+    A = sps.block_diag([np.asarray(d["A"], dtype=float) for d in daftar], format="csr")
+    b = np.concatenate([np.asarray(d["b"], dtype=float) for d in daftar])
+    res = linprog(c, A_ub=A, b_ub=b, bounds=(0, None), method="highs")
+    if not res.success:
+        return [lp_produksi(**d) for d in daftar]
+    hasil = []
+    awal = 0
+    for d in daftar:
+        n = len(d["profit"])
+        x = res.x[awal:awal + n]
+        hasil.append({"sukses": True, "x": [float(v) for v in x], "keuntungan": float(np.dot(d["profit"], x))})
+        awal += n
+    return hasil
+
+
+def sapuan_kapasitas(profit, A, b, indeks, kapasitas, kemajuan=None, potongan=200):
+    """Keuntungan optimal untuk setiap nilai kapasitas sumber daya ke-`indeks` (sumber daya lain tetap).
+
+    LP diselesaikan per potongan lewat `lp_produksi_banyak`; `kemajuan(fraksi)` (opsional)
+    dipanggil setelah setiap potongan. Kapasitas yang tidak layak bernilai NaN.
+    """
+    keuntungan = np.full(len(kapasitas), np.nan)
+    for awal in range(0, len(kapasitas), potongan):
+        bagian = kapasitas[awal:awal + potongan]
+        daftar = [{"profit": profit, "A": A, "b": [k if j == indeks else v for j, v in enumerate(b)]} for k in bagian]
+        for i, h in enumerate(lp_produksi_banyak(daftar)):
+            if h["sukses"]:
+                keuntungan[awal + i] = h["keuntungan"]
+        if kemajuan is not None:
+            kemajuan((awal + len(bagian)) / len(kapasitas))
+    return keuntungan
+
+
+def _wajib_positif(**nilai):
+    """ValueError bila ada parameter yang tidak lebih besar dari 0 (termasuk NaN)."""
+    for nama, v in nilai.items():
+        if not v > 0:
+            raise ValueError(f"{nama} harus lebih besar dari 0 (sekarang {v})")
+
+
+def eoq(D, S, H):
+    """EOQ = √(2DS/H) beserta biaya pemesanan, penyimpanan dan total tahunan."""
+    _wajib_positif(D=D, S=S, H=H)
+    Q = float(np.sqrt((2 * D * S) / H))
+    OC = (D / Q) * S
+    HC = (Q / 2) * H
+    return {"EOQ": Q, "OC": OC, "HC": HC, "TC": OC + HC}
+
+
+def eoq_vektor(D, S, H):
+    """EOQ untuk array D, S, H sekaligus; setiap nilai dict berupa array."""
+    D, S, H = (np.asarray(v, dtype=float) for v in (D, S, H))
+    Q = np.sqrt((2 * D * S) / H)
+    OC = (D / Q) * S
+    HC = (Q / 2) * H
+    return {"EOQ": Q, "OC": OC, "HC": HC, "TC": OC + HC}
+
+
+def kurva_eoq(D, S, H, Q):
+    """Biaya pemesanan, penyimpanan dan total untuk array jumlah pesan Q."""
+    OC = (D / Q) * S
+    HC = (Q / 2) * H
+    return OC, HC, OC + HC
+
+
+def antrian_mm1(lam, mu):
+    """Ukuran kinerja antrian M/M/1; stabil hanya bila λ < μ."""
+    _wajib_positif(lam=lam, mu=mu)
+    if lam >= mu:
+        return {"stabil": False}
+    rho = lam / mu
+    L = rho / (1 - rho)
+    Lq = rho**2 / (1 - rho)
+    return {"stabil": True, "rho": rho, "L": L, "Lq": Lq, "W": L / lam, "Wq": Lq / lam}
+
+
+def antrian_mm1_vektor(lam, mu):
+    """M/M/1 untuk array λ, μ sekaligus; ukuran kinerja NaN di baris yang tidak stabil."""
+    lam, mu = (np.asarray(v, dtype=float) for v in (lam, mu))
+    stabil = lam < mu
+    with np.errstate(all="ignore"):
+        rho = np.where(stabil, lam / mu, np.nan)
+        L = rho / (1 - rho)
+        Lq = rho**2 / (1 - rho)
+        return {"stabil": stabil, "rho": rho, "L": L, "Lq": Lq, "W": L / lam, "Wq": Lq / lam}
+
+
+@lru_cache(maxsize=256)
+def _kompilasi(fungsi):
+    """Parse dan turunkan f(x, y) di pekerja parser_aman (dengan batas waktu), lalu kompilasi sekali per teks."""
+    f, (fx, fy) = parse_dan_turunkan(fungsi, ("x", "y"))
+    return sp.lambdify(sp.symbols("x y"), [f, fx, fy], "numpy")
+
+
+def turunan_parsial(fungsi, x0, y0):
+    """Nilai f, ∂f/∂x dan ∂f/∂y di (x0, y0)."""
+    f, fx, fy = (float(v) for v in _kompilasi(fungsi)(x0, y0))
+    return {"f": f, "fx": fx, "fy": fy}
+
+
+def turunan_parsial_vektor(fungsi, x0, y0):
+    """f, ∂f/∂x dan ∂f/∂y di banyak titik sekaligus dengan fungsi terkompilasi yang sama."""
+    x0, y0 = np.asarray(x0, dtype=float), np.asarray(y0, dtype=float)
+    f, fx, fy = (np.broadcast_to(np.asarray(v, dtype=float), x0.shape) for v in _kompilasi(fungsi)(x0, y0))
+    return {"f": f, "fx": fx, "fy": fy}
+
+
+MODEL = {
+    "lp_produksi": lp_produksi,
+    "eoq": eoq,
+    "antrian_mm1": antrian_mm1,
+    "turunan_parsial": turunan_parsial,
+}
+
+
+def jalankan(model, masukan):
+    """Jalankan model berdasarkan nama dengan dict masukan."""
+    if model not in MODEL:
+        raise ValueError(f"Model '{model}' tidak dikenal; pilih salah satu dari {', '.join(MODEL)}")
+    return MODEL[model](**masukan)
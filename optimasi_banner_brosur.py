@@ -3,6 +3,7 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import linprog
+import diagnosis_lp
 
 # Judul Aplikasi
 st.title("📈 Optimasi Produksi Banner dan Brosur")
@@ -58,19 +59,20 @@ if res.success:
     y2 = (material_units - A[1][0]*x_vals) / A[1][1]
     y3 = (labor_hours - A[2][0]*x_vals) / A[2][1]
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(x_vals, y1, label='Kendala Waktu Mesin')
-    plt.plot(x_vals, y2, label='Kendala Bahan Baku')
-    plt.plot(x_vals, y3, label='Kendala Tenaga Kerja')
-    plt.fill_between(x_vals, np.minimum(np.minimum(y1, y2), y3), color='skyblue', alpha=0.4)
-    plt.plot(x, y, 'ro', label='Solusi Optimal')
-    plt.xlim(0, max(x_vals))
-    plt.ylim(0, max(max(y1), max(y2), max(y3)))
-    plt.xlabel("Banner (x)")
-    plt.ylabel("Brosur (y)")
-    plt.legend()
-    plt.grid(True)
-    st.pyplot(plt)
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.plot(x_vals, y1, label='Kendala Waktu Mesin')
+    ax.plot(x_vals, y2, label='Kendala Bahan Baku')
+    ax.plot(x_vals, y3, label='Kendala Tenaga Kerja')
+    ax.fill_between(x_vals, np.minimum(np.minimum(y1, y2), y3), color='skyblue', alpha=0.4)
+    ax.plot(x, y, 'ro', label='Solusi Optimal')
+    ax.set_xlim(0, max(x_vals))
+    ax.set_ylim(0, max(max(y1), max(y2), max(y3)))
+    ax.set_xlabel("Banner (x)")
+    ax.set_ylabel("Brosur (y)")
+    ax.legend()
+    ax.grid(True)
+    st.pyplot(fig)
+    plt.close(fig)
 
     # Visualisasi batang jumlah produksi
     st.subheader("📦 Diagram Produksi")
@@ -78,6 +80,8 @@ if res.success:
     ax2.bar(["Banner", "Brosur"], [x, y], color=["blue", "green"])
     ax2.set_ylabel("Unit Produksi")
     st.pyplot(fig2)
+    plt.close(fig2)
 
 else:
     st.error("❌ Tidak ditemukan solusi optimal.")
+    diagnosis_lp.tampilkan(c, A, b, [x_bounds, y_bounds], ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["x", "y"])
@@ -3,6 +3,7 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import linprog
+import diagnosis_lp
 
 # Judul aplikasi
 st.title("📈 Optimasi Produksi Benner dan Brosur")
@@ -81,3 +82,4 @@ if res.success:
 
 else:
     st.error("❌ Optimasi gagal. Periksa kembali input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, bounds, ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["x", "y"])
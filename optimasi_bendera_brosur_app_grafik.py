@@ -2,6 +2,7 @@
 import streamlit as st
 import numpy as np
 from scipy.optimize import linprog
+import diagnosis_lp
 
 st.title("📈 Optimasi Produksi Bendera dan Brosur")
 
@@ -88,6 +89,7 @@ if res.success:
     ax.grid(True)
 
     st.pyplot(fig)
+    plt.close(fig)
 
 
     # Pemanfaatan sumber daya
@@ -101,3 +103,4 @@ if res.success:
     st.write(f"Tenaga Kerja: {used_labor:.1f} jam / {labor_limit} jam ({(used_labor/labor_limit)*100:.1f}%)")
 else:
     st.error("Optimasi gagal. Silakan periksa input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, [x_bounds, y_bounds], ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["x", "y"])
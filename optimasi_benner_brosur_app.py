@@ -2,6 +2,14 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import linprog  # type: ignore
+import diagnosis_lp
+import penjadwalan
+
+@st.cache_data(max_entries=16)
+def jadwal_produksi(jumlah, jam_per_unit, ukuran_batch, jumlah_mesin, setup, perbaikan):
+    # Hanya dihitung ulang bila masukan jadwal berubah, bukan pada setiap rerun widget lain
+    produk_tugas, durasi_tugas = penjadwalan.buat_tugas(jumlah, jam_per_unit, ukuran_batch)
+    return durasi_tugas, penjadwalan.jadwalkan(durasi_tugas, produk_tugas, jumlah_mesin, setup, perbaikan=perbaikan)
 
 # Judul
 st.title("📈 Optimasi Produksi Benner dan Brosur")
@@ -59,11 +67,57 @@ if res.success:
     st.write("### 📈 Pemanfaatan Sumber Daya")
     st.write(f"- Waktu Mesin: {used_machine:.1f} jam / {machine_limit} jam ({used_machine/machine_limit*100:.1f}%)")
 
-    st.write("### 🕒 Estimasi Hari Kerja")
-    hari_1_shift = used_machine / 8
-    hari_2_shift = used_machine / 16
-    st.write(f"- 1 Shift (8 jam/hari): {hari_1_shift:.1f} → dibulatkan: {np.ceil(hari_1_shift)} hari")
-    st.write(f"- 2 Shift (16 jam/hari): {hari_2_shift:.1f} → dibulatkan: {np.ceil(hari_2_shift)} hari")
+    st.write("### 🕒 Jadwal Produksi Mesin")
+    col1, col2, col3 = st.columns(3)
+    jumlah_mesin = col1.number_input("Jumlah mesin", min_value=1, max_value=50, value=1)
+    shift_per_hari = col2.selectbox("Shift per hari (8 jam)", [1, 2, 3], index=0)
+    hari_per_minggu = col3.selectbox("Hari kerja per minggu", [5, 6, 7], index=1)
+    col1, col2, col3, col4 = st.columns(4)
+    batch_x = col1.number_input("Ukuran batch Benner (unit)", min_value=1, value=1)
+    batch_y = col2.number_input("Ukuran batch Brosur (unit)", min_value=1, value=50)
+    setup_x = col3.number_input("Setup Benner (jam)", min_value=0.0, value=0.5)
+    setup_y = col4.number_input("Setup Brosur (jam)", min_value=0.0, value=0.25)
+    perbaikan = st.checkbox("Perbaiki jadwal dengan pencarian lokal", value=True)
+
+    durasi_tugas, jadwal = jadwal_produksi((x_opt, y_opt), (machine_x, machine_y), (batch_x, batch_y), jumlah_mesin,
+                                           (setup_x, setup_y), perbaikan)
+    hari_kerja, hari_kalender = penjadwalan.ke_kalender(jadwal["makespan"], shift_per_hari, hari_per_minggu)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Makespan", f"{jadwal['makespan']:,.1f} jam")
+    col2.metric("Selesai", f"{hari_kerja} hari kerja", f"hari kalender ke-{hari_kalender}", delta_color="off")
+    col3.metric("Utilisasi rata-rata", f"{jadwal['utilisasi'].mean() * 100:.1f}%")
+    col4.metric("Total setup", f"{jadwal['total_setup']:,.1f} jam")
+    st.caption(f"{len(durasi_tugas):,} batch dijadwalkan dalam {jadwal['durasi_hitung'] * 1000:.0f} ms "
+               f"({jadwal['langkah_perbaikan']} langkah perbaikan). Batas bawah makespan "
+               f"{jadwal['batas_bawah']:,.1f} jam; pekerjaan yang terpotong akhir shift dilanjutkan shift berikutnya.")
+
+    if len(durasi_tugas):
+        fig_jadwal, ax_jadwal = plt.subplots(figsize=(10, 0.5 * jumlah_mesin + 1.5))
+        j = jadwal["jadwal"]
+        for p, (nama, warna) in enumerate([("Benner", "tab:blue"), ("Brosur", "tab:orange")]):
+            for k in range(jumlah_mesin):
+                pilih = (j["mesin"] == k) & (j["produk"] == p)
+                ax_jadwal.broken_barh(list(zip(j["mulai"][pilih], j["selesai"][pilih] - j["mulai"][pilih])),
+                                      (k - 0.4, 0.8), facecolors=warna, edgecolor="white", linewidth=0.3,
+                                      label=nama if k == 0 and pilih.any() else None)
+        ada_setup = ~np.isnan(j["mulai_setup"])
+        for k in range(jumlah_mesin):
+            pilih = ada_setup & (j["mesin"] == k)
+            ax_jadwal.broken_barh(list(zip(j["mulai_setup"][pilih], j["mulai"][pilih] - j["mulai_setup"][pilih])),
+                                  (k - 0.4, 0.8), facecolors="lightgray", hatch="//",
+                                  label="Setup" if k == 0 and pilih.any() else None)
+        jam_per_hari = shift_per_hari * penjadwalan.JAM_PER_SHIFT
+        if hari_kerja <= 60:
+            for d in range(1, hari_kerja + 1):
+                ax_jadwal.axvline(d * jam_per_hari, color="gray", linestyle=":", linewidth=0.7)
+        ax_jadwal.set_yticks(range(jumlah_mesin))
+        ax_jadwal.set_yticklabels([f"Mesin {k + 1} ({u * 100:.0f}%)" for k, u in enumerate(jadwal["utilisasi"])])
+        ax_jadwal.invert_yaxis()
+        ax_jadwal.set_xlabel(f"Jam kerja (garis titik = akhir hari kerja, {jam_per_hari} jam/hari)")
+        ax_jadwal.set_title("Gantt Chart Jadwal Mesin")
+        ax_jadwal.legend(loc="upper right")
+        st.pyplot(fig_jadwal)
+        plt.close(fig_jadwal)
 
     # Simulasi Multi-Minggu
     st.subheader("📅 Simulasi Multi-Minggu")
@@ -107,6 +161,8 @@ if res.success:
     ax.grid(True)
 
     st.pyplot(fig)
+    plt.close(fig)
 
 else:
     st.error("❌ Optimasi gagal. Periksa kembali input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, bounds, ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["Benner (x)", "Brosur (y)"])
@@ -2,6 +2,10 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import linprog
+import diagnosis_lp
+import pareto
+import pekerjaan
+import robust
 
 st.set_page_config(page_title="Optimasi Produksi", layout="centered")
 
@@ -105,6 +109,7 @@ if res.success:
     ax1.legend()
 
     st.pyplot(fig1)
+    plt.close(fig1)
 
     # =========================
     # GRAFIK BATANG PRODUKSI
@@ -129,6 +134,93 @@ if res.success:
                      ha='center', va='bottom')
 
     st.pyplot(fig2)
+    plt.close(fig2)
+
+    # =========================
+    # FRONT PARETO (MULTI-OBJEKTIF)
+    # =========================
+    st.subheader("⚖️ Front Pareto: Keuntungan vs Jam Kerja / Jam Mesin")
+
+    sasaran = st.radio("Minimalkan bersama keuntungan:", ["Jam tenaga kerja", "Jam mesin (keausan)"], horizontal=True)
+    biaya = [tenaga_x, tenaga_y] if sasaran == "Jam tenaga kerja" else [mesin_x, mesin_y]
+    jumlah_titik = st.select_slider("Jumlah nilai ε", options=[50, 100, 200, 500, 1000, 5000], value=200)
+
+    def hitung_front(pek, profit, A, b, biaya, jumlah_titik):
+        return pareto.front_epsilon(profit, A, b, biaya, jumlah_titik, kemajuan=pek.lapor)
+
+    kunci_front = (profit_x, profit_y, tuple(map(tuple, A)), tuple(b), tuple(biaya), jumlah_titik)
+    front, segar = pekerjaan.tampilkan("front_pareto", kunci_front, hitung_front, [profit_x, profit_y], A, b, biaya,
+                                       jumlah_titik, label="Menghitung front Pareto")
+
+    if front is None and segar:
+        st.warning("Front Pareto tidak dapat dihitung untuk parameter ini.")
+    elif front is not None:
+        untung_f, biaya_f, solusi_f = front
+        if not segar:
+            st.caption("Menampilkan front sebelumnya sampai front baru selesai dihitung.")
+
+        fig3, ax3 = plt.subplots()
+        ax3.plot(biaya_f, untung_f, color="gray", alpha=0.6)
+        titik = ax3.scatter(biaya_f, untung_f, c=solusi_f[:, 0], cmap="viridis", s=12)
+        fig3.colorbar(titik, ax=ax3, label="Jumlah produk x")
+        ax3.plot(biaya[0] * x + biaya[1] * y, z, "r*", markersize=14, label="Optimum keuntungan saja")
+        ax3.set_xlabel(sasaran)
+        ax3.set_ylabel("Keuntungan (Rp)")
+        ax3.set_title("Front Pareto (metode epsilon-constraint)")
+        ax3.grid(True)
+        ax3.legend()
+        st.pyplot(fig3)
+        plt.close(fig3)
+        st.caption(f"{len(untung_f)} titik non-dominan dari {jumlah_titik} nilai ε.")
+
+        # Titik sudut: di antaranya keuntungan berubah linear terhadap batas ε
+        sudut = pareto.titik_sudut(untung_f, biaya_f)
+        st.dataframe([{sasaran: biaya_f[i], "Keuntungan (Rp)": untung_f[i],
+                       "Produk x": solusi_f[i, 0], "Produk y": solusi_f[i, 1]} for i in sudut])
+
+    # =========================
+    # MODE ROBUST (KOEFISIEN TIDAK PASTI)
+    # =========================
+    st.subheader("🛡️ Mode Robust: Koefisien Konsumsi Tidak Pasti")
+    st.markdown("Setiap koefisien konsumsi boleh menyimpang ±deviasi dari nilai yang dimasukkan. "
+                "Γ menentukan berapa koefisien per kendala yang diasumsikan menyimpang bersamaan "
+                "(Γ = 2 berarti semua, yaitu ketidakpastian kotak).")
+
+    deviasi_umum = st.slider("Deviasi koefisien (±%)", 0, 50, 10)
+    tabel_deviasi = st.data_editor(
+        {"Sumber daya": ["Jam mesin", "Bahan baku", "Jam kerja"],
+         "Deviasi x (%)": [float(deviasi_umum)] * 3,
+         "Deviasi y (%)": [float(deviasi_umum)] * 3},
+        disabled=["Sumber daya"], key=f"deviasi_robust_{deviasi_umum}")
+    gamma = st.slider("Anggaran ketidakpastian Γ per kendala", 0.0, 2.0, 1.0, step=0.1)
+
+    persen = np.column_stack([tabel_deviasi["Deviasi x (%)"], tabel_deviasi["Deviasi y (%)"]]).astype(float)
+    deviasi = np.abs(np.array(A, dtype=float)) * np.nan_to_num(persen) / 100
+    hasil_robust = robust.selesaikan([profit_x, profit_y], A, b, deviasi, gamma)
+
+    if hasil_robust is None:
+        st.warning("Rencana robust tidak layak untuk deviasi ini.")
+    else:
+        xr, yr = hasil_robust["x_robust"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Keuntungan nominal", f"Rp {hasil_robust['keuntungan_nominal']:,.0f}")
+        col2.metric("Keuntungan robust", f"Rp {hasil_robust['keuntungan_robust']:,.0f}")
+        col3.metric("Harga robustness", f"Rp {hasil_robust['harga_robust']:,.0f}",
+                    f"-{hasil_robust['harga_robust_persen']:.2f}%", delta_color="inverse")
+        st.write(f"Rencana robust: *{xr:.0f} unit* produk x dan *{yr:.0f} unit* produk y.")
+
+        terburuk_nominal = robust.pemakaian_terburuk(A, deviasi, hasil_robust["x_nominal"], gamma)
+        terburuk_robust = robust.pemakaian_terburuk(A, deviasi, hasil_robust["x_robust"], gamma)
+        st.dataframe([{"Sumber daya": nama, "Kapasitas": b[i],
+                       "Terburuk (rencana nominal)": terburuk_nominal[i],
+                       "Terburuk (rencana robust)": terburuk_robust[i]}
+                      for i, nama in enumerate(tabel_deviasi["Sumber daya"])])
+
+        peluang_nominal = robust.peluang_pelanggaran(A, b, deviasi, hasil_robust["x_nominal"])
+        peluang_robust = robust.peluang_pelanggaran(A, b, deviasi, hasil_robust["x_robust"])
+        st.caption(f"Simulasi 10.000 realisasi koefisien (seragam dalam rentangnya): rencana nominal melanggar "
+                   f"kapasitas pada {peluang_nominal:.1%} kasus, rencana robust pada {peluang_robust:.1%} kasus.")
 
 else:
     st.error("❌ Optimasi gagal. Periksa kembali input kendala dan parameter.")
+    diagnosis_lp.tampilkan(c, A, b, bounds, ["Jam mesin", "Bahan baku", "Jam tenaga kerja"], ["x", "y"])
@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 from scipy.optimize import linprog
+import diagnosis_lp
 import matplotlib.pyplot as plt
 
 # Judul aplikasi
@@ -71,6 +72,7 @@ if res.success:
     ax1.bar(["Banner", "Brosur"], [x_opt, y_opt], color=["skyblue", "lightgreen"])
     ax1.set_ylabel("Jumlah Produksi (unit)")
     st.pyplot(fig1)
+    plt.close(fig1)
 
     # === Visualisasi: Penggunaan Sumber Daya ===
     st.subheader("⚙ Pemanfaatan Sumber Daya")
@@ -87,6 +89,8 @@ if res.success:
     ax2.barh(label, digunakan, color="orange", label="Terpakai")
     ax2.legend()
     st.pyplot(fig2)
+    plt.close(fig2)
 
 else:
     st.error("Gagal menyelesaikan optimasi. Silakan cek kembali input parameter.")
+    diagnosis_lp.tampilkan(c, A, b, bounds, ["Waktu mesin", "Bahan baku", "Tenaga kerja"], ["Banner (x)", "Brosur (y)"])
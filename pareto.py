@@ -0,0 +1,150 @@
+"""Front Pareto keuntungan vs biaya sekunder (jam kerja, jam mesin) dengan metode epsilon-constraint.
+
+Untuk setiap ε: maksimalkan profit·x dengan A x <= b, biaya·x <= ε, x >= 0.
+ε disapu dari longgar ke ketat dan dibagi menjadi potongan yang dikerjakan
+paralel. linprog tidak menerima basis awal, jadi "warm start" dilakukan dengan
+memakai ulang solusi sebelumnya selama masih layak untuk ε yang lebih ketat
+(solusi itu tetap optimal karena daerah layaknya hanya menyempit); LP sisanya
+dalam satu potongan digabung menjadi satu LP blok-diagonal (satu panggilan HiGHS).
+"""
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.sparse as sps
+from scipy.optimize import linprog
+
+# Di bawah jumlah titik ini potongan dikerjakan di proses sendiri (overhead pool lebih besar)
+AMBANG_PARALEL = 2000
+JUMLAH_PEKERJA = min(4, os.cpu_count() or 1)
+
+_pool = None
+_kunci_pool = threading.Lock()
+
+
+def _ambil_pool():
+    global _pool
+    with _kunci_pool:
+        if _pool is None:
+            # forkserver: aman dipakai dari server Streamlit yang multithread
+            _pool = ProcessPoolExecutor(JUMLAH_PEKERJA, mp_context=mp.get_context("forkserver"))
+        return _pool
+
+
+def _lp_tunggal(c, A, b, biaya, eps):
+    res = linprog(c, A_ub=np.vstack([A, biaya]), b_ub=np.append(b, eps), bounds=(0, None), method="highs")
+    return res.x if res.success else None
+
+
+def selesaikan_potongan(profit, A, b, biaya, daftar_eps):
+    """Selesaikan potongan ε (urut menurun); kembalikan array solusi (len(eps), n), NaN bila tidak layak."""
+    c = -np.asarray(profit, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    biaya = np.asarray(biaya, dtype=float)
+    n = len(c)
+    solusi = np.full((len(daftar_eps), n), np.nan)
+    if not len(daftar_eps):
+        return solusi
+
+    # ε paling longgar diselesaikan sendiri; solusinya dipakai ulang selama biaya·x <= ε
+    x0 = _lp_tunggal(c, A, b, biaya, daftar_eps[0])
+    sisa = np.arange(len(daftar_eps))
+    if x0 is not None:
+        tercakup = biaya @ x0 <= np.asarray(daftar_eps) + 1e-9 * max(1.0, abs(daftar_eps[0]))
+        solusi[tercakup] = x0
+        sisa = np.flatnonzero(~tercakup)
+    if not len(sisa):
+        return solusi
+
+    # Sisanya digabung menjadi satu LP blok-diagonal
+    blok = sps.vstack([sps.csr_matrix(A), sps.csr_matrix(biaya)])
+    k = len(sisa)
+    res = linprog(np.tile(c, k), A_ub=sps.block_diag([blok] * k, format="csr"),
+                  b_ub=np.concatenate([np.append(b, daftar_eps[i]) for i in sisa]),
+                  bounds=(0, None), method="highs")
+    if res.success:
+        solusi[sisa] = res.x.reshape(k, n)
+    else:
+        for i in sisa:
+            x = _lp_tunggal(c, A, b, biaya, daftar_eps[i])
+            if x is not None:
+                solusi[i] = x
+    return solusi
+
+
+def rentang_epsilon(profit, A, b, biaya):
+    """(ε_min, ε_maks): biaya minimum yang layak dan biaya di solusi keuntungan maksimum."""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    biaya = np.asarray(biaya, dtype=float)
+    res_maks = linprog(-np.asarray(profit, dtype=float), A_ub=A, b_ub=b, bounds=(0, None), method="highs")
+    res_min = linprog(biaya, A_ub=A, b_ub=b, bounds=(0, None), method="highs")
+    if not (res_maks.success and res_min.success):
+        return None
+    return float(res_min.fun), float(biaya @ res_maks.x)
+
+
+def bersihkan_front(keuntungan, nilai_biaya, solusi, toleransi=1e-7):
+    """Buang titik tidak layak, duplikat dan yang terdominasi; urut menurut biaya naik."""
+    ok = np.isfinite(keuntungan)
+    keuntungan, nilai_biaya, solusi = keuntungan[ok], nilai_biaya[ok], solusi[ok]
+    urutan = np.lexsort((-keuntungan, nilai_biaya))
+    skala = max(1.0, float(np.abs(keuntungan).max(initial=0.0)))
+    simpan = []
+    terbaik = -np.inf
+    for i in urutan:
+        # Titik hanya masuk front bila keuntungannya naik dibanding titik berbiaya lebih rendah
+        if keuntungan[i] > terbaik + toleransi * skala:
+            simpan.append(i)
+            terbaik = keuntungan[i]
+    simpan = np.array(simpan, dtype=int)
+    # + 0.0 mengubah -0.0 dari solver menjadi 0.0
+    return keuntungan[simpan] + 0.0, nilai_biaya[simpan] + 0.0, solusi[simpan] + 0.0
+
+
+def front_epsilon(profit, A, b, biaya, jumlah_titik=200, pekerja=None, kemajuan=None):
+    """Front Pareto (keuntungan, biaya, solusi) dengan `jumlah_titik` nilai ε.
+
+    Potongan ε dikerjakan paralel di pool proses bila titiknya banyak; `kemajuan(fraksi)`
+    (opsional) dipanggil setiap satu potongan selesai. Mengembalikan None bila LP tidak layak.
+    """
+    rentang = rentang_epsilon(profit, A, b, biaya)
+    if rentang is None:
+        return None
+    eps_min, eps_maks = rentang
+    daftar_eps = np.linspace(eps_maks, eps_min, jumlah_titik)
+
+    pekerja = pekerja or (JUMLAH_PEKERJA if jumlah_titik >= AMBANG_PARALEL else 1)
+    potongan = [p for p in np.array_split(daftar_eps, max(1, pekerja * 4)) if len(p)]
+    if pekerja > 1:
+        pool = _ambil_pool()
+        futures = [pool.submit(selesaikan_potongan, profit, A, b, biaya, p) for p in potongan]
+        hasil = []
+        for i, f in enumerate(futures):
+            hasil.append(f.result())
+            if kemajuan is not None:
+                kemajuan((i + 1) / len(futures))
+    else:
+        hasil = []
+        for i, p in enumerate(potongan):
+            hasil.append(selesaikan_potongan(profit, A, b, biaya, p))
+            if kemajuan is not None:
+                kemajuan((i + 1) / len(potongan))
+
+    solusi = np.vstack(hasil)
+    keuntungan = solusi @ np.asarray(profit, dtype=float)
+    nilai_biaya = solusi @ np.asarray(biaya, dtype=float)
+    return bersihkan_front(keuntungan, nilai_biaya, solusi)
+
+
+def titik_sudut(keuntungan, nilai_biaya, toleransi=1e-6):
+    """Indeks titik tempat kemiringan front berubah (ujung-ujung segmen linear)."""
+    if len(keuntungan) <= 2:
+        return np.arange(len(keuntungan))
+    kemiringan = np.diff(keuntungan) / np.diff(nilai_biaya)
+    skala = max(1.0, float(np.abs(kemiringan).max()))
+    berubah = np.flatnonzero(np.abs(np.diff(kemiringan)) > toleransi * skala) + 1
+    return np.concatenate([[0], berubah, [len(keuntungan) - 1]])
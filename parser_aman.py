@@ -0,0 +1,241 @@
+"""Parsing ekspresi pengguna yang dibatasi ukuran, kedalaman dan waktu.
+
+Teks diperiksa dulu dengan modul `ast` (panjang, jumlah node, kedalaman,
+besar eksponen, nama fungsi yang diizinkan). Setelah lolos, `sympify` dan
+`diff` dijalankan di proses pekerja terpisah dengan batas waktu keras; bila
+waktu habis, proses pekerja dihentikan dan diganti sehingga satu input buruk
+tidak memperlambat sesi lain.
+
+Pekerjaan simbolik lain (mis. turunan kedua) dapat memakai pekerja yang
+sama lewat `jalankan_terbatas`.
+
+Contoh:
+    f, (fx, fy) = parse_dan_turunkan("x**2 + y**2", ("x", "y"))
+    f = parse("x**2 + y**2", ("x", "y"))  # tanpa turunan
+"""
+import ast
+import math
+import multiprocessing
+import os
+import queue
+import threading
+from functools import lru_cache
+
+import sympy as sp
+
+MAKS_PANJANG = 500
+MAKS_NODE = 300
+MAKS_KEDALAMAN = 40
+MAKS_EKSPONEN = 1000
+BATAS_WAKTU = 3.0  # detik
+JUMLAH_PEKERJA = 2
+
+FUNGSI_DIIZINKAN = {
+    "sin", "cos", "tan", "asin", "acos", "atan", "sinh", "cosh", "tanh",
+    "exp", "log", "ln", "sqrt", "Abs", "abs", "Min", "Max", "pi", "E",
+}
+
+_NODE_DIIZINKAN = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.BitXor, ast.USub, ast.UAdd,
+)
+
+
+class EkspresiDitolak(ValueError):
+    """Ekspresi melanggar batas keamanan atau waktu pemrosesan habis."""
+
+
+class BatasWaktuHabis(EkspresiDitolak):
+    """Pemrosesan di proses pekerja melebihi batas waktu dan dibatalkan."""
+
+
+def _nilai_konstan(node):
+    """Perkiraan nilai float dari subpohon yang hanya berisi angka, selain itu None."""
+    if isinstance(node, ast.Constant):
+        try:
+            return float(node.value)
+        except OverflowError:
+            # Literal bulat di luar jangkauan float
+            return math.inf
+    if isinstance(node, ast.UnaryOp):
+        v = _nilai_konstan(node.operand)
+        return None if v is None else (-v if isinstance(node.op, ast.USub) else v)
+    if isinstance(node, ast.BinOp):
+        a, b = _nilai_konstan(node.left), _nilai_konstan(node.right)
+        if a is None or b is None:
+            return None
+        try:
+            if isinstance(node.op, (ast.Pow, ast.BitXor)):
+                if abs(b) > MAKS_EKSPONEN:
+                    return math.inf
+                return math.pow(abs(a), b)
+            if isinstance(node.op, ast.Add):
+                return a + b
+            if isinstance(node.op, ast.Sub):
+                return a - b
+            if isinstance(node.op, ast.Mult):
+                return a * b
+            if isinstance(node.op, ast.Div):
+                return a / b if b else math.inf
+        except OverflowError:
+            return math.inf
+    return None
+
+
+def periksa(teks, variabel=("x", "y")):
+    """Validasi struktur ekspresi tanpa mengevaluasinya. Melempar EkspresiDitolak."""
+    if len(teks) > MAKS_PANJANG:
+        raise EkspresiDitolak(f"Ekspresi terlalu panjang (maks {MAKS_PANJANG} karakter).")
+    try:
+        pohon = ast.parse(teks.strip(), mode="eval")
+    except SyntaxError as e:
+        raise EkspresiDitolak(f"Sintaks tidak valid: {e.msg}") from None
+
+    jumlah = 0
+    tumpukan = [(pohon, 1)]
+    while tumpukan:
+        node, kedalaman = tumpukan.pop()
+        jumlah += 1
+        if jumlah > MAKS_NODE:
+            raise EkspresiDitolak(f"Ekspresi terlalu besar (maks {MAKS_NODE} node).")
+        if kedalaman > MAKS_KEDALAMAN:
+            raise EkspresiDitolak(f"Ekspresi terlalu bersarang (maks kedalaman {MAKS_KEDALAMAN}).")
+        if not isinstance(node, _NODE_DIIZINKAN):
+            raise EkspresiDitolak(f"Konstruksi '{type(node).__name__}' tidak diizinkan.")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise EkspresiDitolak("Hanya konstanta angka yang diizinkan.")
+        if isinstance(node, ast.Name) and node.id not in FUNGSI_DIIZINKAN and node.id not in variabel:
+            raise EkspresiDitolak(f"Nama '{node.id}' tidak dikenal.")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNGSI_DIIZINKAN or node.keywords:
+                raise EkspresiDitolak("Hanya pemanggilan fungsi matematika standar yang diizinkan.")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Pow, ast.BitXor)):
+            eksponen = _nilai_konstan(node.right)
+            if eksponen is not None and not abs(eksponen) <= MAKS_EKSPONEN:
+                raise EkspresiDitolak(f"Eksponen terlalu besar (maks {MAKS_EKSPONEN}).")
+        tumpukan.extend((anak, kedalaman + 1) for anak in ast.iter_child_nodes(node))
+
+
+def _kerja_parse(teks, variabel):
+    simbol = sp.symbols(variabel)
+    return sp.sympify(teks, locals={nama: s for nama, s in zip(variabel, simbol)})
+
+
+def _kerja(teks, variabel):
+    f = _kerja_parse(teks, variabel)
+    return f, tuple(sp.diff(f, s) for s in sp.symbols(variabel))
+
+
+def _loop_pekerja(koneksi):
+    while True:
+        tugas = koneksi.recv()
+        if tugas is None:
+            return
+        fungsi, args = tugas
+        try:
+            koneksi.send(("ok", fungsi(*args)))
+        except Exception as e:
+            koneksi.send(("galat", f"{type(e).__name__}: {e}"))
+
+
+def _konteks():
+    metode = multiprocessing.get_all_start_methods()
+    if "forkserver" in metode:
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["sympy"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class _Pekerja:
+    """Satu proses pekerja yang dapat dihentikan paksa bila melewati batas waktu."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.proses = None
+
+    def _hidupkan(self):
+        self.koneksi, anak = self.ctx.Pipe()
+        self.proses = self.ctx.Process(target=_loop_pekerja, args=(anak,), daemon=True)
+        self.proses.start()
+
+    def jalankan(self, tugas, batas_waktu):
+        if self.proses is None or not self.proses.is_alive():
+            self._hidupkan()
+        self.koneksi.send(tugas)
+        if not self.koneksi.poll(batas_waktu):
+            self.proses.kill()
+            self.proses.join()
+            self.proses = None
+            raise BatasWaktuHabis(f"Pemrosesan melebihi batas waktu {batas_waktu:.0f} detik dan dibatalkan.")
+        return self.koneksi.recv()
+
+
+_pool = queue.Queue()
+_kunci_pool = threading.Lock()
+# PID pemilik pool: proses hasil fork (mis. pekerja batch_model) membuat pool sendiri
+# alih-alih berbagi pipe pekerja dengan induknya
+_pid_pool = None
+
+
+def _ambil_pekerja():
+    global _pool, _pid_pool
+    with _kunci_pool:
+        if _pid_pool != os.getpid():
+            ctx = _konteks()
+            _pool = queue.Queue()
+            for _ in range(JUMLAH_PEKERJA):
+                _pool.put(_Pekerja(ctx))
+            _pid_pool = os.getpid()
+        pool = _pool
+    return pool, pool.get()
+
+
+def jalankan_terbatas(fungsi, *args, batas_waktu=None):
+    """Jalankan `fungsi(*args)` (fungsi tingkat modul, argumen dapat di-pickle) di proses pekerja.
+
+    Melempar BatasWaktuHabis bila melebihi `batas_waktu` detik (bawaan BATAS_WAKTU) dan
+    EkspresiDitolak bila fungsi gagal.
+    """
+    pool, pekerja = _ambil_pekerja()
+    try:
+        status, hasil = pekerja.jalankan((fungsi, args), BATAS_WAKTU if batas_waktu is None else batas_waktu)
+    finally:
+        pool.put(pekerja)
+    if status != "ok":
+        raise EkspresiDitolak(hasil)
+    return hasil
+
+
+# (Teks, pekerjaan) yang pernah ditolak karena batas waktu tidak dikirim ulang ke pekerja
+_ditolak = {}
+
+
+def _jalankan_teks(kerja, teks, variabel, batas_waktu):
+    periksa(teks, variabel)
+    kunci = (kerja.__name__, teks)
+    if kunci in _ditolak:
+        raise EkspresiDitolak(_ditolak[kunci])
+    try:
+        return jalankan_terbatas(kerja, teks, tuple(variabel), batas_waktu=batas_waktu)
+    except BatasWaktuHabis as e:
+        if len(_ditolak) < 1024:
+            _ditolak[kunci] = str(e)
+        raise
+
+
+@lru_cache(maxsize=256)
+def parse(teks, variabel=("x", "y"), batas_waktu=None):
+    """Parse `teks` saja (tanpa turunan) dengan batas dan pekerja yang sama dengan `parse_dan_turunkan`."""
+    return _jalankan_teks(_kerja_parse, teks, variabel, batas_waktu)
+
+
+@lru_cache(maxsize=256)
+def parse_dan_turunkan(teks, variabel=("x", "y"), batas_waktu=None):
+    """Parse `teks` dan hitung turunan parsial terhadap setiap variabel.
+
+    Mengembalikan (f, (df/dv1, df/dv2, ...)). Melempar EkspresiDitolak bila
+    ekspresi melanggar batas atau pemrosesan melebihi `batas_waktu` detik
+    (bawaan BATAS_WAKTU).
+    """
+    return _jalankan_teks(_kerja, teks, variabel, batas_waktu)
@@ -0,0 +1,137 @@
+"""Lapisan pekerjaan latar untuk komputasi berat di aplikasi Streamlit.
+
+Pekerjaan dijalankan di pool thread bersama (NumPy/HiGHS melepas GIL, dan
+fungsi hasil lambdify tidak bisa di-pickle ke proses lain). Setiap sesi punya
+paling banyak satu pekerjaan per nama; bila masukan (kunci) berubah, pekerjaan
+lama dibatalkan dan yang baru baru mulai setelah yang lama benar-benar berhenti.
+Selama pekerjaan berjalan, hasil baik terakhir tetap ditampilkan bersama
+progress bar yang diperbarui oleh fragment, tanpa menjalankan ulang seluruh skrip.
+
+Fungsi pekerjaan menerima objek `Pekerjaan` sebagai argumen pertama dan
+memanggil `pekerjaan.lapor(fraksi)` secara berkala; pemanggilan itu sekaligus
+titik pembatalan (melempar `Dibatalkan`).
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+JUMLAH_PEKERJA = int(os.environ.get("PEKERJAAN_PEKERJA", str(min(4, os.cpu_count() or 1))))
+# Pekerjaan yang selesai dalam waktu ini langsung ditampilkan pada rerun yang sama
+TUNGGU_SINGKAT = 0.3
+INTERVAL_PANTAU = 0.3
+
+_pool = ThreadPoolExecutor(max_workers=JUMLAH_PEKERJA, thread_name_prefix="pekerjaan")
+
+
+class Dibatalkan(Exception):
+    pass
+
+
+class Pekerjaan:
+    def __init__(self, kunci, pendahulu=None):
+        self.kunci = kunci
+        self.pendahulu = pendahulu
+        self.status = "menunggu"
+        self.progres = 0.0
+        self.hasil = None
+        self.galat = None
+        self.mulai = time.perf_counter()
+        self.durasi = None
+        self.future = None
+        self._batal = threading.Event()
+
+    def lapor(self, fraksi):
+        """Perbarui progres (0..1); lempar Dibatalkan bila pembatalan diminta."""
+        if self._batal.is_set():
+            raise Dibatalkan
+        self.progres = min(max(float(fraksi), 0.0), 1.0)
+
+    def batal(self):
+        self._batal.set()
+
+    @property
+    def berjalan(self):
+        return self.status in ("menunggu", "berjalan")
+
+
+def _jalankan(pekerjaan, fungsi, args):
+    try:
+        if pekerjaan.pendahulu is not None:
+            # Pendahulu sudah diminta batal; tunggu sampai berhenti agar tidak berbagi buffer
+            pekerjaan.pendahulu.future.exception()
+            pekerjaan.pendahulu = None
+        pekerjaan.lapor(0.0)
+        pekerjaan.status = "berjalan"
+        pekerjaan.hasil = fungsi(pekerjaan, *args)
+        pekerjaan.progres = 1.0
+        pekerjaan.status = "selesai"
+    except Dibatalkan:
+        pekerjaan.status = "batal"
+    except Exception as e:
+        pekerjaan.galat = e
+        pekerjaan.status = "galat"
+    finally:
+        pekerjaan.durasi = time.perf_counter() - pekerjaan.mulai
+
+
+def kirim(penyimpanan, nama, kunci, fungsi, *args):
+    """Pekerjaan `nama` untuk `kunci` di sesi ini; pekerjaan lama dengan kunci lain dibatalkan."""
+    slot = f"_pekerjaan_{nama}"
+    lama = penyimpanan.get(slot)
+    if lama is not None and lama.kunci == kunci:
+        # Termasuk yang dibatalkan pengguna: baru dihitung ulang setelah masukan berubah
+        return lama
+    if lama is not None:
+        lama.batal()
+    baru = Pekerjaan(kunci, pendahulu=lama if lama is not None and not lama.future.done() else None)
+    baru.future = _pool.submit(_jalankan, baru, fungsi, args)
+    penyimpanan[slot] = baru
+    return baru
+
+
+def hasil_terakhir(penyimpanan, nama):
+    """(kunci, hasil) pekerjaan terakhir yang selesai dengan sukses di sesi ini, atau None."""
+    return penyimpanan.get(f"_hasil_{nama}")
+
+
+def tampilkan(nama, kunci, fungsi, *args, label="Menghitung", penyimpanan=None):
+    """Jalankan/lanjutkan pekerjaan dan kembalikan (hasil_baik_terakhir, segar).
+
+    `segar` bernilai False bila hasil yang dikembalikan berasal dari masukan
+    sebelumnya karena pekerjaan untuk masukan sekarang masih berjalan.
+    """
+    import streamlit as st
+
+    penyimpanan = st.session_state if penyimpanan is None else penyimpanan
+    p = kirim(penyimpanan, nama, kunci, fungsi, *args)
+    if p.berjalan:
+        try:
+            p.future.result(timeout=TUNGGU_SINGKAT)
+        except Exception:
+            pass
+
+    if p.status == "selesai":
+        penyimpanan[f"_hasil_{nama}"] = (p.kunci, p.hasil)
+    elif p.status == "galat":
+        st.error(f"Terjadi kesalahan: {p.galat}")
+    elif p.status == "batal":
+        st.info(f"{label} dibatalkan; ubah masukan untuk menghitung ulang.")
+    else:
+        @st.fragment(run_every=INTERVAL_PANTAU)
+        def pantau():
+            if p.berjalan:
+                col1, col2 = st.columns([5, 1])
+                col1.progress(p.progres, text=f"⏳ {label}… {p.progres:.0%}")
+                if col2.button("Batalkan", key=f"batal_{nama}"):
+                    p.batal()
+            else:
+                # Hasil baru siap (atau dibatalkan): jalankan ulang seluruh skrip untuk menampilkannya
+                st.rerun()
+
+        pantau()
+
+    terakhir = hasil_terakhir(penyimpanan, nama)
+    if terakhir is None:
+        return None, False
+    return terakhir[1], terakhir[0] == kunci
@@ -0,0 +1,288 @@
+"""Penyimpanan skenario persisten (SQLite) yang diindeks hash parameter model.
+
+Setiap hasil optimasi/EOQ/antrian disimpan dengan kunci SHA-256 dari masukan
+model (dinormalisasi ke JSON terurut), sehingga skenario yang sama dijawab
+langsung dari indeks lintas sesi dan proses. Ukuran dibatasi; bila melewati
+batas, skenario yang paling lama tidak diakses dihapus (LRU).
+
+Konfigurasi lewat environment:
+    SKENARIO_DB=skenario.sqlite   lokasi berkas basis data (dibaca saat penyimpanan dibuat)
+    SKENARIO_MAKS=5000            jumlah skenario maksimum
+
+Ekspor dari command line:
+    python penyimpanan_skenario.py --jenis lp_produksi --format csv > skenario.csv
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+# Bawaan bila SKENARIO_DB tidak diisi; environment dibaca saat penyimpanan dibuat, bukan saat import
+FILE_DB = "skenario.sqlite"
+MAKS_SKENARIO = int(os.environ.get("SKENARIO_MAKS", "5000"))
+# Naikkan bila rumus model berubah agar hasil lama tidak dipakai lagi
+VERSI_MODEL = 1
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS skenario (
+    kunci TEXT PRIMARY KEY,
+    jenis TEXT NOT NULL,
+    masukan TEXT NOT NULL,
+    hasil TEXT NOT NULL,
+    dibuat REAL NOT NULL,
+    diakses REAL NOT NULL,
+    jumlah_akses INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_skenario_diakses ON skenario (diakses);
+CREATE INDEX IF NOT EXISTS idx_skenario_jenis ON skenario (jenis, diakses);
+"""
+
+
+def _normalisasi(nilai):
+    """Angka jadi float agar 90000 dan 90000.0 menghasilkan kunci yang sama."""
+    if isinstance(nilai, bool) or nilai is None or isinstance(nilai, str):
+        return nilai
+    if isinstance(nilai, dict):
+        return {str(k): _normalisasi(v) for k, v in nilai.items()}
+    if isinstance(nilai, (list, tuple)):
+        return [_normalisasi(v) for v in nilai]
+    return float(nilai)
+
+
+def _json(nilai):
+    return json.dumps(_normalisasi(nilai), sort_keys=True, separators=(",", ":"))
+
+
+def kunci(jenis, masukan):
+    """Hash SHA-256 dari jenis model, versi model dan masukan yang dinormalisasi."""
+    teks = _json({"jenis": jenis, "versi": VERSI_MODEL, "masukan": masukan})
+    return hashlib.sha256(teks.encode()).hexdigest()
+
+
+class PenyimpananSkenario:
+    def __init__(self, path=None, maks=MAKS_SKENARIO):
+        self.path = path or os.environ.get("SKENARIO_DB", FILE_DB)
+        self.maks = maks
+        self._lokal = threading.local()
+
+    def _koneksi(self):
+        # sqlite3.Connection tidak boleh dipakai lintas thread; tiap sesi Streamlit punya thread sendiri
+        kon = getattr(self._lokal, "kon", None)
+        if kon is None:
+            kon = sqlite3.connect(self.path, timeout=10)
+            kon.execute("PRAGMA journal_mode=WAL")
+            kon.execute("PRAGMA synchronous=NORMAL")
+            kon.executescript(_SKEMA)
+            self._lokal.kon = kon
+        return kon
+
+    def ambil(self, jenis, masukan):
+        """Hasil tersimpan untuk masukan ini, atau None."""
+        k = kunci(jenis, masukan)
+        kon = self._koneksi()
+        baris = kon.execute("SELECT hasil FROM skenario WHERE kunci = ?", (k,)).fetchone()
+        if baris is None:
+            return None
+        with kon:
+            kon.execute("UPDATE skenario SET diakses = ?, jumlah_akses = jumlah_akses + 1 WHERE kunci = ?",
+                        (time.time(), k))
+        return json.loads(baris[0])
+
+    def simpan(self, jenis, masukan, hasil):
+        k = kunci(jenis, masukan)
+        sekarang = time.time()
+        kon = self._koneksi()
+        with kon:
+            kon.execute(
+                "INSERT INTO skenario (kunci, jenis, masukan, hasil, dibuat, diakses) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(kunci) DO UPDATE SET hasil = excluded.hasil, diakses = excluded.diakses",
+                (k, jenis, _json(masukan), _json(hasil), sekarang, sekarang))
+            self._usir(kon)
+        return k
+
+    def atau_hitung(self, jenis, masukan, hitung):
+        """(hasil, dari_simpanan): ambil dari indeks, atau jalankan `hitung()` lalu simpan."""
+        hasil = self.ambil(jenis, masukan)
+        if hasil is not None:
+            return hasil, True
+        hasil = _normalisasi(hitung())
+        self.simpan(jenis, masukan, hasil)
+        return hasil, False
+
+    def _usir(self, kon):
+        """Hapus skenario yang paling lama tidak diakses sampai jumlahnya <= maks."""
+        (jumlah,) = kon.execute("SELECT COUNT(*) FROM skenario").fetchone()
+        if jumlah > self.maks:
+            kon.execute("DELETE FROM skenario WHERE kunci IN "
+                        "(SELECT kunci FROM skenario ORDER BY diakses ASC LIMIT ?)", (jumlah - self.maks,))
+
+    def daftar(self, jenis=None, batas=100):
+        """Skenario terbaru (menurut waktu akses) sebagai list dict."""
+        sql = "SELECT kunci, jenis, masukan, hasil, dibuat, diakses, jumlah_akses FROM skenario"
+        parameter = ()
+        if jenis is not None:
+            sql += " WHERE jenis = ?"
+            parameter = (jenis,)
+        sql += " ORDER BY diakses DESC LIMIT ?"
+        return [_baris_ke_dict(b) for b in self._koneksi().execute(sql, parameter + (batas,))]
+
+    def ambil_kunci(self, k):
+        baris = self._koneksi().execute(
+            "SELECT kunci, jenis, masukan, hasil, dibuat, diakses, jumlah_akses FROM skenario WHERE kunci = ?",
+            (k,)).fetchone()
+        return None if baris is None else _baris_ke_dict(baris)
+
+    def beda(self, kunci_a, kunci_b):
+        """Daftar perbedaan masukan dan hasil antara dua skenario: [{"bagian", "nama", "a", "b"}]."""
+        a, b = self.ambil_kunci(kunci_a), self.ambil_kunci(kunci_b)
+        if a is None or b is None:
+            raise KeyError("Skenario tidak ditemukan")
+        perbedaan = []
+        for bagian in ("masukan", "hasil"):
+            datar_a, datar_b = ratakan(a[bagian]), ratakan(b[bagian])
+            for nama in sorted(set(datar_a) | set(datar_b)):
+                if datar_a.get(nama) != datar_b.get(nama):
+                    perbedaan.append({"bagian": bagian, "nama": nama, "a": datar_a.get(nama), "b": datar_b.get(nama)})
+        return perbedaan
+
+    def ekspor(self, keluaran, jenis=None, format="jsonl"):
+        """Tulis semua skenario (baris demi baris, tanpa memuat semuanya ke memori) ke file teks.
+
+        CSV memakai gabungan kolom semua baris (skema berbeda per jenis, jumlah produk atau
+        hasil gagal), dikumpulkan pada lintasan pertama; sel yang tidak ada dibiarkan kosong.
+        """
+        sql = "SELECT kunci, jenis, masukan, hasil, dibuat, diakses, jumlah_akses FROM skenario"
+        parameter = ()
+        if jenis is not None:
+            sql += " WHERE jenis = ?"
+            parameter = (jenis,)
+        sql += " ORDER BY dibuat"
+        jumlah = 0
+        if format == "jsonl":
+            for baris in self._koneksi().execute(sql, parameter):
+                keluaran.write(json.dumps(_baris_ke_dict(baris), ensure_ascii=False) + "\n")
+                jumlah += 1
+            return jumlah
+
+        kolom = {}
+        for baris in self._koneksi().execute(sql, parameter):
+            kolom.update(dict.fromkeys(_datar_csv(_baris_ke_dict(baris))))
+        penulis = csv.DictWriter(keluaran, fieldnames=list(kolom))
+        if kolom:
+            penulis.writeheader()
+        for baris in self._koneksi().execute(sql, parameter):
+            penulis.writerow(_datar_csv(_baris_ke_dict(baris)))
+            jumlah += 1
+        return jumlah
+
+    def ekspor_bytes(self, jenis=None, format="jsonl"):
+        buf = io.StringIO()
+        self.ekspor(buf, jenis, format)
+        return buf.getvalue().encode("utf-8")
+
+    def statistik(self):
+        kon = self._koneksi()
+        return {jenis: jumlah for jenis, jumlah in
+                kon.execute("SELECT jenis, COUNT(*) FROM skenario GROUP BY jenis ORDER BY jenis")}
+
+
+def _baris_ke_dict(baris):
+    k, jenis, masukan, hasil, dibuat, diakses, jumlah_akses = baris
+    return {"kunci": k, "jenis": jenis, "masukan": json.loads(masukan), "hasil": json.loads(hasil),
+            "dibuat": dibuat, "diakses": diakses, "jumlah_akses": jumlah_akses}
+
+
+def _datar_csv(d):
+    return {"kunci": d["kunci"], "jenis": d["jenis"], "dibuat": d["dibuat"],
+            **{f"masukan.{k}": v for k, v in ratakan(d["masukan"]).items()},
+            **{f"hasil.{k}": v for k, v in ratakan(d["hasil"]).items()}}
+
+
+def ratakan(nilai, awalan=""):
+    """Dict/list bersarang menjadi {"a.b.0": nilai} untuk tabel dan diff."""
+    if isinstance(nilai, dict):
+        hasil = {}
+        for k, v in nilai.items():
+            hasil.update(ratakan(v, f"{awalan}{k}."))
+        return hasil
+    if isinstance(nilai, list):
+        hasil = {}
+        for i, v in enumerate(nilai):
+            hasil.update(ratakan(v, f"{awalan}{i}."))
+        return hasil
+    return {awalan.rstrip("."): nilai}
+
+
+_bawaan = None
+_kunci_bawaan = threading.Lock()
+
+
+def bawaan():
+    """Satu penyimpanan per proses, dibagi oleh semua sesi."""
+    global _bawaan
+    with _kunci_bawaan:
+        if _bawaan is None:
+            _bawaan = PenyimpananSkenario()
+        return _bawaan
+
+
+def tampilkan_riwayat(jenis, judul="🗂️ Riwayat Skenario"):
+    """Expander Streamlit untuk menjelajah, membandingkan dan mengekspor skenario satu jenis model."""
+    import streamlit as st
+
+    penyimpanan = bawaan()
+    with st.expander(judul):
+        riwayat = penyimpanan.daftar(jenis, batas=200)
+        if not riwayat:
+            st.info("Belum ada skenario tersimpan.")
+            return
+        st.dataframe([{"Waktu": time.strftime("%Y-%m-%d %H:%M", time.localtime(r["diakses"])),
+                       "Kunci": r["kunci"][:10], "Akses": r["jumlah_akses"],
+                       **ratakan(r["masukan"]), **{f"hasil.{k}": v for k, v in ratakan(r["hasil"]).items()}}
+                      for r in riwayat])
+
+        if len(riwayat) >= 2:
+            label = {r["kunci"]: f"{r['kunci'][:10]} ({time.strftime('%d/%m %H:%M', time.localtime(r['diakses']))})"
+                     for r in riwayat}
+            col1, col2 = st.columns(2)
+            a = col1.selectbox("Skenario A", list(label), format_func=label.get, key=f"beda_a_{jenis}")
+            b = col2.selectbox("Skenario B", list(label), index=1, format_func=label.get, key=f"beda_b_{jenis}")
+            perbedaan = penyimpanan.beda(a, b)
+            if perbedaan:
+                st.dataframe(perbedaan)
+            else:
+                st.write("Kedua skenario identik.")
+
+        col1, col2 = st.columns(2)
+        col1.download_button("⬇️ Ekspor CSV", penyimpanan.ekspor_bytes(jenis, "csv"),
+                             file_name=f"skenario_{jenis}.csv", key=f"csv_{jenis}")
+        col2.download_button("⬇️ Ekspor JSONL", penyimpanan.ekspor_bytes(jenis, "jsonl"),
+                             file_name=f"skenario_{jenis}.jsonl", key=f"jsonl_{jenis}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor skenario tersimpan")
+    parser.add_argument("--db", default=None, help=f"bawaan: $SKENARIO_DB atau {FILE_DB}")
+    parser.add_argument("--jenis", help="hanya jenis model ini (mis. lp_produksi, eoq, antrian_mm1)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--statistik", action="store_true", help="tampilkan jumlah skenario per jenis saja")
+    args = parser.parse_args(argv)
+
+    penyimpanan = PenyimpananSkenario(args.db)
+    if args.statistik:
+        for jenis, jumlah in penyimpanan.statistik().items():
+            print(f"{jenis:20s} {jumlah}")
+        return 0
+    jumlah = penyimpanan.ekspor(sys.stdout, args.jenis, args.format)
+    print(f"{jumlah} skenario diekspor", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
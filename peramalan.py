@@ -0,0 +1,334 @@
+"""Peramalan permintaan harian banyak item sekaligus (exponential smoothing) untuk EOQ dan stok pengaman.
+
+Riwayat penjualan dibaca dari CSV `item,tanggal,jumlah` per potongan baris
+lalu disusun menjadi matriks item × hari (hari tanpa baris = 0 terjual).
+Semua item dan semua kombinasi parameter diuji dalam satu lintasan waktu
+NumPy (bentuk error-correction, e = y − ramalan satu langkah):
+
+    level   l ← l + φb + α e
+    tren    b ← φb + αβ e                     (Holt, teredam φ)
+    musiman s ← s + γ(1 − α) e                (aditif, periode `musim`)
+
+SES adalah β = γ = 0, Holt γ = 0. Untuk setiap item dipilih parameter (dan
+metode, bila "otomatis") dengan MSE satu langkah terkecil setelah musim
+pertama. Varians permintaan selama lead time dihitung eksak dari bentuk
+inovasi model, bukan σ²·L, karena galat ramalan hari-hari berturutan berkorelasi.
+"""
+import csv
+import io
+import itertools
+
+import numpy as np
+from scipy.stats import norm
+
+import model_inti
+
+BARIS_PER_POTONGAN = 100000
+MUSIM = 7
+HORIZON = 365
+PHI = 0.98
+
+# Grid parameter per metode: (alpha, beta, gamma)
+GRID = {
+    "ses": [(a, 0.0, 0.0) for a in (0.02, 0.05, 0.1, 0.2, 0.4, 0.7)],
+    "holt": [(a, b, 0.0) for a in (0.05, 0.1, 0.2, 0.4) for b in (0.01, 0.05, 0.2)],
+    "musiman": [(a, b, g) for a in (0.05, 0.1, 0.3) for b in (0.0, 0.05) for g in (0.05, 0.2, 0.4)],
+}
+NAMA_METODE = {"ses": "SES", "holt": "Holt (teredam)", "musiman": "Holt-Winters aditif"}
+
+
+def baca_riwayat(berkas, kemajuan=None, baris_per_potongan=BARIS_PER_POTONGAN):
+    """Baca CSV penjualan harian `item,tanggal,jumlah` (tanggal YYYY-MM-DD) per potongan baris.
+
+    `kemajuan(fraksi)` (opsional) dipanggil setelah setiap potongan. Baris dengan item
+    dan tanggal sama dijumlahkan. Mengembalikan (nama_item, tanggal_awal, Y item × hari).
+    """
+    biner = berkas.buffer if isinstance(berkas, io.TextIOWrapper) else berkas
+    ukuran = biner.seek(0, io.SEEK_END) if biner.seekable() else 0
+    if ukuran:
+        biner.seek(0)
+    teks = berkas if isinstance(berkas, io.TextIOBase) else io.TextIOWrapper(berkas, encoding="utf-8-sig", newline="")
+    pembaca = csv.reader(teks)
+    kolom = [k.strip().lower() for k in next(pembaca, [])]
+    if not {"item", "tanggal", "jumlah"} <= set(kolom):
+        raise ValueError("CSV riwayat harus memiliki kolom item, tanggal, jumlah")
+    i_item, i_tanggal, i_jumlah = (kolom.index(k) for k in ("item", "tanggal", "jumlah"))
+
+    indeks = {}
+    semua_item, semua_hari, semua_jumlah = [], [], []
+    nomor = 2
+    while True:
+        potongan = list(itertools.islice(pembaca, baris_per_potongan))
+        if not potongan:
+            break
+        try:
+            isi = list(zip(*potongan))
+            hari = np.array(isi[i_tanggal], dtype="datetime64[D]")
+            jumlah = np.array(isi[i_jumlah], dtype=float)
+        except (ValueError, IndexError):
+            raise ValueError(f"Baris {nomor}–{nomor + len(potongan) - 1}: tanggal/jumlah tidak valid "
+                             "atau kolom kurang") from None
+        semua_item.append(np.fromiter((indeks.setdefault(v.strip(), len(indeks)) for v in isi[i_item]),
+                                      dtype=np.int64, count=len(potongan)))
+        semua_hari.append(hari)
+        semua_jumlah.append(jumlah)
+        nomor += len(potongan)
+        if kemajuan is not None and ukuran:
+            kemajuan(min(biner.tell() / ukuran, 1.0))
+    if not indeks:
+        raise ValueError("CSV tidak berisi baris data")
+
+    hari = np.concatenate(semua_hari)
+    awal = hari.min()
+    posisi = (hari - awal).astype(np.int64)
+    T = int(posisi.max()) + 1
+    N = len(indeks)
+    Y = np.bincount(np.concatenate(semua_item) * T + posisi, weights=np.concatenate(semua_jumlah),
+                    minlength=N * T).reshape(N, T)
+    return list(indeks), awal, Y
+
+
+def _awal(Y, m):
+    """Level, tren dan musiman awal dari beberapa musim pertama."""
+    N, T = Y.shape
+    k = max(1, min(4, T // m))
+    musim = Y[:, :k * m].reshape(N, k, m)
+    rata = musim.mean(axis=2)
+    level = rata[:, 0]
+    tren = (rata[:, 1] - rata[:, 0]) / m if k > 1 else np.zeros(N)
+    musiman = (musim - rata[:, :, None]).mean(axis=1)
+    return level, tren, musiman
+
+
+def ramal(Y, metode="otomatis", musim=MUSIM, horizon=HORIZON, kemajuan=None):
+    """Pasang model untuk setiap baris Y (item × hari) dan ramalkan `horizon` hari ke depan.
+
+    Mengembalikan dict array per item: `metode`, `alpha`, `beta`, `gamma`, `phi`, `sigma2`
+    (MSE satu langkah), `ramalan` (item × horizon, ≥ 0), `D` (jumlah ramalan selama horizon)
+    dan `level`, `tren`, `musiman` akhir.
+    """
+    Y = np.asarray(Y, dtype=float)
+    N, T = Y.shape
+    if T < 2 * musim:
+        raise ValueError(f"Riwayat minimal {2 * musim} hari (sekarang {T})")
+    daftar = list(GRID) if metode == "otomatis" else [metode]
+    kode = np.concatenate([np.full(len(GRID[d]), i) for i, d in enumerate(daftar)])
+    param = np.array([p for d in daftar for p in GRID[d]])
+    K = len(param)
+    alpha, beta, gamma = (param[:, j:j + 1] for j in range(3))
+    pakai_tren = np.array([daftar[i] != "ses" for i in kode])[:, None]
+    pakai_musim = np.array([daftar[i] == "musiman" for i in kode])
+    phi = np.where(pakai_tren, PHI, 0.0)
+    ab = alpha * beta
+    g1a = gamma * (1 - alpha)
+
+    # Rekursi dalam float32 dengan buffer tetap: lintasan waktu dibatasi bandwidth memori
+    tipe = np.float32
+    alpha, ab, g1a, phi32 = (v.astype(tipe) for v in (alpha, ab, g1a, phi))
+    l0, b0, s0 = _awal(Y, musim)
+    l = np.repeat(l0[None, :], K, axis=0).astype(tipe)
+    b = np.where(pakai_tren, b0[None, :], 0.0).astype(tipe)
+    # Musiman disimpan (musim, K, N) dan Y sebagai (T, N) agar akses per hari bersebelahan di memori
+    s = np.where(pakai_musim[None, :, None], s0.T[:, None, :], 0.0).astype(tipe)
+    YT = np.ascontiguousarray(Y.T, dtype=tipe)
+    sse = np.zeros((K, N))
+    e, pb, sementara = (np.empty((K, N), dtype=tipe) for _ in range(3))
+    langkah_lapor = max(1, T // 20)
+    for t in range(T):
+        sj = s[t % musim]
+        np.multiply(phi32, b, out=pb)
+        np.subtract(YT[t], l, out=e)
+        e -= pb
+        e -= sj
+        if t >= musim:
+            np.multiply(e, e, out=sementara)
+            sse += sementara
+        l += pb
+        np.multiply(alpha, e, out=sementara)
+        l += sementara
+        np.multiply(ab, e, out=b)
+        b += pb
+        np.multiply(g1a, e, out=sementara)
+        sj += sementara
+        if kemajuan is not None and t % langkah_lapor == 0:
+            kemajuan(t / T)
+
+    terbaik = np.argmin(sse, axis=0)
+    kolom = np.arange(N)
+    level = l[terbaik, kolom].astype(float)
+    tren = b[terbaik, kolom].astype(float)
+    musiman = s[:, terbaik, kolom].T.astype(float)
+    phi_item = phi[terbaik, 0]
+    h = np.arange(1, horizon + 1)
+    # Σ_{i=1..h} φ^i untuk setiap item (φ = 0 untuk SES)
+    redaman = np.cumsum(phi_item[:, None] ** h[None, :], axis=1)
+    ramalan = level[:, None] + redaman * tren[:, None] + musiman[:, (T + h - 1) % musim]
+    ramalan = np.maximum(ramalan, 0.0)
+    return {
+        "metode": np.array(daftar)[kode[terbaik]],
+        "alpha": alpha[terbaik, 0],
+        "beta": beta[terbaik, 0],
+        "gamma": gamma[terbaik, 0],
+        "phi": phi_item,
+        "sigma2": sse[terbaik, kolom] / (T - musim),
+        "ramalan": ramalan.astype(np.float32),
+        "D": ramalan.sum(axis=1),
+        "level": level,
+        "tren": tren,
+        "musiman": musiman,
+        "musim": musim,
+        "T": T,
+    }
+
+
+def varians_lead_time(hasil, lead_time, indeks=slice(None)):
+    """Varians total permintaan `lead_time` hari ke depan untuk item `indeks`.
+
+    Bentuk inovasi: y_{T+h} = ramalan + e_{T+h} + Σ_{j<h} c_j e_{T+h−j} dengan
+    c_j = α + αβ(φ + … + φ^j) + γ(1 − α)·[j kelipatan musim], sehingga
+    Var(Σ_{h=1..L} y) = σ² Σ_{i=1..L} (1 + c_1 + … + c_{L−i})².
+    """
+    L = int(lead_time)
+    if L <= 0:
+        return np.zeros_like(hasil["sigma2"][indeks])
+    alpha, beta, gamma, phi = (hasil[k][indeks, None] for k in ("alpha", "beta", "gamma", "phi"))
+    j = np.arange(1, L)
+    redaman = np.cumsum(phi ** j[None, :], axis=1) if L > 1 else np.zeros_like(phi[:, :0])
+    c = alpha + alpha * beta * redaman + gamma * (1 - alpha) * (j % hasil["musim"] == 0)
+    C = np.concatenate([np.zeros_like(alpha), np.cumsum(c, axis=1)], axis=1)
+    return hasil["sigma2"][indeks] * np.sum((1 + C) ** 2, axis=1)
+
+
+def rencana_persediaan(hasil, S, H, lead_time, tingkat_layanan=0.95, indeks=slice(None)):
+    """EOQ dari ramalan tahunan beserta stok pengaman dan titik pesan ulang per item.
+
+    Stok pengaman = z·σ_L (z dari tingkat layanan siklus); titik pesan ulang =
+    ramalan permintaan selama lead time + stok pengaman. TC ditambah biaya simpan stok pengaman.
+    """
+    D = np.asarray(hasil["D"][indeks], dtype=float)
+    L = int(lead_time)
+    rencana = model_inti.eoq_vektor(np.maximum(D, 1e-9), np.broadcast_to(S, D.shape), np.broadcast_to(H, D.shape))
+    sigma_L = np.sqrt(varians_lead_time(hasil, L, indeks))
+    ss = norm.ppf(tingkat_layanan) * sigma_L
+    rencana["D"] = D
+    rencana["sigma_L"] = sigma_L
+    rencana["SS"] = ss
+    rencana["ROP"] = hasil["ramalan"][indeks, :L].sum(axis=1) + ss
+    rencana["TC"] = rencana["TC"] + ss * H
+    return rencana
+
+
+def tabel_csv(nama, hasil, rencana):
+    """CSV per item: metode, parameter, ramalan tahunan, σ lead time, EOQ, stok pengaman, titik pesan ulang, TC."""
+    keluaran = io.StringIO()
+    penulis = csv.writer(keluaran)
+    kolom = ("D", "sigma_L", "EOQ", "SS", "ROP", "TC")
+    penulis.writerow(["item", "metode", "alpha", "beta", "gamma", *kolom])
+    penulis.writerows(zip(nama, hasil["metode"], hasil["alpha"].round(3), hasil["beta"].round(3),
+                          hasil["gamma"].round(3), *(np.round(rencana[k], 2) for k in kolom)))
+    return keluaran.getvalue().encode("utf-8")
+
+
+def gambar_ramalan(ax, nama, tanggal_awal, Y, hasil, i, hari_riwayat=120, hari_ramalan=60):
+    """Riwayat terakhir dan ramalan item ke-i pada sumbu `ax`."""
+    T = Y.shape[1]
+    mulai = max(0, T - hari_riwayat)
+    hari = tanggal_awal + np.arange(mulai, T + hari_ramalan)
+    ax.plot(hari[:T - mulai], Y[i, mulai:], color="gray", linewidth=0.8, label="Penjualan harian")
+    ax.plot(hari[T - mulai:], hasil["ramalan"][i, :hari_ramalan], color="tab:blue", linewidth=1.5,
+            label=f"Ramalan ({NAMA_METODE[hasil['metode'][i]]})")
+    ax.set_title(f"Riwayat & Ramalan: {nama[i]}")
+    ax.set_ylabel("Unit per hari")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.figure.autofmt_xdate()
+
+
+def muat_dan_ramal(pek, data, metode):
+    """Fungsi pekerjaan latar: baca riwayat (30% progres) lalu pasang model (70%)."""
+    nama, awal, Y = baca_riwayat(io.BytesIO(data), kemajuan=lambda f: pek.lapor(0.3 * f))
+    hasil = ramal(Y, metode, kemajuan=lambda f: pek.lapor(0.3 + 0.7 * f))
+    return nama, awal, Y, hasil
+
+
+def tampilkan_unggah(kunci):
+    """Unggah riwayat penjualan dan pasang model di pekerjaan latar; kembalikan (nama, awal, Y, hasil) atau None."""
+    import hashlib
+
+    import streamlit as st
+
+    import pekerjaan
+
+    st.caption("CSV penjualan harian: kolom item, tanggal (YYYY-MM-DD), jumlah — satu baris per item per hari.")
+    berkas = st.file_uploader("Unggah riwayat penjualan", type="csv", key=f"berkas_{kunci}")
+    metode = st.selectbox("Metode peramalan", ["otomatis", *GRID], key=f"metode_{kunci}",
+                          format_func=lambda m: NAMA_METODE.get(m, "Otomatis (MSE terkecil per item)"))
+    if berkas is None:
+        return None
+    data = berkas.getvalue()
+    hasil, segar = pekerjaan.tampilkan(kunci, (hashlib.sha1(data).hexdigest(), metode), muat_dan_ramal, data,
+                                       metode, label="Membaca riwayat & meramal")
+    if hasil is not None and not segar:
+        st.caption("Menampilkan ramalan sebelumnya sampai perhitungan selesai.")
+    return hasil
+
+
+def main():
+    """Uji mandiri: akurasi pada deret sintetis, varians lead time vs simulasi, pembacaan per potongan, waktu."""
+    import time
+
+    gagal = False
+    rng = np.random.default_rng(0)
+    T = 730
+    t = np.arange(T)
+    pola = np.array([0, -20, -10, 0, 10, 30, -10.0])
+    Y = np.vstack([100 + rng.normal(0, 5, T),
+                   50 + 0.1 * t + rng.normal(0, 3, T),
+                   200 + pola[t % 7] + rng.normal(0, 4, T)])
+    hasil = ramal(Y)
+    harapan = np.array([100 * HORIZON, np.nan, (200 + pola.mean()) * HORIZON])
+    ok = (hasil["metode"][2] == "musiman" and hasil["metode"][1] != "ses"
+          and np.allclose(hasil["D"][[0, 2]], harapan[[0, 2]], rtol=0.03)
+          and abs(hasil["ramalan"][2, :7] - (200 + pola[(T + np.arange(7)) % 7])).max() < 6)
+    gagal |= not ok
+    print(f"metode {list(hasil['metode'])}, D {np.round(hasil['D'])}: {'OK' if ok else 'GAGAL'}")
+
+    # Varians lead time dibandingkan simulasi model SES dengan α diketahui
+    sim = {"alpha": np.array([0.3]), "beta": np.array([0.0]), "gamma": np.array([0.0]), "phi": np.array([0.0]),
+           "sigma2": np.array([4.0]), "musim": MUSIM}
+    L = 10
+    e = rng.normal(0, 2, (200000, L))
+    level = 100 + np.cumsum(0.3 * e, axis=1)
+    total = (100 + e[:, 0]) + np.sum(level[:, :-1] + e[:, 1:], axis=1)
+    v, v_sim = varians_lead_time(sim, L)[0], total.var()
+    ok = abs(v - v_sim) < 0.02 * v_sim
+    gagal |= not ok
+    print(f"varians lead time {v:.1f} vs simulasi {v_sim:.1f}: {'OK' if ok else 'GAGAL'}")
+
+    # Pembacaan per potongan harus sama untuk ukuran potongan berapa pun (urutan baris diacak)
+    baris = [(f"item{i}", str(np.datetime64("2024-01-01") + d), f"{Y[i, d]:.3f}") for i in range(3) for d in range(T)]
+    urut = rng.permutation(len(baris))
+    teks = "item,tanggal,jumlah\n" + "".join(",".join(baris[k]) + "\n" for k in urut)
+    hasil_baca = [baca_riwayat(io.BytesIO(teks.encode()), baris_per_potongan=p) for p in (7, 1000, 10 ** 6)]
+    ok = all(h[0] == ["item0", "item1", "item2"] or sorted(h[0]) == ["item0", "item1", "item2"]
+             for h in hasil_baca)
+    urutan = [np.argsort(h[0]) for h in hasil_baca]
+    ok &= all(np.allclose(h[2][u], Y, atol=1e-3) for h, u in zip(hasil_baca, urutan))
+    gagal |= not ok
+    print(f"baca per potongan: {'OK' if ok else 'GAGAL'}")
+
+    N = 5000
+    Y = rng.poisson(rng.uniform(1, 50, (N, 1)) * (1 + 0.3 * np.sin(2 * np.pi * t / 7)), (N, T)).astype(float)
+    mulai = time.perf_counter()
+    hasil = ramal(Y)
+    rencana = rencana_persediaan(hasil, 50000, 2000, 7)
+    durasi = time.perf_counter() - mulai
+    ok = np.all(np.isfinite(rencana["EOQ"])) and np.all(rencana["SS"] >= 0)
+    gagal |= not ok
+    print(f"{N} item × {T} hari ({sum(len(g) for g in GRID.values())} kombinasi parameter): {durasi:.2f} s "
+          f"{'OK' if ok else 'GAGAL'}")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""Peta kontur/heatmap resolusi tinggi untuk f(x, y).
+
+Fungsi terkompilasi dievaluasi per blok baris ke dalam buffer float32 yang
+sudah dialokasikan dan dipakai ulang antar-rerun (disimpan di session_state
+atau dict lain milik pemanggil, sehingga sesi berbeda tidak berbagi buffer).
+Untuk tampilan, data diperkecil otomatis lalu digambar dengan `imshow`;
+resolusi penuh tetap tersedia untuk ekspor.
+"""
+import io
+
+import numpy as np
+
+MAKS_PIKSEL_TAMPIL = 600
+BARIS_PER_BLOK = 128
+
+
+def ambil_buffer(penyimpanan, resolusi, kecuali=None):
+    """Buffer float32 (resolusi x resolusi) milik pemanggil; dialokasikan ulang hanya bila ukuran berubah.
+
+    Paling banyak dua buffer disimpan bergantian: `kecuali` (buffer yang sedang
+    ditampilkan) tidak pernah dikembalikan, sehingga pekerjaan latar bisa mengisi
+    buffer lain tanpa merusak gambar yang sedang tampil.
+    """
+    daftar = penyimpanan.get("_buffer_kontur")
+    if daftar is None:
+        daftar = penyimpanan["_buffer_kontur"] = []
+    for buf in daftar:
+        if buf is not kecuali and buf.shape == (resolusi, resolusi):
+            return buf
+    buf = np.empty((resolusi, resolusi), dtype=np.float32)
+    daftar[:] = [b for b in daftar if b is kecuali] + [buf]
+    return buf
+
+
+def evaluasi_grid(f_np, batas, resolusi, penyimpanan=None, buffer=None, kemajuan=None):
+    """Isi buffer dengan f(x, y) di grid seragam; kembalikan (xs, ys, Z).
+
+    `kemajuan(fraksi)` (opsional) dipanggil setelah setiap blok baris.
+    """
+    (x_min, x_max), (y_min, y_max) = batas
+    xs = np.linspace(x_min, x_max, resolusi)
+    ys = np.linspace(y_min, y_max, resolusi)
+    Z = ambil_buffer(penyimpanan, resolusi) if buffer is None else buffer
+    baris_x = xs[None, :]
+    with np.errstate(all="ignore"):
+        for i in range(0, resolusi, BARIS_PER_BLOK):
+            # Broadcasting (1, n) x (blok, 1) menghindari meshgrid penuh berukuran n x n
+            Z[i:i + BARIS_PER_BLOK] = f_np(baris_x, ys[i:i + BARIS_PER_BLOK, None])
+            if kemajuan is not None:
+                kemajuan(min(i + BARIS_PER_BLOK, resolusi) / resolusi)
+    return xs, ys, Z
+
+
+def perkecil(Z, maks=MAKS_PIKSEL_TAMPIL):
+    """View Z dengan langkah (stride) sehingga sisi terpanjang <= maks; tanpa salinan."""
+    langkah = max(1, int(np.ceil(max(Z.shape) / maks)))
+    return Z[::langkah, ::langkah], langkah
+
+
+def gambar_heatmap(ax, xs, ys, Z, garis_kontur=15, cmap="viridis", vmin=None, vmax=None):
+    """Gambar heatmap berbasis gambar (bukan mesh poligon) ditambah garis kontur."""
+    Z_tampil, langkah = perkecil(Z)
+    extent = (xs[0], xs[-1], ys[0], ys[-1])
+    gambar = ax.imshow(Z_tampil, extent=extent, origin="lower", aspect="auto", cmap=cmap, vmin=vmin, vmax=vmax)
+    if garis_kontur:
+        ax.contour(xs[::langkah], ys[::langkah], Z_tampil, levels=garis_kontur, colors="white", linewidths=0.5, alpha=0.6)
+    return gambar
+
+
+def panah_gradien(ax, x0, y0, gx, gy, batas):
+    """Panah arah gradien di (x0, y0), panjangnya disesuaikan dengan lebar domain."""
+    norma = np.hypot(gx, gy)
+    if not np.isfinite(norma) or norma == 0:
+        return
+    panjang = 0.15 * min(batas[0][1] - batas[0][0], batas[1][1] - batas[1][0])
+    ax.annotate("", xy=(x0 + gx / norma * panjang, y0 + gy / norma * panjang), xytext=(x0, y0),
+                arrowprops=dict(arrowstyle="->", color="red", linewidth=2))
+    ax.plot(x0, y0, "ro")
+
+
+def ekspor_npy(Z):
+    buf = io.BytesIO()
+    np.save(buf, Z)
+    return buf.getvalue()
+
+
+def ekspor_png(Z, cmap="viridis"):
+    """PNG resolusi penuh (1 piksel per titik grid) tanpa membuat figure."""
+    import matplotlib.pyplot as plt
+
+    buf = io.BytesIO()
+    plt.imsave(buf, Z, cmap=cmap, origin="lower", format="png")
+    return buf.getvalue()
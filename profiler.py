@@ -0,0 +1,156 @@
+"""Instrumentasi waktu per tahap untuk setiap rerun aplikasi Streamlit.
+
+Tahap yang diukur: parse, turunan, kompilasi, solve, grid, render.
+Profiler aktif jika variabel lingkungan PROFILER_AKTIF=1 atau jika
+"Mode Profiler" dicentang di sidebar. Saat nonaktif, `ukur()` hanya
+mengembalikan context manager kosong sehingga overhead-nya dapat diabaikan.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+TAHAP = ("parse", "turunan", "kompilasi", "solve", "grid", "render")
+
+# Batas bin histogram dalam milidetik (skala logaritmik)
+BATAS_BIN_MS = (0.1, 0.3, 1, 3, 10, 30, 100, 300, 1000, 3000)
+
+FILE_JSONL = os.environ.get("PROFILER_JSONL", "profiler_log.jsonl")
+
+_aktif_global = os.environ.get("PROFILER_AKTIF", "0") == "1"
+_kosong = nullcontext()
+_lokal = threading.local()
+_kunci = threading.Lock()
+
+
+class Histogram:
+    """Histogram durasi (ms) beserta jumlah, total dan maksimum."""
+
+    def __init__(self):
+        self.bin = [0] * (len(BATAS_BIN_MS) + 1)
+        self.jumlah = 0
+        self.total_ms = 0.0
+        self.maks_ms = 0.0
+
+    def tambah(self, ms):
+        i = 0
+        while i < len(BATAS_BIN_MS) and ms > BATAS_BIN_MS[i]:
+            i += 1
+        self.bin[i] += 1
+        self.jumlah += 1
+        self.total_ms += ms
+        self.maks_ms = max(self.maks_ms, ms)
+
+    @property
+    def rata_ms(self):
+        return self.total_ms / self.jumlah if self.jumlah else 0.0
+
+
+# Histogram seluruh proses (semua sesi), dilindungi oleh _kunci
+histogram_proses = {}
+
+
+def _catat(tahap, ms):
+    with _kunci:
+        histogram_proses.setdefault(tahap, Histogram()).tambah(ms)
+    sesi = getattr(_lokal, "sesi", None)
+    if sesi is not None:
+        sesi.setdefault(tahap, Histogram()).tambah(ms)
+    rerun = getattr(_lokal, "rerun", None)
+    if rerun is not None:
+        rerun[tahap] = rerun.get(tahap, 0.0) + ms
+
+
+@contextmanager
+def _span(tahap):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _catat(tahap, (time.perf_counter() - t0) * 1000)
+
+
+def aktif():
+    return _aktif_global or getattr(_lokal, "rerun", None) is not None
+
+
+def ukur(tahap):
+    """Context manager untuk mengukur satu tahap, contoh: `with ukur("solve"): ...`."""
+    if not aktif():
+        return _kosong
+    return _span(tahap)
+
+
+def mulai(session_state=None, sidebar=True):
+    """Dipanggil di awal script. Mengaktifkan profiler untuk sesi ini bila diminta."""
+    nyala = _aktif_global
+    if sidebar:
+        import streamlit as st
+        nyala = st.sidebar.checkbox("🐞 Mode Profiler", value=_aktif_global)
+        if session_state is None:
+            session_state = st.session_state
+
+    if not nyala:
+        _lokal.sesi = None
+        _lokal.rerun = None
+        return
+
+    if session_state is not None:
+        if "_profiler" not in session_state:
+            session_state["_profiler"] = {}
+        _lokal.sesi = session_state["_profiler"]
+    else:
+        _lokal.sesi = None
+    _lokal.rerun = {}
+    _lokal.t0 = time.perf_counter()
+
+
+def selesai(tampilkan=True):
+    """Dipanggil di akhir script: catat total rerun, tulis JSONL dan tampilkan panel."""
+    rerun = getattr(_lokal, "rerun", None)
+    if rerun is None:
+        return
+    _catat("rerun", (time.perf_counter() - _lokal.t0) * 1000)
+
+    baris = {"waktu": time.time(), "thread": threading.get_ident(), "tahap_ms": rerun}
+    with _kunci:
+        with open(FILE_JSONL, "a", encoding="utf-8") as f:
+            f.write(json.dumps(baris) + "\n")
+
+    if tampilkan:
+        tampilkan_panel(getattr(_lokal, "sesi", None) or {})
+
+    _lokal.rerun = None
+    _lokal.sesi = None
+
+
+def ringkasan(histogram):
+    """Ubah dict histogram menjadi baris tabel yang siap ditampilkan."""
+    label_bin = [f"≤{b}" for b in BATAS_BIN_MS] + [f">{BATAS_BIN_MS[-1]}"]
+    hasil = []
+    for tahap, h in histogram.items():
+        baris = {
+            "tahap": tahap,
+            "n": h.jumlah,
+            "rata (ms)": round(h.rata_ms, 2),
+            "maks (ms)": round(h.maks_ms, 2),
+        }
+        baris.update({lbl: n for lbl, n in zip(label_bin, h.bin) if n})
+        hasil.append(baris)
+    return hasil
+
+
+def tampilkan_panel(histogram_sesi):
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Profiler", expanded=True):
+        st.write("Rerun terakhir (ms):")
+        st.json({k: round(v, 2) for k, v in _lokal.rerun.items()})
+        st.write("Histogram sesi ini:")
+        st.dataframe(ringkasan(histogram_sesi))
+        with _kunci:
+            proses = ringkasan(histogram_proses)
+        st.write("Histogram seluruh proses:")
+        st.dataframe(proses)
+        st.caption(f"Log JSON-lines: {FILE_JSONL}")
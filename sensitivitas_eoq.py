@@ -0,0 +1,102 @@
+"""Tensor sensitivitas EOQ atas grid permintaan (D) × biaya pesan (S) × biaya simpan (H).
+
+EOQ = √(2DS/H) dan biaya total minimum TC* = √(2DSH) dievaluasi sekali ke satu
+array float32 berbentuk (2, nD, nS, nH) yang dialokasikan di awal; per blok
+bidang D hanya bidang 2DS (blok × nS) yang dibuat sementara, lalu dibroadcast
+ke sumbu H langsung ke array keluaran. Irisan memakai `volume_3d.irisan`
+(view, tanpa salinan), jadi mengganti irisan tidak menghitung ulang tensor.
+
+Memesan Q selain EOQ menaikkan biaya sebesar TC(Q)/TC* − 1 = (r + 1/r)/2 − 1
+dengan r = Q/EOQ, sehingga kenaikan untuk Q tetap cukup dihitung dari irisan EOQ.
+"""
+import numpy as np
+
+import volume_3d
+
+SUMBU = ("D", "S", "H")
+BESARAN = ("EOQ", "TC")
+BIDANG_PER_BLOK = 16
+
+
+def grid_sekitar(nilai, persen, resolusi):
+    """Grid seragam nilai·(1 ± persen), dibatasi tetap positif."""
+    return np.linspace(nilai * max(1 - persen, 0.01), nilai * (1 + persen), resolusi)
+
+
+def tensor_eoq(D, S, H, keluaran=None):
+    """Isi tensor float32 (2, nD, nS, nH): [0] = EOQ, [1] = biaya total minimum."""
+    D, S, H = (np.asarray(v, dtype=float) for v in (D, S, H))
+    bentuk = (2, len(D), len(S), len(H))
+    T = np.empty(bentuk, dtype=np.float32) if keluaran is None else keluaran
+    if T.shape != bentuk:
+        raise ValueError(f"Bentuk keluaran {T.shape} ≠ {bentuk}")
+    H_baris = H[None, None, :]
+    for i in range(0, len(D), BIDANG_PER_BLOK):
+        # Bidang 2DS (blok × nS) dibroadcast ke sumbu H: (blok, nS, 1) dengan (1, 1, nH)
+        dua_ds = (2 * D[i:i + BIDANG_PER_BLOK, None] * S[None, :])[:, :, None]
+        np.sqrt(dua_ds / H_baris, out=T[0, i:i + BIDANG_PER_BLOK], casting="same_kind")
+        np.sqrt(dua_ds * H_baris, out=T[1, i:i + BIDANG_PER_BLOK], casting="same_kind")
+    return T
+
+
+def irisan(T, sumbu, besaran, poros, indeks):
+    """Irisan 2D besaran ("EOQ"/"TC") pada sumbu `poros` ("D"/"S"/"H"); lihat `volume_3d.irisan`.
+
+    Mengembalikan (nama_h, nilai_h, nama_v, nilai_v, Z) dengan Z berupa view ke tensor.
+    """
+    nama = dict(zip(volume_3d.SUMBU, SUMBU))
+    h, nilai_h, v, nilai_v, Z = volume_3d.irisan(T[BESARAN.index(besaran)], sumbu,
+                                                 volume_3d.SUMBU[SUMBU.index(poros)], indeks)
+    return nama[h], nilai_h, nama[v], nilai_v, Z
+
+
+def kenaikan_biaya(Q, EOQ):
+    """Kenaikan relatif biaya total bila memesan Q alih-alih EOQ (0.05 = 5% lebih mahal)."""
+    r = Q / np.asarray(EOQ, dtype=float)
+    return (r + 1 / r) / 2 - 1
+
+
+def kenaikan_terburuk(Q, EOQ_min, EOQ_max):
+    """Kenaikan biaya terbesar di seluruh grid; r monoton terhadap EOQ sehingga cukup di ujung rentangnya."""
+    return float(max(kenaikan_biaya(Q, EOQ_min), kenaikan_biaya(Q, EOQ_max)))
+
+
+def main():
+    """Uji mandiri: cocokkan dengan model_inti.eoq_vektor, irisan tanpa salinan, dan waktu untuk grid 200³."""
+    import time
+
+    import model_inti
+
+    gagal = False
+    n = 200
+    sumbu = tuple(grid_sekitar(v, 0.5, n) for v in (12000, 150000, 500))
+    mulai = time.perf_counter()
+    T = tensor_eoq(*sumbu)
+    durasi = time.perf_counter() - mulai
+
+    rng = np.random.default_rng(0)
+    i, j, k = (rng.integers(0, n, 1000) for _ in range(3))
+    acuan = model_inti.eoq_vektor(sumbu[0][i], sumbu[1][j], sumbu[2][k])
+    galat = max(np.max(np.abs(T[0, i, j, k] / acuan["EOQ"] - 1)), np.max(np.abs(T[1, i, j, k] / acuan["TC"] - 1)))
+    ok = galat < 1e-6
+    gagal |= not ok
+    print(f"tensor {n}³ × 2 ({T.nbytes / 2 ** 20:.0f} MB) dalam {durasi * 1000:.0f} ms, "
+          f"galat relatif {galat:.1e}: {'OK' if ok else 'GAGAL'}")
+
+    mulai = time.perf_counter()
+    ok = True
+    for poros in SUMBU:
+        for besaran in BESARAN:
+            nama_h, nilai_h, nama_v, nilai_v, Z = irisan(T, sumbu, besaran, poros, n // 3)
+            ok &= np.shares_memory(Z, T) and Z.shape == (len(nilai_v), len(nilai_h))
+            ok &= {nama_h, nama_v, poros} == set(SUMBU)
+    _, _, _, _, Z = irisan(T, sumbu, "EOQ", "H", 0)
+    ok &= np.allclose(Z[3, 5], np.sqrt(2 * sumbu[0][5] * sumbu[1][3] / sumbu[2][0]), rtol=1e-6)
+    ok &= abs(kenaikan_biaya(1.2, 1.0) - (1.2 + 1 / 1.2) / 2 + 1) < 1e-12
+    gagal |= not ok
+    print(f"irisan (view) {(time.perf_counter() - mulai) * 1e6 / 6:.0f} µs per irisan: {'OK' if ok else 'GAGAL'}")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,31 @@
+"""Aproksimasi Taylor orde 1 dan 2 untuk f(x, y) di sekitar (x0, y0).
+
+Memakai f, gradien dan Hessian yang sudah dikompilasi sekali per fungsi
+(lihat `titik_kritis.dari_sympy`), sehingga memindahkan titik ekspansi
+hanya memerlukan satu evaluasi numerik di (x0, y0).
+"""
+import numpy as np
+
+
+def koefisien(f_np, grad_np, hess_np, x0, y0):
+    """Nilai f, gradien dan Hessian di (x0, y0) sebagai float."""
+    f0 = float(f_np(x0, y0))
+    gx, gy = (float(g) for g in grad_np(x0, y0))
+    hxx, hxy, hyy = (float(h) for h in hess_np(x0, y0))
+    return f0, (gx, gy), (hxx, hxy, hyy)
+
+
+def aproksimasi(koef, x0, y0, X, Y, orde=1):
+    """Permukaan Taylor orde 1 (bidang singgung) atau orde 2 (kuadratik) di grid X, Y."""
+    f0, (gx, gy), (hxx, hxy, hyy) = koef
+    dx = X - x0
+    dy = Y - y0
+    Z = f0 + gx * dx + gy * dy
+    if orde >= 2:
+        Z += 0.5 * (hxx * dx * dx + 2 * hxy * dx * dy + hyy * dy * dy)
+    return Z
+
+
+def peta_galat(Z, Z_aproks):
+    """Galat mutlak |f − aproksimasi| di setiap titik grid."""
+    return np.abs(np.asarray(Z, dtype=float) - Z_aproks)
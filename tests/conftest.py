@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import penyimpanan_skenario  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def skenario_db_sementara(tmp_path, monkeypatch):
+    """Aplikasi yang diuji menyimpan skenario ke tmp_path, bukan skenario.sqlite di working tree."""
+    monkeypatch.setenv("SKENARIO_DB", str(tmp_path / "skenario.sqlite"))
+    monkeypatch.setattr(penyimpanan_skenario, "_bawaan", None)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--lambat", action="store_true", help="jalankan juga uji bertanda slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: uji lama (mis. rerun semua aplikasi), hanya dengan --lambat")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--lambat"):
+        return
+    lewati = pytest.mark.skip(reason="uji lambat, jalankan dengan --lambat")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(lewati)
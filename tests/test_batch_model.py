@@ -0,0 +1,28 @@
+import io
+import json
+
+import batch_model
+
+
+def test_baris_rusak_menjadi_galat_tanpa_menghentikan_batch(tmp_path):
+    path = tmp_path / "skenario.jsonl"
+    path.write_text('{"model": "eoq", "D": 100, "S": 10, "H": 2}\n'
+                    '{"model": "eoq", "D": 1\n'
+                    '\n'
+                    '[1, 2]\n'
+                    '{"model": "eoq", "D": 200, "S": 10, "H": 2}\n', encoding="utf-8")
+    keluaran = io.StringIO()
+    jumlah, galat = batch_model.jalankan_batch(batch_model.baca_skenario(str(path)), keluaran, pekerja=1,
+                                               ukuran_potongan=2)
+    hasil = {h["baris"]: h for h in map(json.loads, keluaran.getvalue().splitlines())}
+    assert (jumlah, galat) == (4, 2)
+    assert "hasil" in hasil[1] and "hasil" in hasil[5]
+    assert hasil[2]["galat"].startswith("JSONDecodeError")
+    assert "objek JSON" in hasil[4]["galat"]
+
+
+def test_main_keluar_1_bila_ada_baris_rusak(tmp_path):
+    path = tmp_path / "skenario.jsonl"
+    path.write_text('bukan json\n{"model": "eoq", "D": 100, "S": 10, "H": 2}\n', encoding="utf-8")
+    assert batch_model.main([str(path), "--keluaran", str(tmp_path / "hasil.jsonl"), "--pekerja", "1"]) == 1
+    assert len((tmp_path / "hasil.jsonl").read_text(encoding="utf-8").splitlines()) == 2
@@ -0,0 +1,71 @@
+import io
+
+import numpy as np
+import pytest
+
+import berkas_model
+
+MPS_KONSTANTA = b"""NAME          KONST
+ROWS
+ N  COST
+ L  LIM1
+COLUMNS
+    X  COST  1  LIM1  1
+    Y  COST  2  LIM1  1
+RHS
+    RHS  COST  -10  LIM1  4
+BOUNDS
+ LO BND  X  1
+ENDATA
+"""
+
+
+def test_rhs_baris_objektif_menjadi_konstanta_negatif():
+    model = berkas_model.baca_mps(io.BytesIO(MPS_KONSTANTA))
+    assert model.konstanta == 10.0
+    # min x + 2y + 10 dengan x >= 1, y >= 0
+    assert model.selesaikan()["objektif"] == pytest.approx(11.0)
+
+
+@pytest.mark.parametrize("format", ["mps", "lp"])
+@pytest.mark.parametrize("konstanta", [0.0, 12.5, -7.0])
+def test_pulang_pergi_mempertahankan_konstanta(format, konstanta):
+    model = berkas_model.ModelLP.dari_produksi([90000, 20000], [[1, 0.5], [2, 2], [2, 1]], [180, 400, 220])
+    model.konstanta = konstanta
+    ulang = berkas_model.baca(io.BytesIO(berkas_model.ke_bytes(model, format)), format)
+    assert ulang.konstanta == konstanta
+    assert ulang.selesaikan()["objektif"] == pytest.approx(model.selesaikan()["objektif"])
+
+
+def test_konstanta_di_kendala_lp_tetap_ditolak():
+    teks = b"Minimize\n obj: x\nSubject To\n c1: x + 3 <= 4\nEnd\n"
+    with pytest.raises(ValueError, match="Konstanta"):
+        berkas_model.baca_lp(io.BytesIO(teks))
+
+
+@pytest.mark.parametrize("format", ["mps", "lp"])
+def test_pulang_pergi_dengan_nama_bertabrakan(format):
+    # Setelah disanitasi kedua kolom dan dua baris pertama bernama sama; satu baris bernama seperti objektif
+    model = berkas_model.ModelLP([1, 2], [[1, 0], [0, 1], [1, 1]], [-np.inf] * 3, [4, 5, 6],
+                                 nama_baris=["Waktu mesin", "Waktu-mesin", "OBJ" if format == "mps" else "obj"],
+                                 nama_kolom=["Banner (x)", "Banner [x]"], maksimasi=True)
+    ulang = berkas_model.baca(io.BytesIO(berkas_model.ke_bytes(model, format)), format)
+    assert ulang.ukuran == model.ukuran
+    assert len(set(ulang.nama_kolom)) == 2 and len(set(ulang.nama_baris)) == 3
+    assert ulang.selesaikan()["objektif"] == pytest.approx(model.selesaikan()["objektif"]) == 11.0
+
+
+@pytest.mark.parametrize("batas, harapan", [
+    (" FX BND X 3\n UP BND X 10\n", (3.0, 10.0)),
+    (" UP BND X 10\n FX BND X 3\n", (3.0, 3.0)),
+    (" LO BND X 2\n UP BND X -1\n", (2.0, -1.0)),
+    (" UP BND X -1\n LO BND X 2\n", (2.0, -1.0)),
+    (" LO BND X 0\n UP BND X -1\n", (-np.inf, -1.0)),
+    (" FR BND X\n LO BND X -4\n", (-4.0, np.inf)),
+])
+def test_bounds_diterapkan_sesuai_urutan_berkas(batas, harapan):
+    teks = ("NAME T\nROWS\n N COST\n L LIM\nCOLUMNS\n X COST 1 LIM 1\n Y COST 1 LIM 1\nRHS\n RHS LIM 4\n"
+            f"BOUNDS\n{batas} UP BND Y 7\nENDATA\n").encode()
+    model = berkas_model.baca_mps(io.BytesIO(teks))
+    assert (model.batas_bawah[0], model.batas_atas[0]) == harapan
+    assert (model.batas_bawah[1], model.batas_atas[1]) == (0.0, 7.0)
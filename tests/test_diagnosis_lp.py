@@ -0,0 +1,26 @@
+import pytest
+
+import diagnosis_lp
+
+# Selisih: x - y >= 5, Kapasitas: x <= 3; bersama y >= 0 tidak layak
+A = [[-1.0, 1.0], [1.0, 0.0]]
+B = [-5.0, 3.0]
+
+
+def test_batas_nonnegatif_diberi_label_dan_tidak_dilonggarkan():
+    hasil = diagnosis_lp.diagnosa([-1.0, -1.0], A, B, (0, None), ["Selisih", "Kapasitas"], ["x", "y"])
+    assert hasil["status"] == "tidak_layak"
+    assert {(k["nama"], k["jenis"]) for k in hasil["iis"]} == {
+        ("Selisih", "kendala"), ("Kapasitas", "kendala"), ("y >= 0", "nonnegatif")}
+    assert "y >= 0" not in hasil["relaksasi"] and sum(hasil["relaksasi"].values()) == pytest.approx(2.0)
+    assert hasil["relaksasi_tunggal"] == {"Selisih": pytest.approx(2.0), "Kapasitas": pytest.approx(2.0)}
+
+
+def test_relaksasi_tunggal_hanya_pada_baris_iis():
+    # Konflik kedua yang terpisah (z <= 1 dan z >= 3) tidak boleh membuat relaksasi tunggal tak terhingga
+    A3 = [baris + [0.0] for baris in A] + [[0.0, 0.0, 1.0], [0.0, 0.0, -1.0]]
+    hasil = diagnosis_lp.diagnosa([-1.0, -1.0, -1.0], A3, B + [1.0, -3.0], (0, None),
+                                  ["Selisih", "Kapasitas", "Z atas", "Z bawah"], ["x", "y", "z"])
+    assert hasil["status"] == "tidak_layak"
+    assert hasil["relaksasi_tunggal"]
+    assert all(nilai is not None and nilai > 0 for nilai in hasil["relaksasi_tunggal"].values())
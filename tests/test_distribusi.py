@@ -0,0 +1,37 @@
+import io
+
+import numpy as np
+import pytest
+
+import distribusi
+
+RUTE = b"""pabrik,outlet,biaya,kapasitas
+A,X,10,
+A,Y,12,5
+B,X,8,
+B,Y,9,
+"""
+
+
+def test_kapasitas_kosong_berarti_tanpa_batas():
+    _, _, asal, tujuan, biaya, kapasitas = distribusi.baca_rute(io.BytesIO(RUTE))
+    assert np.isinf(kapasitas).sum() == 3
+    pasokan, permintaan = [[20, 20], [10, 10]], [[15, 15], [5, 5]]
+    hasil = distribusi.selesaikan(pasokan, permintaan, asal, tujuan, biaya, kapasitas)
+    acuan = distribusi.selesaikan(pasokan, permintaan, asal, tujuan, biaya)
+    assert hasil["sukses"]
+    assert hasil["biaya_total"] == pytest.approx(acuan["biaya_total"])
+
+
+def test_kapasitas_campuran_hanya_membatasi_rute_terbatas():
+    _, _, asal, tujuan, biaya, _ = distribusi.baca_rute(io.BytesIO(RUTE))
+    hasil = distribusi.selesaikan([[20, 20], [10, 10]], [[15, 15], [5, 5]], asal, tujuan, biaya,
+                                  [np.inf, 1, np.inf, 2])
+    assert hasil["sukses"]
+    assert hasil["aliran"].sum(axis=0)[[1, 3]] == pytest.approx([1, 2])
+
+
+def test_tabel_rute_kosong_tidak_melempar():
+    hasil = distribusi.selesaikan([[1]], [[1]], [], [], [])
+    assert hasil["sukses"] is False
+    assert "kosong" in hasil["pesan"]
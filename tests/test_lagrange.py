@@ -0,0 +1,44 @@
+import pytest
+import sympy as sp
+
+import lagrange
+
+x, y = sp.symbols("x y")
+BATAS = ((-5, 5), (-5, 5))
+
+
+def test_maksimasi_tak_terbatas_tidak_dilaporkan_sebagai_optimum():
+    kkt = lagrange.bangun_kkt(x**2 + y**2, (x, y), [(x + y - 4, "<=")], maksimasi=True)
+    hasil = lagrange.selesaikan(kkt, BATAS)
+    assert hasil["status"] == "tak_terbatas"
+    assert hasil["titik"] == pytest.approx([2, 2])
+    assert hasil["jenis"] == "pelana"
+    assert hasil["sinar"]["objektif"] > 1e6
+
+
+def test_minimasi_terbatas_adalah_optimum_lokal():
+    kkt = lagrange.bangun_kkt(x**2 + y**2, (x, y), [(x + y - 4, "=")], maksimasi=False)
+    hasil = lagrange.selesaikan(kkt, BATAS)
+    assert hasil["status"] == "lokal"
+    assert hasil["titik"] == pytest.approx([2, 2])
+    assert hasil["objektif"] == pytest.approx(8)
+    assert hasil["sinar"] is None
+
+
+def test_kendala_lingkaran_memilih_optimum_bukan_pelana():
+    kkt = lagrange.bangun_kkt(x + y, (x, y), [(x**2 + y**2 - 1, "<=")], maksimasi=True)
+    hasil = lagrange.selesaikan(kkt, BATAS)
+    assert hasil["status"] == "lokal"
+    assert hasil["titik"] == pytest.approx([2**-0.5, 2**-0.5])
+
+
+def test_tak_terbatas_tanpa_titik_kkt():
+    kkt = lagrange.bangun_kkt(x, (x, y), [(y - 1, "<=")], maksimasi=True)
+    hasil = lagrange.selesaikan(kkt, BATAS)
+    assert hasil["status"] == "tak_terbatas" and hasil["titik"] is None
+
+
+def test_objektif_terbatas_yang_terus_naik_bukan_tak_terbatas():
+    kkt = lagrange.bangun_kkt(-1 / (1 + x**2 + y**2), (x, y), [], maksimasi=True)
+    hasil = lagrange.selesaikan(kkt, BATAS)
+    assert hasil is None or (hasil["sinar"] is None and hasil["status"] != "tak_terbatas")
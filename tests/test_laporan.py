@@ -0,0 +1,23 @@
+import io
+import json
+import os
+
+import laporan
+
+
+def test_nama_berkas_unik_untuk_id_yang_bertabrakan():
+    nama = [laporan.nama_berkas({"id": id_}, nomor) for nomor, id_ in enumerate(["A/B", "A B", "A B", ""], start=1)]
+    assert len(set(nama)) == len(nama)
+    assert nama[0] == "A_B_000001.pdf"
+    assert nama[3] == "laporan_000004.pdf"
+
+
+def test_id_kembar_tidak_saling_menimpa(tmp_path):
+    _, skenario = next(laporan.skenario_contoh(1))
+    semua = [(nomor, dict(skenario, id=id_)) for nomor, id_ in enumerate(["A/B", "A B", "A/B"], start=1)]
+    manifest = io.StringIO()
+    total, galat = laporan.jalankan(semua, str(tmp_path), manifest, "png", pekerja=2, ukuran_potongan=1)
+    catatan = [json.loads(baris) for baris in manifest.getvalue().splitlines()]
+    assert (total, galat) == (3, 0)
+    assert len({c["berkas"] for c in catatan}) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(c["berkas"]) for c in catatan)
@@ -0,0 +1,42 @@
+import json
+import threading
+import urllib.request
+
+import pytest
+
+import layanan_model
+
+
+@pytest.fixture(scope="module")
+def url():
+    server = layanan_model.buat_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _post(url, data):
+    permintaan = urllib.request.Request(url, json.dumps(data).encode(), {"Content-Type": "application/json"})
+    with urllib.request.urlopen(permintaan, timeout=30) as r:
+        # JSON standar: token NaN/Infinity ditolak
+        return json.loads(r.read(), parse_constant=lambda t: pytest.fail(f"token JSON tidak standar {t}"))["hasil"]
+
+
+@pytest.mark.parametrize("model, salah, benar", [
+    ("eoq", {"D": 1000, "S": 50, "H": 0}, {"D": 1000, "S": 50, "H": 2}),
+    ("eoq", {"D": -5, "S": 50, "H": 2}, {"D": 1000, "S": 50, "H": 2}),
+    ("antrian_mm1", {"lam": 0, "mu": 10}, {"lam": 3, "mu": 10}),
+    ("turunan_parsial", {"fungsi": "log(x)", "x0": -1, "y0": 0}, {"fungsi": "log(x)", "x0": 2, "y0": 0}),
+])
+def test_jalur_batch_dan_tunggal_memberi_galat_sama(url, model, salah, benar):
+    batch = _post(f"{url}/{model}", {"batch": [benar, salah, benar]})
+    tunggal = _post(f"{url}/{model}", salah)
+    assert "galat" in tunggal
+    assert batch[1] == tunggal
+    assert batch[0] == batch[2] == _post(f"{url}/{model}", benar)
+    assert "galat" not in batch[0]
+
+
+def test_aman_langsung_sama_dengan_per_item():
+    daftar = [{"D": 1000, "S": 50, "H": 0}, {"D": 1000, "S": 50}, {"D": 1000, "S": 50, "H": 2}]
+    assert layanan_model._aman("eoq", daftar) == [layanan_model._satu("eoq", d) for d in daftar]
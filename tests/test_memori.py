@@ -0,0 +1,95 @@
+import os
+import tracemalloc
+
+import pytest
+
+import memori
+
+
+@pytest.fixture(autouse=True)
+def bersih():
+    yield
+    memori._sesi_nyala.clear()
+    if memori._dimulai_di_sini:
+        tracemalloc.stop()
+        memori._dimulai_di_sini = False
+
+
+def test_pelacakan_berhenti_setelah_sesi_terakhir_mematikan_mode():
+    sesi_a, sesi_b = {}, {}
+    memori.mulai(sesi_a, sidebar=False, nyala=True)
+    memori.mulai(sesi_b, sidebar=False, nyala=True)
+    assert tracemalloc.is_tracing()
+
+    memori.mulai(sesi_a, sidebar=False, nyala=False)
+    assert tracemalloc.is_tracing()
+    memori.mulai(sesi_b, sidebar=False, nyala=True)
+    assert memori.selesai(tampilkan=False) is not None
+
+    memori.mulai(sesi_b, sidebar=False, nyala=False)
+    assert not tracemalloc.is_tracing()
+    assert memori.selesai(tampilkan=False) is None
+
+
+def test_rerun_berulang_sesi_sama_tidak_menambah_hitungan():
+    sesi = {}
+    for _ in range(3):
+        memori.mulai(sesi, sidebar=False, nyala=True)
+        memori.selesai(tampilkan=False)
+    memori.mulai(sesi, sidebar=False, nyala=False)
+    assert not tracemalloc.is_tracing()
+
+
+def test_pelacakan_dari_luar_tidak_dihentikan():
+    tracemalloc.start()
+    try:
+        memori.mulai({}, sidebar=False, nyala=True)
+        memori.mulai({}, sidebar=False, nyala=False)
+        assert tracemalloc.is_tracing()
+    finally:
+        memori._sesi_nyala.clear()
+        tracemalloc.stop()
+
+
+def test_aplikasi_mematikan_mode_memori_lewat_sidebar():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(f"{memori.FOLDER}/industri_ban_app.py", default_timeout=60)
+    at.run()
+    mode = next(c for c in at.sidebar.checkbox if c.label == "🧠 Mode Memori")
+    mode.check().run()
+    assert not at.exception and tracemalloc.is_tracing()
+    mode = next(c for c in at.sidebar.checkbox if c.label == "🧠 Mode Memori")
+    mode.uncheck().run()
+    assert not at.exception and not tracemalloc.is_tracing()
+
+
+APP_BOCOR = """
+import streamlit as st
+
+st.session_state.setdefault("simpanan", []).append(bytearray(512 * 1024))
+st.write(len(st.session_state["simpanan"]))
+"""
+
+
+def test_kebocoran_terdeteksi(tmp_path):
+    # Setiap rerun menyimpan 0.5 MB baru: pemanasan tidak pernah selesai dan laju terlihat di setiap jendela
+    app = tmp_path / "app_bocor.py"
+    app.write_text(APP_BOCOR, encoding="utf-8")
+    tumbuh, baris = memori.periksa_kebocoran(str(app), rerun=20, maks_pemanasan=10)
+    assert tumbuh > 8 * 2**20
+    assert any("app_bocor.py" in lokasi for lokasi, _, _ in baris)
+
+
+RERUN = 40
+AMBANG_PER_1000 = 20 * 2**20
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("file_app", memori.APLIKASI)
+def test_aplikasi_tidak_bocor_saat_rerun_berulang(file_app):
+    if os.path.getsize(os.path.join(memori.FOLDER, file_app)) == 0:
+        pytest.skip("file kosong")
+    tumbuh, baris = memori.periksa_kebocoran(file_app, rerun=RERUN)
+    # Laju setelah pemanasan, diproyeksikan ke 1000 rerun seperti `python memori.py`
+    assert tumbuh * 1000 / RERUN < AMBANG_PER_1000, baris
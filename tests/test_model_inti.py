@@ -0,0 +1,24 @@
+import time
+
+import pytest
+
+import model_inti
+import parser_aman
+
+
+def test_turunan_parsial_memakai_pekerja_parser():
+    hasil = model_inti.turunan_parsial("sin(x)*y + x**2", 0.0, 2.0)
+    assert hasil == pytest.approx({"f": 0.0, "fx": 2.0, "fy": 0.0})
+
+
+def test_kompilasi_tunduk_pada_batas_waktu_pekerja(monkeypatch):
+    monkeypatch.setattr(parser_aman, "BATAS_WAKTU", 1e-6)
+    mulai = time.perf_counter()
+    with pytest.raises(parser_aman.BatasWaktuHabis):
+        model_inti.turunan_parsial("x**3*y + cos(x*y) + 7", 1.0, 1.0)
+    assert time.perf_counter() - mulai < 2.0
+
+
+def test_ekspresi_berbahaya_ditolak():
+    with pytest.raises(parser_aman.EkspresiDitolak):
+        model_inti.turunan_parsial("__import__('os')", 0.0, 0.0)
@@ -0,0 +1,22 @@
+import pytest
+
+from parser_aman import EkspresiDitolak, periksa
+
+
+@pytest.mark.parametrize("teks", ["2**" + "9" * 400, "x**(-" + "9" * 400 + ")", "x^" + "9" * 400])
+def test_eksponen_literal_raksasa_ditolak(teks):
+    with pytest.raises(EkspresiDitolak, match="Eksponen terlalu besar"):
+        periksa(teks, ("x", "y"))
+
+
+def test_literal_raksasa_di_luar_eksponen_tetap_diterima():
+    periksa("9" * 400 + " * x", ("x", "y"))
+
+
+def test_parse_tanpa_turunan():
+    import sympy as sp
+
+    from parser_aman import parse
+
+    x, y = sp.symbols("x y")
+    assert parse("x**2 + sin(y)", ("x", "y")) == x**2 + sp.sin(y)
@@ -0,0 +1,22 @@
+import numpy as np
+
+import penjadwalan
+
+
+def _contoh():
+    rng = np.random.default_rng(1)
+    return rng.uniform(0.1, 4, 300), rng.integers(0, 3, 300), np.array([0.5, 0.25, 1.0])
+
+
+def test_pencarian_lokal_deterministik_dan_dibatasi_langkah():
+    durasi, produk, setup = _contoh()
+    a = penjadwalan.jadwalkan(durasi, produk, 4, setup)
+    b = penjadwalan.jadwalkan(durasi, produk, 4, setup)
+    assert a["langkah_perbaikan"] == b["langkah_perbaikan"] <= penjadwalan.MAKS_LANGKAH
+    for kolom in a["jadwal"].dtype.names:
+        assert np.array_equal(a["jadwal"][kolom], b["jadwal"][kolom], equal_nan=kolom == "mulai_setup")
+
+    satu = penjadwalan.jadwalkan(durasi, produk, 4, setup, maks_langkah=1)
+    lpt = penjadwalan.jadwalkan(durasi, produk, 4, setup, perbaikan=False)
+    assert satu["langkah_perbaikan"] <= 1
+    assert a["makespan"] <= satu["makespan"] <= lpt["makespan"]
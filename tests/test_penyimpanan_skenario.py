@@ -0,0 +1,31 @@
+import csv
+import io
+
+import penyimpanan_skenario
+
+
+def test_ekspor_csv_memuat_gabungan_kolom_semua_skema(tmp_path):
+    simpanan = penyimpanan_skenario.PenyimpananSkenario(str(tmp_path / "uji.sqlite"))
+    simpanan.simpan("lp_produksi", {"profit": [1, 2]}, {"sukses": True, "x": [3.0, 4.0], "keuntungan": 11.0})
+    simpanan.simpan("lp_produksi", {"profit": [1, 2, 5]}, {"sukses": False, "x": None, "keuntungan": None})
+    simpanan.simpan("eoq", {"D": 100, "S": 10, "H": 2}, {"EOQ": 31.6})
+
+    keluaran = io.StringIO()
+    assert simpanan.ekspor(keluaran, format="csv") == 3
+    baris = list(csv.DictReader(io.StringIO(keluaran.getvalue())))
+    assert len(baris) == 3
+    assert {"masukan.profit.2", "hasil.x.1", "masukan.D", "hasil.EOQ"} <= set(baris[0])
+    assert baris[1]["masukan.profit.2"] == "5.0" and baris[1]["hasil.x.0"] == ""
+    assert baris[2]["hasil.EOQ"] == "31.6"
+
+
+def test_ekspor_csv_kosong():
+    simpanan = penyimpanan_skenario.PenyimpananSkenario(":memory:")
+    keluaran = io.StringIO()
+    assert simpanan.ekspor(keluaran, format="csv") == 0
+    assert keluaran.getvalue() == ""
+
+
+def test_penyimpanan_bawaan_mengikuti_skenario_db(tmp_path):
+    # conftest mengarahkan SKENARIO_DB ke tmp_path untuk setiap uji
+    assert penyimpanan_skenario.bawaan().path == str(tmp_path / "skenario.sqlite")
@@ -0,0 +1,52 @@
+import time
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import turunan_numerik
+
+# Simbol real agar turunan simbolik Abs/Max dapat dikompilasi sebagai pembanding
+x, y = sp.symbols("x y", real=True)
+
+
+@pytest.mark.parametrize("f, toleransi", [
+    (x**2 + y**2, 1e-12),
+    (sp.sin(x) * sp.exp(-y**2) + sp.log(1 + x**2 * y**2), 1e-12),
+    (sp.sqrt(1 + (x * y + sp.sin(x + sp.cos(y)))**2) / (1 + sp.exp(-x * y)), 1e-12),
+    (sp.atan(x / (1 + y**2)) * sp.cosh(y / 3), 1e-12),
+    (sp.Abs(x - 0.5) * y + sp.Max(x, y), 1e-6),
+])
+def test_gradien_numerik_cocok_dengan_simbolik(f, toleransi):
+    rng = np.random.default_rng(0)
+    titik = (rng.uniform(-2, 2, 1000), rng.uniform(-2, 2, 1000))
+    assert turunan_numerik.bandingkan_dengan_simbolik(f, x, y, titik) <= toleransi
+
+
+def test_fungsi_kecil_dikompilasi_simbolik():
+    f_np, grad_np, hess_np, metode, turunan = turunan_numerik.kompilasi_turunan(x**2 * y + sp.sin(y), x, y)
+    assert metode == "simbolik"
+    assert turunan == (2 * x * y, x**2 + sp.cos(y))
+    assert np.allclose(grad_np(1.0, 2.0), [4.0, 1 + np.cos(2.0)])
+    assert np.allclose(hess_np(1.0, 2.0), [4.0, 2.0, -np.sin(2.0)])
+
+
+def test_fungsi_besar_langsung_numerik_tanpa_turunan_simbolik():
+    f = x
+    for _ in range(5):
+        f = sp.sin(f + y) * sp.exp(f) + sp.cos(x * f)
+    assert turunan_numerik.ukuran(f) > turunan_numerik.AMBANG_OPERASI
+    mulai = time.perf_counter()
+    _, grad_np, _, metode, turunan = turunan_numerik.kompilasi_turunan(f, x, y)
+    assert metode == "complex-step" and turunan is None
+    assert time.perf_counter() - mulai < 1.0
+    assert np.all(np.isfinite(grad_np(np.array([0.1]), np.array([0.2]))))
+
+
+def test_batas_waktu_habis_jatuh_ke_numerik():
+    f = sp.sin(x * y) * sp.exp(x) / (1 + y**2)
+    _, grad_np, hess_np, metode, _ = turunan_numerik.kompilasi_turunan(f, x, y, batas_waktu=1e-6)
+    assert metode == "complex-step"
+    fxx, fxy, fyy = hess_np(0.3, 0.4)
+    acuan = sp.lambdify((x, y), [sp.diff(f, x, 2), sp.diff(f, x, y), sp.diff(f, y, 2)])(0.3, 0.4)
+    assert np.allclose([fxx, fxy, fyy], acuan, rtol=1e-5)
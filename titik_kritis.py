@@ -0,0 +1,112 @@
+"""Pencarian dan klasifikasi titik kritis f(x, y) secara numerik.
+
+Iterasi Newton dijalankan serentak (tervektorisasi) dari banyak titik awal
+pada gradien dan Hessian yang sudah dikompilasi, lalu titik yang konvergen
+diklasifikasikan dari nilai eigen Hessian dan diduplikasi-hapus.
+
+Contoh:
+    x, y = sp.symbols("x y")
+    fungsi = dari_sympy(x*y - 0.1*x**2 - 0.2*y**2, x, y)
+    titik = cari_titik_kritis(*fungsi, batas=((0, 50), (0, 50)))
+"""
+import numpy as np
+import sympy as sp
+
+JENIS = {"maks": "Maksimum lokal", "min": "Minimum lokal", "pelana": "Titik pelana", "degenerasi": "Tidak dapat ditentukan"}
+
+
+def _larik(nilai, bentuk):
+    # lambdify mengembalikan skalar untuk turunan konstan, jadi disamakan bentuknya
+    return np.broadcast_to(np.asarray(nilai, dtype=float), bentuk)
+
+
+def dari_sympy(f, x, y, turunan=None):
+    """Kompilasi f, gradien dan Hessian sekali; kembalikan (f, gradien, hessian).
+
+    `turunan` (fx, fy) yang sudah dihitung, mis. oleh `parser_aman.parse_dan_turunkan`, dipakai ulang.
+    """
+    fx, fy = turunan if turunan is not None else (sp.diff(f, x), sp.diff(f, y))
+    f_np = sp.lambdify((x, y), f, "numpy")
+    grad_np = sp.lambdify((x, y), [fx, fy], "numpy")
+    hess_np = sp.lambdify((x, y), [sp.diff(fx, x), sp.diff(fx, y), sp.diff(fy, y)], "numpy")
+    return f_np, grad_np, hess_np
+
+
+def klasifikasi(hxx, hxy, hyy, tol=1e-9):
+    """Jenis titik kritis dari nilai eigen Hessian 2x2 simetris."""
+    H = np.array([[hxx, hxy], [hxy, hyy]], dtype=float)
+    eig = np.linalg.eigvalsh(H)
+    skala = max(1.0, np.abs(eig).max())
+    if np.any(np.abs(eig) <= tol * skala):
+        return "degenerasi", eig
+    if np.all(eig < 0):
+        return "maks", eig
+    if np.all(eig > 0):
+        return "min", eig
+    return "pelana", eig
+
+
+def cari_titik_kritis(f, gradien, hessian, batas, n_awal=400, iterasi=60, tol=1e-8, margin=None):
+    """Cari titik stasioner f dari grid titik awal di dalam `batas`.
+
+    `batas` berupa ((x_min, x_max), (y_min, y_max)). Newton boleh konvergen ke
+    titik di luar batas; bila `margin` diisi, hanya titik di dalam batas yang
+    diperlebar `margin` kali lebar domain yang dipertahankan. Mengembalikan list
+    dict berisi x, y, f, jenis dan eigen, diurutkan dari nilai f terbesar.
+    """
+    (x_min, x_max), (y_min, y_max) = batas
+    n = max(2, int(np.sqrt(n_awal)))
+    X, Y = np.meshgrid(np.linspace(x_min, x_max, n), np.linspace(y_min, y_max, n))
+    X, Y = X.ravel().copy(), Y.ravel().copy()
+    aktif = np.ones(X.shape, dtype=bool)
+    konvergen = np.zeros(X.shape, dtype=bool)
+    skala = max(x_max - x_min, y_max - y_min, 1.0)
+
+    with np.errstate(all="ignore"):
+        # Skala gradien di titik awal, dipakai sebagai acuan toleransi konvergensi
+        gx, gy = (_larik(g, X.shape) for g in gradien(X, Y))
+        norma_awal = np.hypot(gx, gy)
+        skala_grad = 1.0 + np.nanmedian(np.where(np.isfinite(norma_awal), norma_awal, np.nan))
+
+        for _ in range(iterasi):
+            if not aktif.any():
+                break
+            xa, ya = X[aktif], Y[aktif]
+            gx, gy = (_larik(g, xa.shape) for g in gradien(xa, ya))
+            hxx, hxy, hyy = (_larik(h, xa.shape) for h in hessian(xa, ya))
+            det = hxx * hyy - hxy * hxy
+            dx = (hyy * gx - hxy * gy) / det
+            dy = (hxx * gy - hxy * gx) / det
+
+            X[aktif] = xa - dx
+            Y[aktif] = ya - dy
+            langkah = np.hypot(dx, dy)
+
+            idx = np.flatnonzero(aktif)
+            kecil = langkah < tol * skala
+            konvergen[idx[kecil]] = True
+            aktif[idx[kecil | ~np.isfinite(langkah)]] = False
+
+        gx, gy = (_larik(g, X.shape) for g in gradien(X, Y))
+        norma = np.hypot(gx, gy)
+
+    ok = konvergen & np.isfinite(X) & np.isfinite(Y) & (norma < 1e-6 * skala_grad)
+    if margin is not None:
+        lx, ly = (x_max - x_min) * margin, (y_max - y_min) * margin
+        ok &= (X >= x_min - lx) & (X <= x_max + lx) & (Y >= y_min - ly) & (Y <= y_max + ly)
+    if not ok.any():
+        return []
+
+    # Hapus duplikat: titik yang sama bila berjarak kurang dari 1e-6 skala domain
+    kunci = np.round(np.column_stack([X[ok], Y[ok]]) / (1e-6 * skala)).astype(np.int64)
+    _, unik = np.unique(kunci, axis=0, return_index=True)
+    xs, ys = X[ok][unik], Y[ok][unik]
+
+    nilai_f = _larik(f(xs, ys), xs.shape)
+    hxx, hxy, hyy = (_larik(h, xs.shape) for h in hessian(xs, ys))
+    hasil = []
+    for i in range(len(xs)):
+        jenis, eig = klasifikasi(hxx[i], hxy[i], hyy[i])
+        hasil.append({"x": float(xs[i]) + 0.0, "y": float(ys[i]) + 0.0, "f": float(nilai_f[i]), "jenis": jenis, "eigen": eig.tolist()})
+    hasil.sort(key=lambda t: -t["f"])
+    return hasil
@@ -0,0 +1,146 @@
+"""Turunan numerik (complex-step) sebagai cadangan turunan simbolik.
+
+Untuk fungsi bersarang, `sp.diff` + `lambdify` bisa menghasilkan pohon
+ekspresi yang sangat besar. Bila f sendiri sudah melewati ambang, turunan
+simbolik tidak dibangun sama sekali; selain itu turunan pertama dan kedua
+dihitung di proses pekerja `parser_aman` dengan batas waktu. Bila ukurannya
+melewati ambang atau waktunya habis, gradien dihitung langsung dari f
+terkompilasi dengan metode complex-step:
+
+    ∂f/∂x ≈ Im f(x + ih, y) / h,   h = 1e-20
+
+yang akurat sampai presisi mesin untuk fungsi analitik. Fungsi yang tidak
+analitik (Abs, Min, Max, sign, Piecewise) memakai selisih pusat.
+"""
+import numpy as np
+import sympy as sp
+
+import parser_aman
+
+AMBANG_OPERASI = 400
+H_KOMPLEKS = 1e-20
+_TIDAK_ANALITIK = (sp.Abs, sp.Min, sp.Max, sp.sign, sp.Piecewise, sp.floor, sp.ceiling)
+
+
+def ukuran(*ekspresi):
+    """Jumlah operasi total, dipakai untuk memutuskan simbolik vs numerik."""
+    return sum(sp.count_ops(e) for e in ekspresi)
+
+
+def gradien_complex_step(f_np):
+    """Gradien [∂f/∂x, ∂f/∂y] dari f terkompilasi, tervektorisasi atas array NumPy."""
+    def grad(X, Y):
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        with np.errstate(all="ignore"):
+            gx = np.imag(f_np(X + 1j * H_KOMPLEKS, Y + 0j)) / H_KOMPLEKS
+            gy = np.imag(f_np(X + 0j, Y + 1j * H_KOMPLEKS)) / H_KOMPLEKS
+        return [gx, gy]
+    return grad
+
+
+def gradien_selisih_pusat(f_np):
+    """Gradien dengan selisih pusat, untuk fungsi yang tidak analitik."""
+    def grad(X, Y):
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        hx = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(X))
+        hy = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(Y))
+        with np.errstate(all="ignore"):
+            gx = (f_np(X + hx, Y) - f_np(X - hx, Y)) / (2 * hx)
+            gy = (f_np(X, Y + hy) - f_np(X, Y - hy)) / (2 * hy)
+        return [gx, gy]
+    return grad
+
+
+def hessian_dari_gradien(grad_np):
+    """Hessian [fxx, fxy, fyy] dengan selisih pusat pada gradien."""
+    def hess(X, Y):
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        hx = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(X))
+        hy = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(Y))
+        gx_p, gy_p = grad_np(X + hx, Y)
+        gx_m, gy_m = grad_np(X - hx, Y)
+        gx_yp, gy_yp = grad_np(X, Y + hy)
+        gx_ym, gy_ym = grad_np(X, Y - hy)
+        fxx = (np.asarray(gx_p) - gx_m) / (2 * hx)
+        fyy = (np.asarray(gy_yp) - gy_ym) / (2 * hy)
+        # Rata-rata dua perkiraan turunan campuran agar simetris
+        fxy = 0.5 * ((np.asarray(gy_p) - gy_m) / (2 * hx) + (np.asarray(gx_yp) - gx_ym) / (2 * hy))
+        return [fxx, fxy, fyy]
+    return hess
+
+
+def _turunan_pertama(f, x, y, ambang):
+    """Dijalankan di proses pekerja: (fx, fy), atau None bila melewati ambang."""
+    fx, fy = sp.diff(f, x), sp.diff(f, y)
+    return None if ukuran(fx, fy) > ambang else (fx, fy)
+
+
+def _turunan_kedua(fx, fy, x, y, ambang):
+    """Dijalankan di proses pekerja: [fxx, fxy, fyy], atau None bila melewati ambang."""
+    kedua = [sp.diff(fx, x), sp.diff(fx, y), sp.diff(fy, y)]
+    return None if ukuran(*kedua) > ambang else kedua
+
+
+def kompilasi_turunan(f, x, y, turunan=None, ambang=AMBANG_OPERASI, batas_waktu=None):
+    """Kompilasi f, gradien dan Hessian; pilih simbolik atau numerik menurut ukuran turunan.
+
+    Turunan yang belum diberikan dibangun di proses pekerja dengan `batas_waktu` detik
+    (bawaan `parser_aman.BATAS_WAKTU`); f yang sudah melewati `ambang` langsung numerik.
+    Mengembalikan (f_np, grad_np, hess_np, metode, turunan) dengan metode salah satu dari
+    "simbolik", "campuran" (gradien simbolik, Hessian numerik), "complex-step"
+    atau "selisih pusat", dan turunan berupa (fx, fy) simbolik atau None bila numerik.
+    """
+    f_np = sp.lambdify((x, y), f, "numpy")
+
+    def numerik():
+        if f.has(*_TIDAK_ANALITIK):
+            grad_np, metode = gradien_selisih_pusat(f_np), "selisih pusat"
+        else:
+            grad_np, metode = gradien_complex_step(f_np), "complex-step"
+        return f_np, grad_np, hessian_dari_gradien(grad_np), metode, None
+
+    # Turunan jarang lebih kecil dari f, jadi f yang sudah besar tidak perlu diturunkan dulu
+    if ukuran(f) > ambang:
+        return numerik()
+    if turunan is None:
+        try:
+            turunan = parser_aman.jalankan_terbatas(_turunan_pertama, f, x, y, ambang, batas_waktu=batas_waktu)
+        except parser_aman.EkspresiDitolak:
+            turunan = None
+        if turunan is None:
+            return numerik()
+    fx, fy = turunan = tuple(turunan)
+    if ukuran(fx, fy) > ambang:
+        return numerik()
+    try:
+        grad_np = sp.lambdify((x, y), [fx, fy], "numpy")
+    except Exception:
+        # Contoh: turunan Abs pada simbol kompleks berisi Derivative(re(...)) yang tidak bisa dicetak
+        return numerik()
+
+    try:
+        kedua = parser_aman.jalankan_terbatas(_turunan_kedua, fx, fy, x, y, ambang, batas_waktu=batas_waktu)
+    except parser_aman.EkspresiDitolak:
+        kedua = None
+    if kedua is None:
+        return f_np, grad_np, hessian_dari_gradien(grad_np), "campuran", turunan
+    try:
+        return f_np, grad_np, sp.lambdify((x, y), kedua, "numpy"), "simbolik", turunan
+    except Exception:
+        return f_np, grad_np, hessian_dari_gradien(grad_np), "campuran", turunan
+
+
+def bandingkan_dengan_simbolik(f, x, y, titik):
+    """Galat relatif maksimum gradien complex-step/selisih pusat terhadap gradien simbolik."""
+    f_np = sp.lambdify((x, y), f, "numpy")
+    numerik = gradien_selisih_pusat(f_np) if f.has(*_TIDAK_ANALITIK) else gradien_complex_step(f_np)
+    simbolik = sp.lambdify((x, y), [sp.diff(f, x), sp.diff(f, y)], "numpy")
+    X, Y = titik
+    galat = 0.0
+    for a, b in zip(numerik(X, Y), simbolik(X, Y)):
+        b = np.broadcast_to(np.asarray(b, dtype=float), np.shape(X))
+        galat = max(galat, float(np.max(np.abs(a - b) / np.maximum(1.0, np.abs(b)))))
+    return galat
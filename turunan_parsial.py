@@ -3,57 +3,299 @@ import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+import re
+import taylor
+import volume_3d
+import turunan_numerik
+import lagrange
+import medan_gradien
+import memori
+import pekerjaan
+import peta_kontur
+import profiler
+from parser_aman import parse, parse_dan_turunkan
+from profiler import ukur
 
 # Input fungsi
 st.title("Aplikasi Turunan Parsial dan Grafik 3D")
+profiler.mulai()
+memori.mulai()
 
-x, y = sp.symbols('x y')
-fungsi_input = st.text_input("Masukkan fungsi f(x, y):", "x**2 + y**2")
+@st.cache_resource
+def kompilasi_kkt(fungsi_input, teks_kendala, maksimasi):
+    """Parse fungsi dan kendala (satu per baris) lalu kompilasi sistem KKT sekali."""
+    f = parse(fungsi_input, ("x", "y"))
+    kendala = []
+    for baris in teks_kendala.splitlines():
+        if not baris.strip():
+            continue
+        bagian = re.split(r"(<=|>=|=)", baris, maxsplit=1)
+        if len(bagian) != 3:
+            raise ValueError(f"Kendala '{baris}' harus memakai <=, >= atau =")
+        kiri, op, kanan = bagian
+        if op == ">=":
+            kiri, kanan = kanan, kiri
+        h = parse(f"({kiri}) - ({kanan})", ("x", "y"))
+        kendala.append((h, "=" if op == "=" else "<="))
+    return lagrange.bangun_kkt(f, sp.symbols("x y"), kendala, maksimasi)
 
-try:
-    f = sp.sympify(fungsi_input)
+@st.cache_resource
+def turunan_terkompilasi(fungsi_input):
+    """f, gradien dan Hessian dikompilasi sekali per fungsi (simbolik atau numerik bila terlalu besar).
 
-    # Hitung turunan parsial
-    fx = sp.diff(f, x)
-    fy = sp.diff(f, y)
+    Hanya f yang diparse; `kompilasi_turunan` sendiri yang memutuskan apakah turunan
+    simbolik dibangun (di pekerja dengan batas waktu) atau langsung complex-step.
+    """
+    f = parse(fungsi_input, ("x", "y"))
+    return (f,) + turunan_numerik.kompilasi_turunan(f, *sp.symbols("x y"))
 
-    st.write(f"Turunan parsial ∂f/∂x = {fx}")
-    st.write(f"Turunan parsial ∂f/∂y = {fy}")
+def hitung_grid(pek, f_np, batas, resolusi, buffer):
+    """Dijalankan di pekerjaan latar; progres dilaporkan per blok baris grid."""
+    with ukur("grid"):
+        return peta_kontur.evaluasi_grid(f_np, batas, resolusi, buffer=buffer, kemajuan=pek.lapor)
 
-    # Input titik evaluasi
-    x0 = st.number_input("Masukkan nilai x₀", value=1.0)
-    y0 = st.number_input("Masukkan nilai y₀", value=1.0)
+@st.cache_resource(max_entries=4)
+def volume_terevaluasi(fungsi_input, batas, resolusi):
+    """Volume f(x, y, z) dievaluasi sekali per (fungsi, domain, resolusi); slider irisan hanya mengindeks."""
+    f = parse(fungsi_input, ("x", "y", "z"))
+    f_np = sp.lambdify(sp.symbols("x y z"), f, "numpy")
+    sumbu, V = volume_3d.evaluasi_volume(f_np, batas, resolusi)
+    return sumbu, V, volume_3d.rentang_nilai(V)
 
-    fx_val = fx.evalf(subs={x: x0, y: y0})
-    fy_val = fy.evalf(subs={x: x0, y: y0})
-    f_val = f.evalf(subs={x: x0, y: y0})
+jumlah_variabel = st.radio("Jumlah variabel:", [2, 3], horizontal=True,
+                           format_func=lambda n: "f(x, y)" if n == 2 else "f(x, y, z)")
 
-    st.write(f"f({x0}, {y0}) = {f_val}")
-    st.write(f"∂f/∂x({x0}, {y0}) = {fx_val}")
-    st.write(f"∂f/∂y({x0}, {y0}) = {fy_val}")
+if jumlah_variabel == 3:
+    x, y, z = sp.symbols('x y z')
+    fungsi_input = st.text_input("Masukkan fungsi f(x, y, z):", "x**2 + y**2 - z**2")
 
-    # Grafik 3D
-    fig = plt.figure()
-    ax = fig.add_subplot(111, projection='3d')
+    try:
+        with ukur("parse"):
+            f, turunan = parse_dan_turunkan(fungsi_input, ("x", "y", "z"))
+        for nama, d in zip(("x", "y", "z"), turunan):
+            st.write(f"Turunan parsial ∂f/∂{nama} = {d}")
 
-    X = np.linspace(x0 - 2, x0 + 2, 50)
-    Y = np.linspace(y0 - 2, y0 + 2, 50)
-    X, Y = np.meshgrid(X, Y)
-    f_lambd = sp.lambdify((x, y), f, "numpy")
-    Z = f_lambd(X, Y)
+        # Input titik evaluasi
+        col1, col2, col3 = st.columns(3)
+        x0 = col1.number_input("Masukkan nilai x₀", value=1.0)
+        y0 = col2.number_input("Masukkan nilai y₀", value=1.0)
+        z0 = col3.number_input("Masukkan nilai z₀", value=1.0)
+        titik = (x0, y0, z0)
+        subs = {x: x0, y: y0, z: z0}
 
-    # Grafik fungsi
-    ax.plot_surface(X, Y, Z, alpha=0.7, cmap='viridis')
+        gradien = [float(d.evalf(subs=subs)) for d in turunan]
+        st.write(f"f({x0}, {y0}, {z0}) = {f.evalf(subs=subs)}")
+        for nama, g in zip(("x", "y", "z"), gradien):
+            st.write(f"∂f/∂{nama}({x0}, {y0}, {z0}) = {g}")
 
-    # Bidang singgung
-    Z_tangent = f_val + fx_val * (X - x0) + fy_val * (Y - y0)
-    ax.plot_surface(X, Y, Z_tangent, alpha=0.5, color='red')
+        resolusi = st.select_slider("Resolusi volume (titik per sumbu)", options=[32, 64, 96, 128, 160], value=96)
+        batas = tuple((c - 2, c + 2) for c in titik)
+        with ukur("grid"):
+            sumbu, V, (v_min, v_max) = volume_terevaluasi(fungsi_input, batas, resolusi)
 
-    ax.set_xlabel('X')
-    ax.set_ylabel('Y')
-    ax.set_zlabel('Z')
-    st.pyplot(fig)
+        # Irisan hanya mengindeks volume yang sudah ada di cache
+        poros = st.radio("Iris pada sumbu:", list(volume_3d.SUMBU), index=2, horizontal=True)
+        k = volume_3d.SUMBU.index(poros)
+        nilai_poros = sumbu[k]
+        indeks = st.select_slider(f"Nilai {poros} irisan", options=range(resolusi),
+                                  value=volume_3d.indeks_terdekat(nilai_poros, titik[k]),
+                                  format_func=lambda i: f"{nilai_poros[i]:.3f}")
+        nama_h, nilai_h, nama_v, nilai_v, Z = volume_3d.irisan(V, sumbu, poros, indeks)
 
-except Exception as e:
-    st.error(f"Terjadi kesalahan: {e}")
+        fig, ax = plt.subplots(figsize=(8, 6))
+        # Skala warna satu untuk seluruh volume agar irisan yang berbeda dapat dibandingkan
+        gambar = peta_kontur.gambar_heatmap(ax, nilai_h, nilai_v, Z, vmin=v_min, vmax=v_max)
+        fig.colorbar(gambar, ax=ax, label="f(x, y, z)")
+        h, v = volume_3d.SUMBU.index(nama_h), volume_3d.SUMBU.index(nama_v)
+        if indeks == volume_3d.indeks_terdekat(nilai_poros, titik[k]):
+            # Irisan melewati titik evaluasi: tampilkan komponen gradien di bidang irisan
+            peta_kontur.panah_gradien(ax, titik[h], titik[v], gradien[h], gradien[v], (batas[h], batas[v]))
+        else:
+            ax.plot(titik[h], titik[v], "r+", markersize=12)
+        ax.set_title(f"Irisan f pada {poros} = {nilai_poros[indeks]:.3f}")
+        ax.set_xlabel(nama_h.upper())
+        ax.set_ylabel(nama_v.upper())
+        with ukur("render"):
+            st.pyplot(fig)
+        plt.close(fig)
+
+    except Exception as e:
+        st.error(f"Terjadi kesalahan: {e}")
+
+else:
+    x, y = sp.symbols('x y')
+    fungsi_input = st.text_input("Masukkan fungsi f(x, y):", "x**2 + y**2")
+
+    try:
+        # Parse dan turunan parsial dihitung di proses pekerja dengan batas waktu
+        with ukur("kompilasi"):
+            f, f_lambd, grad_lambd, hess_lambd, metode_turunan, turunan = turunan_terkompilasi(fungsi_input)
+        simbolik = turunan is not None
+
+        if simbolik:
+            fx, fy = turunan
+            st.write(f"Turunan parsial ∂f/∂x = {fx}")
+            st.write(f"Turunan parsial ∂f/∂y = {fy}")
+        else:
+            # Hanya f yang diukur; turunan yang mungkin sangat besar tidak pernah masuk proses ini
+            operasi = turunan_numerik.ukuran(f)
+            alasan = (f"terlalu besar (f sudah {operasi} operasi)" if operasi > turunan_numerik.AMBANG_OPERASI
+                      else "terlalu besar, tidak dapat dikompilasi atau melebihi batas waktu")
+            st.info(f"Ekspresi turunan simbolik {alasan}; turunan dihitung numerik dengan metode {metode_turunan}.")
+
+        # Input titik evaluasi
+        x0 = st.number_input("Masukkan nilai x₀", value=1.0)
+        y0 = st.number_input("Masukkan nilai y₀", value=1.0)
+
+        if simbolik:
+            fx_val = fx.evalf(subs={x: x0, y: y0})
+            fy_val = fy.evalf(subs={x: x0, y: y0})
+            f_val = f.evalf(subs={x: x0, y: y0})
+        else:
+            f_val = float(f_lambd(x0, y0))
+            fx_val, fy_val = (float(g) for g in grad_lambd(x0, y0))
+
+        st.write(f"f({x0}, {y0}) = {f_val}")
+        st.write(f"∂f/∂x({x0}, {y0}) = {fx_val}")
+        st.write(f"∂f/∂y({x0}, {y0}) = {fy_val}")
+
+        tampilan = st.radio("Tampilan grafik:", ["Permukaan 3D", "Kontur/Heatmap resolusi tinggi"], horizontal=True)
+
+        if tampilan == "Permukaan 3D":
+            # Grafik 3D
+            fig = plt.figure()
+            ax = fig.add_subplot(111, projection='3d')
+
+            orde = st.radio("Aproksimasi Taylor:", [1, 2], horizontal=True,
+                            format_func=lambda o: "Orde 1 (bidang singgung)" if o == 1 else "Orde 2 (kuadratik)")
+
+            with ukur("grid"):
+                X = np.linspace(x0 - 2, x0 + 2, 50)
+                Y = np.linspace(y0 - 2, y0 + 2, 50)
+                X, Y = np.meshgrid(X, Y)
+                Z = np.broadcast_to(np.asarray(f_lambd(X, Y), dtype=float), X.shape)
+                # Turunan sudah terkompilasi, jadi pindah titik ekspansi cukup satu evaluasi di (x0, y0)
+                koef = taylor.koefisien(f_lambd, grad_lambd, hess_lambd, x0, y0)
+                Z_aproks = taylor.aproksimasi(koef, x0, y0, X, Y, orde)
+
+            # Grafik fungsi
+            ax.plot_surface(X, Y, Z, alpha=0.7, cmap='viridis')
+
+            # Permukaan Taylor (bidang singgung untuk orde 1)
+            ax.plot_surface(X, Y, Z_aproks, alpha=0.5, color='red')
+
+            ax.set_xlabel('X')
+            ax.set_ylabel('Y')
+            ax.set_zlabel('Z')
+            with ukur("render"):
+                st.pyplot(fig)
+            plt.close(fig)
+
+            if st.checkbox("Tampilkan peta galat |f − aproksimasi|"):
+                galat = taylor.peta_galat(Z, Z_aproks)
+                st.write(f"Galat maksimum di grid: {np.nanmax(galat):.4g}  |  rata-rata: {np.nanmean(galat):.4g}")
+                fig_galat, ax_galat = plt.subplots(figsize=(6, 5))
+                gambar = ax_galat.imshow(galat, extent=(x0 - 2, x0 + 2, y0 - 2, y0 + 2), origin="lower", cmap="magma")
+                fig_galat.colorbar(gambar, ax=ax_galat, label="|f − aproksimasi|")
+                ax_galat.plot(x0, y0, "c+", markersize=12)
+                ax_galat.set_title(f"Galat aproksimasi Taylor orde {orde}")
+                with ukur("render"):
+                    st.pyplot(fig_galat)
+                plt.close(fig_galat)
+
+        else:
+            # Grid dievaluasi di pekerjaan latar ke buffer float32 milik sesi ini; selama grid
+            # untuk masukan baru dihitung, heatmap terakhir tetap tampil dengan progress bar
+            resolusi = st.select_slider("Resolusi grid", options=[250, 500, 1000, 2000, 4000], value=1000)
+            batas = ((x0 - 2, x0 + 2), (y0 - 2, y0 + 2))
+            terakhir = pekerjaan.hasil_terakhir(st.session_state, "grid_kontur")
+            buffer = peta_kontur.ambil_buffer(st.session_state, resolusi, kecuali=terakhir[1][2] if terakhir else None)
+            hasil_grid, segar = pekerjaan.tampilkan("grid_kontur", (fungsi_input, batas, resolusi), hitung_grid,
+                                                    f_lambd, batas, resolusi, buffer, label="Mengevaluasi grid")
+
+            if hasil_grid is not None:
+                xs, ys, Z = hasil_grid
+                batas = ((xs[0], xs[-1]), (ys[0], ys[-1]))
+                if not segar:
+                    st.caption("Menampilkan heatmap sebelumnya sampai grid baru selesai dihitung.")
+
+                fig, ax = plt.subplots(figsize=(8, 6))
+                gambar = peta_kontur.gambar_heatmap(ax, xs, ys, Z)
+                fig.colorbar(gambar, ax=ax, label="f(x, y)")
+                peta_kontur.panah_gradien(ax, x0, y0, float(fx_val), float(fy_val), batas)
+
+                # Overlay medan gradien & turunan berarah pada grid kasar turunan dari grid utama
+                col1, col2 = st.columns(2)
+                gaya_medan = col1.radio("Medan gradien", ["Tidak ada", "panah", "streamline"], horizontal=True)
+                maks_panah = col1.slider("Maksimum jumlah panah", 50, 2000, medan_gradien.MAKS_PANAH, step=50)
+                tampil_du = col2.checkbox("Turunan berarah D_u f")
+                sudut = col2.slider("Arah u (derajat)", 0, 359, 45)
+                if gaya_medan != "Tidak ada" or tampil_du:
+                    with ukur("grid"):
+                        xs_k, ys_k = medan_gradien.grid_kasar(xs, ys, maks_panah)
+                        Xk, Yk, gx, gy = medan_gradien.hitung_medan(grad_lambd, xs_k, ys_k)
+                    if gaya_medan != "Tidak ada":
+                        medan_gradien.gambar_medan(ax, Xk, Yk, gx, gy, gaya_medan)
+                    if tampil_du:
+                        du = medan_gradien.turunan_berarah(gx, gy, sudut)
+                        medan_gradien.gambar_turunan_berarah(ax, Xk, Yk, du, x0, y0, sudut, batas)
+                        du0 = medan_gradien.turunan_berarah(float(fx_val), float(fy_val), sudut)
+                        st.write(f"D_u f({x0}, {y0}) pada arah {sudut}° = {du0:.4f}")
+                ax.set_xlim(*batas[0])
+                ax.set_ylim(*batas[1])
+                ax.set_title("Heatmap f(x, y) dan arah gradien di (x₀, y₀)")
+                ax.set_xlabel('X')
+                ax.set_ylabel('Y')
+                with ukur("render"):
+                    st.pyplot(fig)
+                plt.close(fig)
+
+                # File ekspor resolusi penuh hanya dibuat bila diminta
+                if st.checkbox("Siapkan file ekspor resolusi penuh"):
+                    col1, col2 = st.columns(2)
+                    col1.download_button("⬇️ Unduh grid (.npy)", peta_kontur.ekspor_npy(Z), file_name="grid_f.npy")
+                    col2.download_button("⬇️ Unduh heatmap (.png)", peta_kontur.ekspor_png(Z), file_name="heatmap_f.png")
+
+        # Optimasi dengan kendala memakai pengali Lagrange
+        with st.expander("📐 Optimasi dengan Kendala (Lagrange)"):
+            tujuan = st.radio("Tujuan", ["Maksimum", "Minimum"], horizontal=True)
+            teks_kendala = st.text_area("Kendala (satu per baris, gunakan <=, >= atau =):", "x + y <= 4")
+            rentang = st.number_input("Rentang titik awal (±) di sekitar (x₀, y₀)", min_value=0.1, value=5.0)
+
+            with ukur("kompilasi"):
+                kkt = kompilasi_kkt(fungsi_input, teks_kendala, tujuan == "Maksimum")
+            with ukur("solve"):
+                hasil = lagrange.selesaikan(kkt, batas=((x0 - rentang, x0 + rentang), (y0 - rentang, y0 + rentang)))
+
+            if hasil is None:
+                st.warning("Tidak ditemukan titik KKT yang layak. Coba perbesar rentang titik awal.")
+            else:
+                if hasil["status"] == "tak_terbatas":
+                    xr, yr = hasil["sinar"]["titik"]
+                    st.error(f"Masalah tak terbatas: objektif terus membaik sepanjang sinar layak, "
+                             f"mis. f({xr:.4g}, {yr:.4g}) = {hasil['sinar']['objektif']:.4g}. "
+                             "Tidak ada optimum; tambahkan kendala.")
+                if hasil["titik"] is not None:
+                    xs, ys = hasil["titik"]
+                    keterangan = {
+                        "lokal": "Optimum lokal (Hessian tereduksi definit)",
+                        "pelana": "Titik pelana/bukan optimum (ada arah layak yang memperbaiki objektif)",
+                        "tidak_pasti": "Titik KKT degenerate (uji orde dua tidak menentukan)",
+                    }[hasil["jenis"]]
+                    tampil = st.success if hasil["status"] == "lokal" else st.warning
+                    tampil(f"{keterangan}: x = {xs:.4f}, y = {ys:.4f}")
+                    st.write(f"Nilai objektif f(x, y) = {hasil['objektif']:.4f}")
+                    baris_kendala = [b for b in teks_kendala.splitlines() if b.strip()]
+                    st.dataframe([{"Kendala": b, "Pengali λ": lam, "Aktif": i in hasil["aktif"]}
+                                  for i, (b, lam) in enumerate(zip(baris_kendala, hasil["pengali"]))])
+                if len(hasil["kandidat"]) > 1:
+                    st.caption("Semua titik KKT yang ditemukan:")
+                    st.dataframe([{"x": c["titik"][0], "y": c["titik"][1], "f(x, y)": c["objektif"], "Jenis": c["jenis"]}
+                                  for c in hasil["kandidat"]])
+
+    except Exception as e:
+        st.error(f"Terjadi kesalahan: {e}")
+
+memori.selesai()
+profiler.selesai()
 
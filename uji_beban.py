@@ -0,0 +1,160 @@
+"""Uji beban lokal: banyak sesi simultan memakai streamlit.testing.v1.AppTest.
+
+Contoh:
+    python uji_beban.py --sesi 16 --interaksi 20
+    python uji_beban.py --skenario turunan --sesi 8 --proses
+
+Setiap sesi simulasi memuat aplikasi lalu melakukan interaksi widget yang
+realistis. Latensi setiap rerun dicatat, lalu dilaporkan p50/p95/p99,
+throughput (rerun/detik) dan pertumbuhan memori (RSS). Semua berjalan di
+satu mesin tanpa jaringan.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+FUNGSI_CONTOH = [
+    "x**2 + y**2",
+    "sin(x)*cos(y)",
+    "10*x + 8*y - 0.1*x**2 - 0.05*y**2",
+    "exp(-(x**2 + y**2)) * x*y",
+    "log(1 + x**2) + sqrt(1 + y**2)",
+]
+
+TAB_INDUSTRI_BAN = [
+    "Produksi Ban (Optimasi)",
+    "Pengadaan Karet (EOQ)",
+    "Antrian Bengkel",
+    "Analisis Harga (Turunan Parsial)",
+]
+
+
+def _widget(daftar, label):
+    for w in daftar:
+        if w.label == label:
+            return w
+    raise KeyError(label)
+
+
+def interaksi_produksi(at, rng):
+    label = rng.choice([
+        "Total Kapasitas Mesin (jam)",
+        "Total Kapasitas Bahan Baku (unit)",
+        "Total Kapasitas Tenaga Kerja (jam)",
+    ])
+    _widget(at.sidebar.number_input, label).set_value(rng.randint(50, 400))
+
+
+def interaksi_turunan(at, rng):
+    _widget(at.text_input, "Masukkan fungsi f(x, y):").set_value(rng.choice(FUNGSI_CONTOH))
+
+
+def interaksi_industri_ban(at, rng):
+    _widget(at.sidebar.radio, "📌 Pilih Studi Kasus:").set_value(rng.choice(TAB_INDUSTRI_BAN))
+
+
+SKENARIO = {
+    "produksi": ("app_optimasi_produksi_full.py", interaksi_produksi),
+    "turunan": ("turunan_parsial.py", interaksi_turunan),
+    "industri_ban": ("industri_ban_app.py", interaksi_industri_ban),
+}
+
+
+def rss_mb():
+    """RSS saat ini (MB); memakai /proc bila ada, jika tidak memakai puncak RSS."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def jalankan_sesi(skenario, interaksi, seed, timeout):
+    """Satu sesi simulasi. Mengembalikan daftar latensi rerun (detik)."""
+    file_app, aksi = SKENARIO[skenario]
+    rng = random.Random(seed)
+    latensi = []
+
+    t0 = time.perf_counter()
+    at = AppTest.from_file(os.path.join(FOLDER, file_app), default_timeout=timeout).run()
+    latensi.append(time.perf_counter() - t0)
+    if at.exception:
+        raise RuntimeError(f"{file_app}: {at.exception[0].message}")
+
+    for _ in range(interaksi):
+        aksi(at, rng)
+        t0 = time.perf_counter()
+        at.run()
+        latensi.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"{file_app}: {at.exception[0].message}")
+    return latensi
+
+
+def _jalankan_sesi_proses(argumen):
+    awal = rss_mb()
+    latensi = jalankan_sesi(*argumen)
+    return latensi, rss_mb() - awal
+
+
+def uji_beban(skenario, sesi, interaksi, proses=False, timeout=30.0):
+    """Jalankan `sesi` sesi paralel dan kembalikan ringkasan statistik."""
+    argumen = [(skenario, interaksi, seed, timeout) for seed in range(sesi)]
+    rss_awal = rss_mb()
+    t0 = time.perf_counter()
+
+    if proses:
+        with ProcessPoolExecutor(max_workers=sesi) as pool:
+            hasil = list(pool.map(_jalankan_sesi_proses, argumen))
+        semua = [lat for latensi, _ in hasil for lat in latensi]
+        # Pertumbuhan diukur di dalam tiap proses pekerja lalu dijumlahkan
+        rss_akhir = rss_awal + sum(tumbuh for _, tumbuh in hasil)
+    else:
+        with ThreadPoolExecutor(max_workers=sesi) as pool:
+            hasil = list(pool.map(lambda a: jalankan_sesi(*a), argumen))
+        semua = [lat for latensi in hasil for lat in latensi]
+        rss_akhir = rss_mb()
+
+    durasi = time.perf_counter() - t0
+    ms = np.array(semua) * 1000
+    return {
+        "skenario": skenario,
+        "sesi": sesi,
+        "rerun": len(semua),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "throughput": len(semua) / durasi,
+        "pertumbuhan_memori_mb": rss_akhir - rss_awal,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skenario", choices=list(SKENARIO) + ["semua"], default="semua")
+    parser.add_argument("--sesi", type=int, default=8, help="jumlah sesi simultan")
+    parser.add_argument("--interaksi", type=int, default=10, help="interaksi widget per sesi")
+    parser.add_argument("--proses", action="store_true", help="pakai process pool, bukan thread pool")
+    parser.add_argument("--timeout", type=float, default=30.0, help="batas waktu per rerun (detik)")
+    args = parser.parse_args(argv)
+
+    daftar = list(SKENARIO) if args.skenario == "semua" else [args.skenario]
+    for skenario in daftar:
+        r = uji_beban(skenario, args.sesi, args.interaksi, args.proses, args.timeout)
+        print(f"{r['skenario']:14s} sesi={r['sesi']:<3d} rerun={r['rerun']:<5d} "
+              f"p50={r['p50_ms']:7.1f} ms  p95={r['p95_ms']:7.1f} ms  p99={r['p99_ms']:7.1f} ms  "
+              f"throughput={r['throughput']:6.1f}/s  memori +{r['pertumbuhan_memori_mb']:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
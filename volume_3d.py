@@ -0,0 +1,49 @@
+"""Evaluasi volume f(x, y, z) dan irisan 2D pada sumbu mana pun.
+
+Volume dievaluasi sekali (per blok bidang x agar array sementara tetap kecil)
+ke array float32 berindeks V[i_x, i_y, i_z]. Irisan hanyalah pengindeksan
+(view) ke array tersebut, jadi menggeser slider irisan tidak menghitung ulang f.
+"""
+import numpy as np
+
+SUMBU = ("x", "y", "z")
+BIDANG_PER_BLOK = 16
+
+
+def evaluasi_volume(f_np, batas, resolusi):
+    """Isi volume float32 (resolusi³) dengan f di grid seragam; kembalikan (sumbu, V)."""
+    sumbu = tuple(np.linspace(a, b, resolusi) for a, b in batas)
+    xs, ys, zs = sumbu
+    V = np.empty((resolusi, resolusi, resolusi), dtype=np.float32)
+    with np.errstate(all="ignore"):
+        for i in range(0, resolusi, BIDANG_PER_BLOK):
+            # Broadcasting (blok, 1, 1) x (1, n, 1) x (1, 1, n) tanpa meshgrid 3D penuh
+            V[i:i + BIDANG_PER_BLOK] = f_np(xs[i:i + BIDANG_PER_BLOK, None, None], ys[None, :, None], zs[None, None, :])
+    return sumbu, V
+
+
+def irisan(V, sumbu, poros, indeks):
+    """Irisan 2D di sumbu `poros` pada indeks tertentu.
+
+    Mengembalikan (nama_h, nilai_h, nama_v, nilai_v, Z) dengan Z berbentuk
+    (len(nilai_v), len(nilai_h)) siap untuk `imshow(origin="lower")`; Z berupa view.
+    """
+    k = SUMBU.index(poros)
+    h, v = [i for i in range(3) if i != k]
+    pemilih = [slice(None)] * 3
+    pemilih[k] = indeks
+    # Setelah sumbu k dibuang, sisa sumbu berurutan (h, v); transpos agar baris = sumbu vertikal
+    Z = V[tuple(pemilih)].T
+    return SUMBU[h], sumbu[h], SUMBU[v], sumbu[v], Z
+
+
+def indeks_terdekat(nilai_sumbu, nilai):
+    return int(np.abs(nilai_sumbu - nilai).argmin())
+
+
+def rentang_nilai(V):
+    """(min, max) nilai terhingga di volume, untuk skala warna yang sama di semua irisan."""
+    terhingga = V[np.isfinite(V)]
+    if terhingga.size == 0:
+        return 0.0, 1.0
+    return float(terhingga.min()), float(terhingga.max())